@@ -0,0 +1,2 @@
+from . import cases
+__all__ = ['cases']
@@ -0,0 +1,94 @@
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from .cases import CASES, parameter_grid
+
+def measure(fn, params: dict, seed: int, repeat: int) -> dict:
+	# time and memory are taken from separate runs, since tracing
+	# allocations slows the code under test down considerably
+	seconds = list()
+	for i in range(repeat):
+		random.seed(seed)
+		work, units = fn(**params)
+		start = time.perf_counter()
+		work()
+		seconds.append(time.perf_counter() - start)
+
+	random.seed(seed)
+	work, units = fn(**params)
+	tracemalloc.start()
+	work()
+	peak = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+
+	best = min(seconds)
+	return {
+		'seconds': best,
+		'units': units,
+		'units_per_second': units / best if best else None,
+		'peak_bytes': peak,
+	}
+
+def key(result: dict) -> str:
+	return result['case'] + json.dumps(result['params'], sort_keys=True)
+
+def compare(results: list[dict], baseline: list[dict], tolerance: float) -> list[str]:
+	baseline = { key(result): result for result in baseline }
+	regressions = list()
+	for result in results:
+		old = baseline.get(key(result))
+		if old is None:
+			continue
+		for metric in ('seconds', 'peak_bytes'):
+			if old[metric] and result[metric] > old[metric]*(1+tolerance):
+				regressions.append(
+					f'{key(result)} {metric}: {old[metric]:.6g} -> {result[metric]:.6g}'
+				)
+	return regressions
+
+def main(argv: list[str]=None) -> int:
+	parser = argparse.ArgumentParser(prog='python3 -m benchmarks')
+	parser.add_argument('--cases', default=','.join(CASES))
+	parser.add_argument('--n', default='200,1000')
+	parser.add_argument('--density', default='0.005,0.05')
+	parser.add_argument('--rounds', default='5')
+	parser.add_argument('--processes', default='1,2')
+	parser.add_argument('--seed', type=int, default=0)
+	parser.add_argument('--repeat', type=int, default=3)
+	parser.add_argument('--output', default='benchmarks/results.json')
+	parser.add_argument('--baseline', default=None)
+	parser.add_argument('--tolerance', type=float, default=0.25)
+	args = parser.parse_args(argv)
+
+	values = {
+		'n': [ int(x) for x in args.n.split(',') ],
+		'density': [ float(x) for x in args.density.split(',') ],
+		'rounds': [ int(x) for x in args.rounds.split(',') ],
+		'processes': [ int(x) for x in args.processes.split(',') ],
+	}
+
+	results = list()
+	for name in args.cases.split(','):
+		fn, axes = CASES[name]
+		for params in parameter_grid(axes, values):
+			result = { 'case': name, 'params': params, 'seed': args.seed }
+			result.update(measure(fn, params, args.seed, args.repeat))
+			results.append(result)
+			print(f'{name} {params}: {result["seconds"]:.4f}s, peak {result["peak_bytes"]} B')
+
+	with open(args.output, 'w') as f:
+		json.dump(results, f, indent=1)
+
+	if args.baseline is not None:
+		with open(args.baseline) as f:
+			regressions = compare(results, json.load(f), args.tolerance)
+		for regression in regressions:
+			print('REGRESSION', regression)
+		return 1 if regressions else 0
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
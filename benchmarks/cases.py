@@ -0,0 +1,65 @@
+from .context import models
+DirectedGraph = models.graph.DirectedGraph
+Graph = models.graph.Graph
+Agent = models.Agent
+AgentNetwork = models.AgentNetwork
+import itertools
+
+# each case takes its parameters, does any setup, and returns the work to
+# be timed along with how many units (rounds, edges, ...) that work covers
+CASES = dict()
+
+def case(name: str, *axes: str):
+	def register(fn):
+		CASES[name] = (fn, axes)
+		return fn
+	return register
+
+def parameter_grid(axes: tuple[str], values: dict[str, list]) -> list[dict]:
+	return [
+		dict(zip(axes, combination))
+		for combination in itertools.product(*(values[axis] for axis in axes))
+	]
+
+@case('DirectedGraph.random_graph', 'n', 'density')
+def random_graph(n: int, density: float):
+	num_edges = round(DirectedGraph.max_edges_for_n_nodes(n)*density)
+	return (lambda: DirectedGraph.random_graph(range(n), num_edges)), num_edges
+
+@case('Graph.connected_subgraphs', 'n', 'density')
+def connected_subgraphs(n: int, density: float):
+	g = Graph.random_graph(range(n), round(Graph.max_edges_for_n_nodes(n)*density))
+	return g.connected_subgraphs, n
+
+@case('Graph.merge_subgraphs', 'n', 'density')
+def merge_subgraphs(n: int, density: float):
+	g = Graph.random_graph(range(n), round(Graph.max_edges_for_n_nodes(n)*density))
+	return g.merge_subgraphs, n
+
+@case('generators.barabasi_albert', 'n')
+def barabasi_albert(n: int):
+	return (lambda: models.graph.generators.barabasi_albert(range(n), 3)), n
+
+@case('AgentNetwork.__init__', 'n', 'density')
+def agent_network(n: int, density: float):
+	agents = [ Agent(1) for i in range(n) ]
+	return (lambda: AgentNetwork(agents, density, density)), n
+
+@case('NamingGame.run', 'n', 'rounds')
+def naming_game(n: int, rounds: int):
+	game = models.NamingGame(n)
+	return (lambda: [ game.run() for i in range(rounds) ]), rounds
+
+@case('VectorNamingGame.run', 'n', 'rounds')
+def vector_naming_game(n: int, rounds: int):
+	game = models.VectorNamingGame(n)
+	return (lambda: [ game.run() for i in range(rounds) ]), rounds
+
+@case('ParallelNamingGame.run', 'n', 'rounds', 'processes')
+def parallel_naming_game(n: int, rounds: int, processes: int):
+	# the same rounds split between processes; compare processes=1 with more
+	# to see how the game scales with cores
+	game = models.ParallelNamingGame(n, processes=processes)
+	return (lambda: [ game.run() for i in range(rounds) ]), rounds
+
+__all__ = ['CASES', 'case', 'parameter_grid']
@@ -1,24 +1,74 @@
 import random
 from . import nouns
+from .rng import stream
 
 class Agent:
-	def __init__(self, n: int):
-		self.words = [ nouns.random_noun() for i in range(random.randint(1, n)) ]
+	__slots__ = ('word_ids', '_word_set', 'index')
+
+	def __init__(self, n: int, rng: random.Random=None):
+		# inventories hold vocabulary ids, each at most once; the list gives
+		# draws something to index and the set makes hear() O(1)
+		rng = stream(rng)
+		self.word_ids: list[int] = list(dict.fromkeys(
+			nouns.random_noun_id(rng) for i in range(rng.randint(1, n))
+		))
+		self._word_set: set[int] = set(self.word_ids)
+		self.index = None
+
+	@classmethod
+	def from_word_ids(cls, word_ids: list[int]):
+		agent = cls.__new__(cls)
+		agent.word_ids = list(word_ids)
+		agent._word_set = set(agent.word_ids)
+		agent.index = None
+		return agent
+
+	@property
+	def words(self) -> list[str]:
+		return [ nouns.vocabulary.word(word_id) for word_id in self.word_ids ]
 
 	def __str__(self) -> str:
 		return ('<#Agent ['+', '.join(self.words)+']>') 
+
+	def attach(self, index) -> None:
+		# keep a WordIndex up to date as this agent's inventory changes
+		self.index = index
+		index.update(self.word_ids)
+
+	def detach(self) -> None:
+		# take this agent's words back out of its WordIndex
+		if self.index is not None:
+			for word_id in self.word_ids:
+				self.index.remove(word_id)
+		self.index = None
+
+	def __collapse(self, word_id: int) -> None:
+		if self.index is not None:
+			self.index.collapse(self.word_ids, word_id)
+		self.word_ids = [ word_id ]
+		self._word_set = { word_id }
 	
-	def hear(self, s: str) -> bool:
-		if s in self.words:
-			self.words = [ s ]
+	def hear(self, word_id: int) -> bool:
+		if isinstance(word_id, str):
+			word_id = nouns.vocabulary.intern(word_id)
+		if word_id in self._word_set:
+			self.__collapse(word_id)
 			return True
 		else:
-			self.words.append(s)
+			self.word_ids.append(word_id)
+			self._word_set.add(word_id)
+			if self.index is not None:
+				self.index.add(word_id)
 			return False
 
-	def tell(self, agent: object) -> None:
-		s = random.choice(self.words)
-		if agent.hear(s):
-			self.words = [ s ]
+	def tell(self, agent: object, u: float=None, rng: random.Random=None) -> None:
+		# u, if given, is a uniform draw in [0, 1) that picks the word;
+		# otherwise it's drawn from rng
+		word_ids = self.word_ids
+		if u is None:
+			u = stream(rng).random()
+		word_id = word_ids[int(u*len(word_ids))]
+		if agent.hear(word_id):
+			self.__collapse(word_id)
 
 __all__ = ['Agent']
\ No newline at end of file
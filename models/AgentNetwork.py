@@ -1,33 +1,264 @@
 from .Agent import Agent
-from .graph import Graph
+from .graph import Graph, CSRGraph, DynamicAdjacency, generators
+from .rng import stream
 import random
+import typing
 
 class AgentNetwork:
+	# networks with more agents than this print a summary when str()'d
+	FULL_RENDER_LIMIT = 32
+
 	def __str__(self):
+		if len(self.agents) > self.FULL_RENDER_LIMIT:
+			return '\n'.join(self.render(stop=0, sample=0))
 		return (''+
 			'====== Adjacencies: ======\n'+
 			str(self._graph)+'\n'+ 
 			'========= Agents: ========\n'+
 			'\n'.join([str(agent) for agent in self.agents])
 		)
-	def __init__(self, agents: list[Agent], min_edge_coeff: float, max_edge_coeff: float):
+	def __init__(
+		self,
+		agents: list[Agent],
+		min_edge_coeff: float,
+		max_edge_coeff: float,
+		dynamic: bool=False,
+		rng: random.Random=None,
+	):
 		self.agents = agents
+		self.rng = stream(rng)
 		max_edges = Graph.max_edges_for_n_nodes(len(agents))
-		target_edges = round(max_edges*random.uniform(min_edge_coeff, max_edge_coeff))
+		target_edges = round(max_edges*self.rng.uniform(min_edge_coeff, max_edge_coeff))
 
 		# construct a random graph with approximately target_edges
 		self._graph = Graph.random_graph(
 			agents,
-			target_edges
+			target_edges,
+			rng=self.rng,
 		)
 
 		# add the minimum number of edges to make a connected graph
-		self._graph.merge_subgraphs()
+		self._graph.merge_subgraphs(self.rng)
+		self.__index(dynamic)
+
+	def __index(self, dynamic: bool) -> None:
+		if dynamic:
+			# the topology may change between rounds: neighbor lists that can
+			# be edited in place, and where each agent sits in self.agents
+			self._neighbors = None
+			self._adjacency = DynamicAdjacency.from_graph(self._graph, self.agents)
+			self._positions = { agent: i for i, agent in enumerate(self.agents) }
+		else:
+			# neighbor lookups index into flat arrays built once, in agent order
+			self._neighbors = CSRGraph.from_graph(self._graph, self.agents)
+			self._adjacency = None
+
+	@classmethod
+	def from_graph(cls, agents: list[Agent], graph: Graph, dynamic: bool=False, rng: random.Random=None):
+		# wrap an existing topology over agents as-is, without adding edges
+		network = cls.__new__(cls)
+		network.agents = agents
+		network.rng = stream(rng)
+		network._graph = graph
+		network.__index(dynamic)
+		return network
+
+	@classmethod
+	def generate(
+		cls,
+		agents: list[Agent],
+		generator: typing.Union[str, typing.Callable],
+		dynamic: bool=False,
+		rng: random.Random=None,
+		**params,
+	):
+		# build a structured topology straight over the agents, by name
+		# ('watts_strogatz', 'barabasi_albert', 'ring_lattice') or as any
+		# callable taking the agents, params and rng and returning a Graph
+		# (ring_lattice, which draws nothing, isn't given the rng).
+		# Watts-Strogatz rewiring can leave the graph in pieces, so those
+		# are joined up as in __init__
+		if isinstance(generator, str):
+			if generator not in generators.GENERATORS:
+				raise ValueError(f'unknown generator {generator!r}')
+			generator = generators.GENERATORS[generator]
+		rng = stream(rng)
+		if generator in generators.DETERMINISTIC:
+			graph = generator(agents, **params)
+		else:
+			graph = generator(agents, rng=rng, **params)
+		graph.merge_subgraphs(rng)
+		return cls.from_graph(agents, graph, dynamic, rng)
+
+	@classmethod
+	def from_topology(cls, agents: list[Agent], topology: Graph, dynamic: bool=False, rng: random.Random=None):
+		# place agents on a loaded topology, the i-th agent taking the
+		# place of the topology's i-th node
+		if len(agents) != topology.num_nodes():
+			raise ValueError(
+				f'topology has {topology.num_nodes()} nodes but there are {len(agents)} agents'
+			)
+		placement = dict(zip(topology.nodes, agents))
+		graph = Graph(agents)
+		for node in topology.nodes:
+			for adjacent in topology.edges[node]:
+				graph.add_edge(placement[node], placement[adjacent])
+		return cls.from_graph(agents, graph, dynamic, rng)
+
+	@property
+	def dynamic(self) -> bool:
+		return self._adjacency is not None
+
+	def csr(self) -> CSRGraph:
+		# the current topology as flat arrays in agent order
+		if self._neighbors is not None:
+			return self._neighbors
+		return CSRGraph.from_graph(self._graph, self.agents)
+
+	def neighbor_positions(self, i: int) -> list[int]:
+		if self._neighbors is not None:
+			neighbors = self._neighbors
+			return neighbors.neighbors[neighbors.offsets[i]:neighbors.offsets[i+1]].tolist()
+		positions = self._positions
+		return sorted(positions[agent] for agent in self._adjacency.neighbors[self.agents[i]])
+
+	def render(self, start: int=0, stop: int=None, sample: int=10) -> typing.Iterator[str]:
+		# a summary, the neighbors (by agent position) of the agents at
+		# positions start..stop-1, then the inventories of `sample` randomly
+		# chosen agents. lines are produced lazily, one at a time
+		num_agents = len(self.agents)
+		stop = num_agents if stop is None else min(stop, num_agents)
+
+		yield f'<#AgentNetwork agents={num_agents}>'
+		yield '====== Adjacencies: ======'
+		yield self._graph.summary()
+		for i in range(start, stop):
+			yield f'{i}: '+' '.join(str(j) for j in self.neighbor_positions(i))
+
+		if sample:
+			yield '========= Agents: ========'
+			for i in sorted(self.rng.sample(range(num_agents), min(sample, num_agents))):
+				yield f'{i}: {self.agents[i]}'
+
+	# u, if given, is the uniform draw in [0, 1) that picks the neighbor;
+	# otherwise it comes from self.rng
 
-	def random_neighbor(self, agent) -> Agent:
-		return random.choice(self._graph.adjacent_nodes(agent))
+	def random_neighbor(self, agent, u: float=None) -> Agent:
+		if u is None:
+			u = self.rng.random()
+		if self._neighbors is None:
+			return self._adjacency.random_neighbor(agent, u)
+		return self._neighbors.random_neighbor(agent, u)
+
+	def random_neighbor_index(self, i: int, u: float=None) -> int:
+		if u is None:
+			u = self.rng.random()
+		if self._neighbors is None:
+			return self._positions[self._adjacency.random_neighbor(self.agents[i], u)]
+		return self._neighbors.random_neighbor_index(i, u)
+
+	def degree(self, i: int) -> int:
+		if self._neighbors is None:
+			return self._adjacency.degree(self.agents[i])
+		return self._neighbors.degree(i)
 	
 	def random_agent(self) -> Agent:
-		return random.choice(self.agents)
+		return self.rng.choice(self.agents)
+
+	# changing the topology. these need a network built with dynamic=True.
+	# the edge changes themselves are O(1), but every edge that goes away is
+	# followed by a connectivity check between its ends (one per former
+	# neighbor when an agent leaves). that check is a search, not an
+	# incremental structure: it stops as soon as searches from both ends
+	# meet, which on a well-connected network is usually within a few
+	# steps, but it can walk O(n) of the network when the detour between
+	# the ends is long. the network stays connected throughout: whenever a
+	# piece splits off, it's joined back on by an edge to a random agent
+	# outside it
+
+	def __require_dynamic(self) -> None:
+		if self._adjacency is None:
+			raise ValueError('network is static; build it with dynamic=True to change it')
+
+	def __link(self, agent1: Agent, agent2: Agent) -> None:
+		if self._adjacency.add_edge(agent1, agent2):
+			self._graph.add_edge(agent1, agent2)
+
+	def __unlink(self, agent1: Agent, agent2: Agent) -> None:
+		if self._adjacency.remove_edge(agent1, agent2):
+			self._graph.remove_edge(agent1, agent2)
+
+	def __reconnect(self, agent1: Agent, agent2: Agent) -> None:
+		agents = self.agents
+		rng = self.rng
+		while True:
+			connected, piece = self._adjacency.connected(agent1, agent2)
+			if connected:
+				return
+			members = set(piece)
+			outside = rng.choice(agents)
+			while outside in members:
+				outside = rng.choice(agents)
+			self.__link(rng.choice(piece), outside)
+
+	def __stranger(self, agent: Agent) -> Agent:
+		# a random agent that isn't agent or one of its neighbors
+		if self._adjacency.degree(agent) >= len(self.agents)-1:
+			raise ValueError('agent is already adjacent to every other agent')
+		neighbors = self._adjacency.positions[agent]
+		while True:
+			other = self.rng.choice(self.agents)
+			if other is not agent and other not in neighbors:
+				return other
+
+	def rewire(self, agent: Agent, old: Agent, new: Agent=None) -> Agent:
+		# move the edge agent-old to agent-new, a random non-neighbor by
+		# default; returns new
+		self.__require_dynamic()
+		if not self._adjacency.has_edge(agent, old):
+			raise ValueError('agents are not neighbors')
+		if new is None:
+			new = self.__stranger(agent)
+		elif new is agent or self._adjacency.has_edge(agent, new):
+			raise ValueError('agents are already neighbors')
+		self.__link(agent, new)
+		self.__unlink(agent, old)
+		self.__reconnect(agent, old)
+		return new
+
+	def add_agent(self, agent: Agent, k: int=1) -> None:
+		# the agent joins at the end of self.agents, adjacent to k distinct
+		# random agents (or all of them, if there are fewer)
+		self.__require_dynamic()
+		if agent in self._positions:
+			raise ValueError('agent is already in the network')
+		if k < 1 and self.agents:
+			raise ValueError('a new agent needs at least one neighbor to keep the network connected')
+		neighbors = self.rng.sample(self.agents, min(k, len(self.agents)))
+		self._positions[agent] = len(self.agents)
+		self.agents.append(agent)
+		self._graph.add_node(agent)
+		self._adjacency.add_node(agent)
+		for neighbor in neighbors:
+			self.__link(agent, neighbor)
+
+	def remove_agent(self, agent: Agent) -> None:
+		# the last agent in self.agents moves into the leaving agent's
+		# position
+		self.__require_dynamic()
+		if agent not in self._positions:
+			raise ValueError('agent is not in the network')
+		i = self._positions.pop(agent)
+		last = self.agents.pop()
+		if last is not agent:
+			self.agents[i] = last
+			self._positions[last] = i
+
+		neighbors = self._adjacency.remove_node(agent)
+		self._graph.remove_node(agent)
+		# the former neighbors were connected through agent; make sure
+		# they still are
+		for neighbor in neighbors[1:]:
+			self.__reconnect(neighbors[0], neighbor)
 	
 __all__ = [ 'AgentNetwork' ]
\ No newline at end of file
@@ -0,0 +1,228 @@
+import random
+import typing
+from array import array
+from . import nouns
+from .rng import stream
+
+class AgentPopulation:
+	# struct-of-arrays storage for a whole population. every inventory lives
+	# in one shared arena of word ids: agent i owns the slots
+	# arena[start[i]:start[i]+capacity[i]], of which the first length[i]
+	# are in use. an inventory that outgrows its slots moves to the end of
+	# the arena, and the arena is compacted once most of it is abandoned.
+	# inventories longer than SET_LENGTH also keep a set of their words, so
+	# hear() doesn't scan them
+	TYPECODE = 'i'
+	SET_LENGTH = 8
+
+	def __init__(self, inventories: typing.Iterable[typing.Iterable[int]]):
+		self.arena = array(self.TYPECODE)
+		self.start = array('q')
+		self.length = array('l')
+		self.capacity = array('l')
+		self.garbage = 0
+		self.index = None
+		self.sets: dict[int, set[int]] = dict()
+		for words in inventories:
+			words = array(self.TYPECODE, words)
+			self.start.append(len(self.arena))
+			self.length.append(len(words))
+			self.capacity.append(len(words))
+			self.arena.extend(words)
+			if len(words) > self.SET_LENGTH:
+				self.sets[len(self.start)-1] = set(words)
+
+	@classmethod
+	def random(cls, n: int, rng: random.Random=None):
+		# starting inventories drawn like Agent(n)'s
+		rng = stream(rng)
+		return cls(
+			dict.fromkeys(rng.choices(nouns.noun_ids, k=rng.randint(1, n)))
+			for i in range(n)
+		)
+
+	def __len__(self) -> int:
+		return len(self.start)
+
+	def __getitem__(self, i: int):
+		if not 0 <= i < len(self.start):
+			raise IndexError('agent index out of range')
+		return AgentView(self, i)
+
+	def __iter__(self):
+		return (AgentView(self, i) for i in range(len(self.start)))
+
+	def attach(self, index) -> None:
+		self.index = index
+		for i in range(len(self.start)):
+			index.update(self.words(i))
+
+	def words(self, i: int) -> list[int]:
+		start = self.start[i]
+		return self.arena[start:start+self.length[i]].tolist()
+
+	def random_word(self, i: int, u: float=None, rng: 'random.Random'=None) -> int:
+		# u, if given, is the uniform draw in [0, 1) that picks the word;
+		# otherwise it's drawn from rng
+		if u is None:
+			u = stream(rng).random()
+		return self.arena[self.start[i] + int(u*self.length[i])]
+
+	def contains(self, i: int, word_id: int) -> bool:
+		word_set = self.sets.get(i)
+		if word_set is not None:
+			return word_id in word_set
+		start = self.start[i]
+		try:
+			self.arena.index(word_id, start, start+self.length[i])
+			return True
+		except ValueError:
+			return False
+
+	def collapse(self, i: int, word_id: int) -> None:
+		if self.index is not None:
+			self.index.collapse(self.words(i), word_id)
+		self.arena[self.start[i]] = word_id
+		self.length[i] = 1
+		self.sets.pop(i, None)
+
+	def extend(self, i: int, word_id: int) -> None:
+		length = self.length[i]
+		if length == self.capacity[i]:
+			self.__relocate(i, 2*length or 1)
+		self.arena[self.start[i]+length] = word_id
+		self.length[i] = length+1
+		if i in self.sets:
+			self.sets[i].add(word_id)
+		elif length+1 > self.SET_LENGTH:
+			self.sets[i] = set(self.words(i))
+		if self.index is not None:
+			self.index.add(word_id)
+
+	def __relocate(self, i: int, capacity: int) -> None:
+		if self.garbage + self.capacity[i] > len(self.arena) // 2:
+			self.compact()
+		arena = self.arena
+		start = self.start[i]
+		length = self.length[i]
+		self.garbage += self.capacity[i]
+		self.start[i] = len(arena)
+		self.capacity[i] = capacity
+		arena.extend(arena[start:start+length])
+		arena.frombytes(bytes(arena.itemsize*(capacity-length)))
+
+	def compact(self) -> None:
+		arena = array(self.TYPECODE)
+		for i in range(len(self.start)):
+			start = self.start[i]
+			self.start[i] = len(arena)
+			self.capacity[i] = self.length[i]
+			arena.extend(self.arena[start:start+self.length[i]])
+		self.arena = arena
+		self.garbage = 0
+
+	def hear(self, i: int, word_id: int) -> bool:
+		if self.contains(i, word_id):
+			self.collapse(i, word_id)
+			return True
+		self.extend(i, word_id)
+		return False
+
+	def tell(self, speaker: int, hearer: int, u: float=None, rng: 'random.Random'=None) -> None:
+		word_id = self.random_word(speaker, u, rng)
+		if self.hear(hearer, word_id):
+			self.collapse(speaker, word_id)
+
+	def play(self, hearers: typing.Sequence[int], draws: typing.Sequence[float]) -> tuple[int, int]:
+		# every agent in order tells hearers[i] the word draws[i] picks: the
+		# same interactions as calling tell() for each, with the arrays held
+		# in locals. the index is told each word's net change once, at the
+		# end, rather than about every word moved along the way. returns how
+		# many interactions succeeded, and the speakers' inventory lengths
+		# summed as they spoke
+		arena = self.arena
+		start, length, capacity = self.start, self.length, self.capacity
+		sets = self.sets
+		changes: dict[int, int] = dict()
+		get = changes.get
+		successes = spoken = 0
+		for speaker, hearer, u in zip(range(len(start)), hearers, draws):
+			k = length[speaker]
+			spoken += k
+			word_id = arena[start[speaker] + int(u*k)]
+			begin = start[hearer]
+			k = length[hearer]
+			word_set = sets.get(hearer)
+			if word_id in (arena[begin:begin+k] if word_set is None else word_set):
+				for i in (hearer, speaker):
+					begin = start[i]
+					for old in arena[begin:begin+length[i]]:
+						changes[old] = get(old, 0) - 1
+					arena[begin] = word_id
+					length[i] = 1
+					sets.pop(i, None)
+				changes[word_id] = get(word_id, 0) + 2
+				successes+=1
+				continue
+
+			if k == capacity[hearer]:
+				self.__relocate(hearer, 2*k or 1)
+				# compacting replaces the arena
+				arena = self.arena
+			arena[start[hearer]+k] = word_id
+			length[hearer] = k+1
+			if word_set is not None:
+				word_set.add(word_id)
+			elif k+1 > self.SET_LENGTH:
+				sets[hearer] = set(self.words(hearer))
+			changes[word_id] = get(word_id, 0) + 1
+
+		if self.index is not None:
+			self.index.apply(changes)
+		return successes, spoken
+
+class AgentView:
+	# a stand-in for Agent that reads and writes one row of a population.
+	# views are cheap to make and compare equal by position, so they can be
+	# used as graph nodes in an AgentNetwork
+	__slots__ = ('population', 'i')
+
+	def __init__(self, population: AgentPopulation, i: int):
+		self.population = population
+		self.i = i
+
+	def __eq__(self, other) -> bool:
+		return (
+			isinstance(other, AgentView) and
+			other.population is self.population and
+			other.i == self.i
+		)
+
+	def __hash__(self) -> int:
+		return hash((id(self.population), self.i))
+
+	@property
+	def word_ids(self) -> list[int]:
+		return self.population.words(self.i)
+
+	@property
+	def words(self) -> list[str]:
+		return [ nouns.vocabulary.word(word_id) for word_id in self.word_ids ]
+
+	def __str__(self) -> str:
+		return ('<#Agent ['+', '.join(self.words)+']>')
+
+	def hear(self, word_id: int) -> bool:
+		if isinstance(word_id, str):
+			word_id = nouns.vocabulary.intern(word_id)
+		return self.population.hear(self.i, word_id)
+
+	def tell(self, agent: object, u: float=None, rng: random.Random=None) -> None:
+		if isinstance(agent, AgentView) and agent.population is self.population:
+			self.population.tell(self.i, agent.i, u, rng)
+			return
+		word_id = self.population.random_word(self.i, u, rng)
+		if agent.hear(word_id):
+			self.population.collapse(self.i, word_id)
+
+__all__ = ['AgentPopulation', 'AgentView']
@@ -0,0 +1,93 @@
+import abc
+import typing
+from . import nouns
+from . import stopping
+from .Observation import Observation
+
+class IndexedGame(abc.ABC):
+	# what every game shares: its words are counted in a WordIndex,
+	# self.index, so polling for consensus and taking observations never
+	# look at the agents. subclasses keep self.iteration and provide run(),
+	# num_agents() and snapshot()
+	@abc.abstractmethod
+	def run(self) -> None:
+		pass
+
+	@abc.abstractmethod
+	def num_agents(self) -> int:
+		pass
+
+	@abc.abstractmethod
+	def snapshot(self) -> list[list[str]]:
+		pass
+
+	def poll(self) -> bool:
+		# agents that haven't been built yet still hold words of their own,
+		# so there's no consensus until everyone has played
+		return self.index.consensus() and not self.pending()
+
+	def pending(self) -> int:
+		# how many agents haven't been built yet; the index, and so
+		# num_words() and the observations, only count agents that have
+		return 0
+
+	def num_words(self) -> int:
+		return self.index.num_words()
+
+	def dominant_word(self) -> str:
+		word_id = self.index.dominant_word()
+		return None if word_id is None else nouns.vocabulary.word(word_id)
+
+	def observation(self, snapshot: bool=False) -> Observation:
+		num_agents = self.num_agents()
+		return Observation(
+			self.iteration,
+			self.index.num_words(),
+			self.index.total,
+			self.index.dominant_count() / num_agents if num_agents else 0.0,
+			self.snapshot() if snapshot else None
+		)
+
+	def observe(
+		self,
+		interval: int=1,
+		snapshots: bool=False,
+		max_iterations: int=None,
+		until=None,
+	) -> typing.Iterator[Observation]:
+		# the game only advances when the consumer asks for the next
+		# observation; the first and final states are always reported. until
+		# is a stopping criterion (or several), checked after every
+		# iteration whatever the interval, that ends the game early
+		until = stopping.criterion(until)
+		if until is not None:
+			until.reset()
+		observation = self.observation(snapshots)
+		yield observation
+		if until is not None and until(observation):
+			return
+		while not self.poll():
+			if max_iterations is not None and self.iteration >= max_iterations:
+				return
+			self.run()
+			observation = self.observation()
+			stopped = until is not None and until(observation)
+			if stopped or self.iteration % interval == 0 or self.poll():
+				if snapshots:
+					observation = observation._replace(snapshot=self.snapshot())
+				yield observation
+			if stopped:
+				return
+	
+	def execute(
+		self,
+		observer: typing.Callable[[Observation], None]=print,
+		interval: int=1,
+		snapshots: bool=False,
+		until=None,
+	):
+		for observation in self.observe(interval, snapshots, until=until):
+			if observer is not None:
+				observer(observation)
+
+__all__ = ['IndexedGame']
@@ -0,0 +1,54 @@
+import typing
+from .Agent import Agent
+from .rng import RandomStream
+
+class LazyAgents:
+	# a game's agents, built on first use. agent i's starting inventory is
+	# drawn from a stream derived from (seed, i), so it is the same whenever
+	# and in whatever order the agents are first touched, and a game with
+	# millions of agents starts at once and only holds the ones that have
+	# actually played
+	def __init__(self, n: int, max_words: int, seed: int):
+		self.n = n
+		self.max_words = max_words
+		self.seed = seed
+		self.streams = RandomStream(seed)
+		self.materialized: dict[int, Agent] = dict()
+		self.index = None
+
+	def __str__(self) -> str:
+		return f'<#LazyAgents n={self.n} materialized={len(self.materialized)}>'
+
+	def __len__(self) -> int:
+		return self.n
+
+	def __getitem__(self, i: int) -> Agent:
+		agent = self.materialized.get(i)
+		if agent is not None:
+			return agent
+		if i < 0:
+			return self[i+self.n]
+		if i >= self.n:
+			raise IndexError('agent index out of range')
+		agent = Agent(self.max_words, self.streams.spawn(i))
+		if self.index is not None:
+			agent.attach(self.index)
+		self.materialized[i] = agent
+		return agent
+
+	def __iter__(self) -> typing.Iterator[Agent]:
+		# builds every agent, in order
+		return (self[i] for i in range(self.n))
+
+	@property
+	def pending(self) -> int:
+		# how many agents haven't been built yet
+		return self.n - len(self.materialized)
+
+	def attach(self, index) -> None:
+		# the index only ever counts agents that have been built
+		self.index = index
+		for agent in self.materialized.values():
+			agent.attach(index)
+
+__all__ = ['LazyAgents']
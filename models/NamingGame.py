@@ -1,31 +1,82 @@
 import random 
 from . import Agent
+from .LazyAgents import LazyAgents
+from . import rng as rngs
+from .WordIndex import WordIndex
+from .IndexedGame import IndexedGame
+from .schedulers import SynchronousSweep
 
-class NamingGame:
-	def __init__(self, n: int):
-		self.agents = [ Agent(n) for i in range(n) ]
-		self.iteration = 0
+class NamingGame(IndexedGame):
+	# any agent can be the hearer, with equal odds; schedulers rely on this
+	uniform_hearers = True
+
+	def __init__(self, n: int, scheduler=None, rng: random.Random=None, lazy: bool=False):
+		# with lazy=True an agent's inventory is only drawn when it first
+		# speaks or hears, from a seed taken from rng and its position
+		rng = rngs.stream(rng)
+		if lazy:
+			agents = LazyAgents(n, n, rng.getrandbits(64))
+		else:
+			agents = [ Agent(n, rng) for i in range(n) ]
+		self._setup(agents, scheduler=scheduler, rng=rng)
+
+	def _setup(self, agents, iteration: int=0, scheduler=None, rng: random.Random=None) -> None:
+		# every draw the game makes comes from self.rng
+		self.rng = rngs.stream(rng)
+		self.agents = agents
+		self.iteration = iteration
+		self.scheduler = SynchronousSweep() if scheduler is None else scheduler
+		self.index = WordIndex()
+		if isinstance(agents, LazyAgents):
+			agents.attach(self.index)
+		else:
+			for agent in self.agents:
+				agent.attach(self.index)
+
+	@classmethod
+	def from_agents(cls, agents, iteration: int=0, scheduler=None, rng: random.Random=None):
+		# resume a game from agents that already hold their inventories
+		game = cls.__new__(cls)
+		game._setup(agents, iteration, scheduler, rng)
+		return game
 
 	def __str__(self) -> str:
 		agents_string = '\n  '.join(str(agent) for agent in self.agents)
 		return f'<#NamingGame {self.iteration} {self.poll()}\n  {agents_string}\n>'
 
 	def run(self) -> None:
-		for agent in self.agents:
-			agent.tell(random.choice(self.agents))
+		self.scheduler.run(self)
 		self.iteration+=1
+
+	def sweep(self) -> None:
+		# every agent speaks once, in order. the round's hearers and word
+		# choices are drawn up front
+		agents = self.agents
+		n = len(agents)
+		hearers = rngs.indices(self.rng, n, n)
+		draws = rngs.uniforms(self.rng, n)
+		for agent, hearer, u in zip(agents, hearers, draws):
+			agent.tell(agents[hearer], u)
+
+	def random_hearer(self, speaker: int) -> int:
+		return self.rng.randrange(len(self.agents))
+
+	def interact(self, speaker: int, hearer: int) -> None:
+		self.agents[speaker].tell(self.agents[hearer], self.rng.random())
+
+	def settled_word(self, i: int):
+		# the word agent i holds if it holds exactly one, otherwise None
+		word_ids = self.agents[i].word_ids
+		return word_ids[0] if len(word_ids) == 1 else None
 	
-	def poll(self) -> bool:
-		all_words = set()
-		for agent in self.agents:
-			for word in agent.words:
-				all_words.add(word)
-		return (len(all_words) == 1)
-	
-	def execute(self):
-		while (not self.poll()):
-			print(self)
-			self.run()
-		print(self)
+	def pending(self) -> int:
+		# only lazy games have agents that haven't been built yet
+		return self.agents.pending if isinstance(self.agents, LazyAgents) else 0
+
+	def num_agents(self) -> int:
+		return len(self.agents)
+
+	def snapshot(self) -> list[list[str]]:
+		return [ list(agent.words) for agent in self.agents ]
 
 __all__ = ["NamingGame"]
\ No newline at end of file
@@ -0,0 +1,63 @@
+import random
+from .Agent import Agent
+from . import rng as rngs
+from .NamingGame import NamingGame
+from .AgentNetwork import AgentNetwork
+
+class NetworkNamingGame(NamingGame):
+	# agents only talk to their neighbors in a random connected AgentNetwork
+	uniform_hearers = False
+
+	def __init__(
+		self,
+		n: int,
+		min_edge_coeff: float,
+		max_edge_coeff: float,
+		scheduler=None,
+		dynamic: bool=False,
+		rng: random.Random=None,
+	):
+		super().__init__(n, scheduler, rng)
+		self.network = AgentNetwork(self.agents, min_edge_coeff, max_edge_coeff, dynamic, self.rng)
+
+	@classmethod
+	def from_network(cls, network: AgentNetwork, iteration: int=0, scheduler=None):
+		# the game draws from the network's stream
+		game = cls.from_agents(network.agents, iteration, scheduler, network.rng)
+		game.network = network
+		return game
+
+	# agents joining and leaving, between iterations, on a dynamic network.
+	# the game and the network share the agents list, so positions shift
+	# the same way in both, and the scheduler is told
+
+	def add_agent(self, agent: Agent, k: int=1) -> None:
+		self.network.add_agent(agent, k)
+		agent.attach(self.index)
+		self.scheduler.added(self, len(self.agents)-1)
+
+	def remove_agent(self, i: int) -> Agent:
+		agent = self.agents[i]
+		self.network.remove_agent(agent)
+		agent.detach()
+		self.scheduler.removed(self, i, len(self.agents))
+		return agent
+
+	def sweep(self) -> None:
+		agents = self.agents
+		network = self.network
+		n = len(agents)
+		# a draw to pick each speaker's hearer and one to pick its word
+		hearer_draws = rngs.uniforms(self.rng, n)
+		word_draws = rngs.uniforms(self.rng, n)
+		for i, agent in enumerate(agents):
+			# only possible for a single agent, which has nobody to talk to
+			if network.degree(i):
+				agent.tell(agents[network.random_neighbor_index(i, hearer_draws[i])], word_draws[i])
+
+	def random_hearer(self, speaker: int) -> int:
+		if not self.network.degree(speaker):
+			return None
+		return self.network.random_neighbor_index(speaker)
+
+__all__ = ['NetworkNamingGame']
@@ -0,0 +1,63 @@
+import queue
+import threading
+import typing
+
+class Observation(typing.NamedTuple):
+	iteration: int
+	num_words: int
+	inventory_size: int
+	dominant_share: float
+	# every agent's words; only filled in when snapshots are asked for
+	snapshot: list[list[str]] = None
+
+	def __str__(self) -> str:
+		return (
+			f'<#Observation {self.iteration} words={self.num_words} '
+			f'size={self.inventory_size} dominant={self.dominant_share:.3f}>'
+		)
+
+class ObservationQueue:
+	# runs a slow observer (say, one writing to disk) on its own thread. the
+	# queue is bounded, so if the observer falls behind the game blocks
+	# instead of buffering observations without limit. if the observer
+	# raises, the thread keeps draining (and dropping) observations so the
+	# game never blocks on it, and the error is raised again, once, from the
+	# next call or from close()
+	def __init__(self, observer: typing.Callable[[Observation], None], maxsize: int=1024):
+		self.observer = observer
+		self.queue = queue.Queue(maxsize)
+		self.error = None
+		self.reported = False
+		self.thread = threading.Thread(target=self.__drain, daemon=True)
+		self.thread.start()
+
+	def __call__(self, observation: Observation) -> None:
+		self.__raise()
+		self.queue.put(observation)
+
+	def __drain(self) -> None:
+		while (observation := self.queue.get()) is not None:
+			if self.error is not None:
+				continue
+			try:
+				self.observer(observation)
+			except BaseException as error:
+				self.error = error
+
+	def __raise(self) -> None:
+		if self.error is not None and not self.reported:
+			self.reported = True
+			raise self.error
+
+	def close(self) -> None:
+		self.queue.put(None)
+		self.thread.join()
+		self.__raise()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+__all__ = ['Observation', 'ObservationQueue']
@@ -0,0 +1,342 @@
+import multiprocessing
+import os
+import typing
+import random
+import weakref
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+from . import nouns
+from . import rng as rngs
+from .AgentPopulation import AgentPopulation
+from .IndexedGame import IndexedGame
+from .NamingGame import NamingGame
+from .WordIndex import WordIndex
+
+# one game played by several processes at once. the population is stored
+# like an AgentPopulation, but in shared memory segments: per-agent start,
+# length and capacity, one arena of word ids, and optionally a network in
+# CSR form. each iteration is n interactions with uniformly drawn
+# speakers, as in SequentialRandom, split into one batch per worker.
+#
+# an interaction locks the stripes (agent % stripes) of both of its agents,
+# lowest first, so it reads and writes the two inventories atomically and
+# the outcome is that of the same interactions played one at a time in some
+# interleaving. played in a single process there's nobody to race, and no
+# locks are taken. an inventory that outgrows its slots moves into the bump
+# region of the batch that grew it, so workers never allocate from the same
+# space. the parent hands out regions and compacts the arena, in parallel,
+# once the free space runs out
+
+TYPECODE = 'q'
+
+def _create(values: array, size: int=None) -> SharedMemory:
+	size = len(values) if size is None else size
+	segment = SharedMemory(create=True, size=max(1, size)*8)
+	view = segment.buf.cast(TYPECODE)
+	view[:len(values)] = values
+	view.release()
+	return segment
+
+# worker side: every process (the parent too, when it plays batches itself)
+# keeps the segments it has attached to, by name, until a task no longer
+# mentions them
+
+_attached: dict[str, tuple[SharedMemory, memoryview]] = dict()
+_locks = None
+
+def _init_worker(locks: list) -> None:
+	global _locks
+	_locks = locks
+
+def _view(name: str) -> memoryview:
+	if name not in _attached:
+		segment = SharedMemory(name)
+		_attached[name] = (segment, segment.buf.cast(TYPECODE))
+	return _attached[name][1]
+
+def _detach(keep: set[str]) -> None:
+	_forget([ name for name in _attached if name not in keep ])
+
+def _forget(names: typing.Iterable[str]) -> None:
+	for name in names:
+		if name in _attached:
+			segment, view = _attached.pop(name)
+			view.release()
+			segment.close()
+
+def _views(names: dict[str, str]) -> dict[str, memoryview]:
+	_detach(set(names.values()))
+	return { key: _view(name) for key, name in names.items() }
+
+def _play(task) -> tuple:
+	# plays up to count interactions, stopping early if an inventory needs to
+	# move and the region [top, limit) is too small. returns how many were
+	# played, the new top, how many interactions succeeded, and the change
+	# in each word's count
+	names, n, count, seed, top, limit = task
+	views = _views(names)
+	start, length, capacity, arena = views['start'], views['length'], views['capacity'], views['arena']
+	offsets, neighbors = views.get('offsets'), views.get('neighbors')
+
+	rng = rngs.RandomStream(seed)
+	speakers = rngs.indices(rng, n, count)
+	hearer_draws = rngs.uniforms(rng, count)
+	word_draws = rngs.uniforms(rng, count)
+	locks = _locks
+	stripes = 1 if locks is None else len(locks)
+	deltas = dict()
+	successes = 0
+
+	for k in range(count):
+		speaker = speakers[k]
+		if offsets is None:
+			hearer = int(hearer_draws[k]*n)
+		else:
+			first = offsets[speaker]
+			degree = offsets[speaker+1] - first
+			if not degree:
+				continue
+			hearer = neighbors[first + int(hearer_draws[k]*degree)]
+
+		if locks is not None:
+			low, high = sorted((speaker % stripes, hearer % stripes))
+			locks[low].acquire()
+			if high != low:
+				locks[high].acquire()
+		try:
+			word = arena[start[speaker] + int(word_draws[k]*length[speaker])]
+			row = start[hearer]
+			size = length[hearer]
+			if word in arena[row:row+size].tolist():
+				successes+=1
+				for agent in ((hearer,) if hearer == speaker else (hearer, speaker)):
+					row = start[agent]
+					for old in arena[row:row+length[agent]].tolist():
+						deltas[old] = deltas.get(old, 0) - 1
+					arena[row] = word
+					length[agent] = 1
+					deltas[word] = deltas.get(word, 0) + 1
+				continue
+
+			if size == capacity[hearer]:
+				grown = 2*size or 1
+				if top + grown > limit:
+					return k, top, successes, deltas
+				arena[top:top+size] = arena[row:row+size]
+				start[hearer] = row = top
+				capacity[hearer] = grown
+				top += grown
+			arena[row+size] = word
+			length[hearer] = size+1
+			deltas[word] = deltas.get(word, 0) + 1
+		finally:
+			if locks is not None:
+				if high != low:
+					locks[high].release()
+				locks[low].release()
+
+	return count, top, successes, deltas
+
+def _compact(task) -> None:
+	# copies the inventories of agents lo..hi-1 into a new arena, packed
+	# from offset on
+	names, lo, hi, offset = task
+	views = _views(names)
+	start, length, capacity = views['start'], views['length'], views['capacity']
+	arena, packed = views['arena'], views['packed']
+	for i in range(lo, hi):
+		row = start[i]
+		size = length[i]
+		packed[offset:offset+size] = arena[row:row+size]
+		start[i] = offset
+		capacity[i] = size
+		offset += size
+
+def _release(pool, segments: dict[str, SharedMemory]) -> None:
+	# stops the workers and frees the shared memory. run by close(), or by
+	# a finalizer if the game is dropped (or the interpreter exits) first
+	if pool is not None:
+		pool.close()
+		pool.join()
+	_forget(segment.name for segment in segments.values())
+	for segment in segments.values():
+		segment.close()
+		segment.unlink()
+	segments.clear()
+
+class ParallelNamingGame(IndexedGame):
+	# supports the IndexedGame interface (run, poll, observe, ...) plus
+	# words(i) and settled_word(i), but not NamingGame's per-agent methods:
+	# there are no agent objects, and interactions are only played in
+	# batches by the workers
+	def __init__(self, n: int, processes: int=None, rng: random.Random=None, stripes: int=256):
+		rng = rngs.stream(rng)
+		population = AgentPopulation.random(n, rng)
+		self._setup_shared(
+			(population.words(i) for i in range(n)), None, 0, processes, rng, stripes
+		)
+
+	@classmethod
+	def from_game(cls, game: NamingGame, processes: int=None, stripes: int=256):
+		# take over a game's agents (and network, if it has one) as they are
+		network = getattr(game, 'network', None)
+		adjacency = None if network is None else network.csr()
+		parallel = cls.__new__(cls)
+		parallel._setup_shared(
+			(agent.word_ids for agent in game.agents), adjacency,
+			game.iteration, processes, game.rng, stripes
+		)
+		return parallel
+
+	def _setup_shared(self, inventories, adjacency, iteration: int, processes: int, rng, stripes: int) -> None:
+		self.iteration = iteration
+		self.rng = rngs.stream(rng)
+		self.uniform_hearers = adjacency is None
+
+		start, length, arena = array(TYPECODE), array(TYPECODE), array(TYPECODE)
+		for words in inventories:
+			start.append(len(arena))
+			length.append(len(words))
+			arena.extend(words)
+		self.n = len(start)
+		self.index = WordIndex(arena)
+		self.successes = 0
+
+		self.processes = os.cpu_count() if processes is None else processes
+		self.region_size = [ max(1024, 4*self.n // self.processes) ] * self.processes
+		self.segments: dict[str, SharedMemory] = dict()
+		self.segments['start'] = _create(start)
+		self.segments['length'] = _create(length)
+		self.segments['capacity'] = _create(length)
+		if adjacency is not None:
+			self.segments['offsets'] = _create(adjacency.offsets)
+			self.segments['neighbors'] = _create(adjacency.neighbors)
+		# the arena has room for every batch's region after the live words,
+		# twice over
+		room = len(arena) + 2*sum(self.region_size)
+		self.segments['arena'] = _create(arena, room)
+		self.arena_size = room
+		self.top = len(arena)
+		self.regions = [ None ] * self.processes
+
+		if self.processes == 1:
+			self.locks = None
+			_init_worker(None)
+			self.pool = None
+		else:
+			self.locks = [ multiprocessing.Lock() for i in range(stripes) ]
+			self.pool = multiprocessing.Pool(self.processes, _init_worker, (self.locks,))
+		# compact() swaps segments in and out of the same dict, so the
+		# finalizer always frees the current ones
+		self.release = weakref.finalize(self, _release, self.pool, self.segments)
+
+	def __names(self) -> dict[str, str]:
+		return { key: segment.name for key, segment in self.segments.items() }
+
+	def __map(self, fn, tasks: list) -> list:
+		if self.pool is None:
+			return list(map(fn, tasks))
+		return self.pool.map(fn, tasks)
+
+	def __assign_regions(self, batches: list[int]) -> None:
+		# fresh regions for the batches that need one, from the free space at
+		# the end of the arena. compacting gives up every region, so if there
+		# isn't room it happens first and then every batch gets a new one
+		needed = [ w for w in batches if self.regions[w] is None ]
+		if self.top + sum(self.region_size[w] for w in needed) > self.arena_size:
+			self.compact()
+			needed = batches
+		for w in needed:
+			size = self.region_size[w]
+			self.regions[w] = [ self.top, self.top+size ]
+			self.top += size
+
+	def compact(self) -> None:
+		# pack every inventory into a new arena, one range of agents per
+		# worker. the old arena's regions are all given up
+		names = self.__names()
+		with self.segments['length'].buf.cast(TYPECODE) as length:
+			bounds = [ self.n*w // self.processes for w in range(self.processes+1) ]
+			sizes = [ sum(length[bounds[w]:bounds[w+1]]) for w in range(self.processes) ]
+		live = sum(sizes)
+		packed = _create(array(TYPECODE), live + 2*sum(self.region_size))
+		names['packed'] = packed.name
+
+		tasks = list()
+		offset = 0
+		for w in range(self.processes):
+			tasks.append((names, bounds[w], bounds[w+1], offset))
+			offset += sizes[w]
+		self.__map(_compact, tasks)
+
+		_forget([ self.segments['arena'].name, packed.name ])
+		old = self.segments['arena']
+		old.close()
+		old.unlink()
+		self.segments['arena'] = packed
+		self.arena_size = packed.size // 8
+		self.top = live
+		self.regions = [ None ] * self.processes
+
+	def run(self) -> None:
+		# n interactions, split evenly between the batches. a batch that runs
+		# out of region is given a new one and carries on in the next phase
+		remaining = [ self.n*(w+1) // self.processes - self.n*w // self.processes for w in range(self.processes) ]
+		while any(remaining):
+			work = [ w for w in range(self.processes) if remaining[w] ]
+			self.__assign_regions(work)
+			names = self.__names()
+			tasks = [
+				(names, self.n, remaining[w], self.rng.getrandbits(64), *self.regions[w])
+				for w in work
+			]
+			# batches ran concurrently, so one batch's changes can only be
+			# applied to the index together with everyone else's
+			changes = dict()
+			for w, (played, top, successes, deltas) in zip(work, self.__map(_play, tasks)):
+				remaining[w] -= played
+				self.regions[w][0] = top
+				self.successes += successes
+				for word, delta in deltas.items():
+					changes[word] = changes.get(word, 0) + delta
+				if remaining[w]:
+					# the rest of this region is too small to use. the batch
+					# gets a new one twice the size, so a game whose
+					# inventories are growing settles on regions that last
+					self.regions[w] = None
+					self.region_size[w] *= 2
+			for word, delta in changes.items():
+				self.index.adjust(word, delta)
+		self.iteration+=1
+
+	def num_agents(self) -> int:
+		return self.n
+
+	def words(self, i: int) -> list[int]:
+		with self.segments['start'].buf.cast(TYPECODE) as start, \
+			self.segments['length'].buf.cast(TYPECODE) as length, \
+			self.segments['arena'].buf.cast(TYPECODE) as arena:
+			return arena[start[i]:start[i]+length[i]].tolist()
+
+	def settled_word(self, i: int):
+		words = self.words(i)
+		return words[0] if len(words) == 1 else None
+
+	def snapshot(self) -> list[list[str]]:
+		return [ [ nouns.vocabulary.word(word_id) for word_id in self.words(i) ] for i in range(self.n) ]
+
+	def __str__(self) -> str:
+		return f'<#ParallelNamingGame {self.iteration} {self.poll()} agents={self.n} processes={self.processes}>'
+
+	def close(self) -> None:
+		# stops the workers and frees the shared memory
+		self.release()
+		self.pool = None
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args) -> None:
+		self.close()
+
+__all__ = ['ParallelNamingGame']
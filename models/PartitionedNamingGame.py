@@ -0,0 +1,307 @@
+import multiprocessing
+import random
+import typing
+import weakref
+from array import array
+from . import nouns
+from . import rng as rngs
+from .Agent import Agent
+from .IndexedGame import IndexedGame
+from .WordIndex import WordIndex
+from .graph import partition as partitioning
+
+# a network game split between workers that each hold one part of the
+# network: the agents it owns, its adjacency, and ghosts for the agents
+# elsewhere that its own are adjacent to. workers are separate processes
+# talking only to the coordinator through pipes, standing in for machines.
+#
+# a round has three steps. every agent speaks once, in order, to a random
+# neighbor; a neighbor in the same part is played at once, while a ghost
+# hearer becomes a request queued for the part that owns it. the queued
+# requests go out in one batch per part and are heard there, and the
+# answers come back in one batch per part, a speaker whose word was known
+# hearing it again (collapsing onto it, or learning it if it has since
+# dropped it). cross-part interactions thus land at the end of the round
+# rather than in speaker order, which is the only way the game differs
+# from NetworkNamingGame.
+#
+# each worker builds its own part with build_part(), from the assignment
+# and an edge source it reads for itself, and holds its own agents. the
+# coordinator keeps only the assignment and the word counts
+
+class _Changes(dict):
+	# stands in for a WordIndex on a worker's agents and just records the
+	# change in each word's count, to be sent to the coordinator
+	def add(self, word) -> None:
+		self[word] = self.get(word, 0) + 1
+
+	def remove(self, word) -> None:
+		self[word] = self.get(word, 0) - 1
+
+	def update(self, words) -> None:
+		for word in words:
+			self.add(word)
+
+	def collapse(self, words, word) -> None:
+		for old in words:
+			self.remove(old)
+		self.add(word)
+
+	def take(self) -> dict:
+		changes = dict(self)
+		self.clear()
+		return changes
+
+class _PartWorker:
+	def __init__(
+		self,
+		part: int,
+		assignment: array,
+		edges: typing.Callable[[], typing.Iterable[tuple[int, int]]],
+		seed: int,
+		words: int,
+		inventories: list[list[int]]=None,
+	):
+		self.partition = partitioning.build_part(part, assignment, edges)
+		root = rngs.RandomStream(seed)
+		self.rng = root.spawn(f'part:{part}')
+		if inventories is None:
+			# each agent's inventory comes from a stream of its own, keyed by
+			# its position, so it doesn't depend on how the network is split
+			self.agents = [ Agent(words, root.spawn(v)) for v in self.partition.nodes ]
+		else:
+			self.agents = [ Agent.from_word_ids(word_ids) for word_ids in inventories ]
+		# the first changes are the agents' whole inventories
+		self.changes = _Changes()
+		for agent in self.agents:
+			agent.attach(self.changes)
+
+	def start(self) -> tuple[dict, int]:
+		# the initial word counts, and how many edges leave the part
+		partition = self.partition
+		k = partition.num_nodes()
+		return self.changes.take(), sum(1 for local in partition.neighbors if local >= k)
+
+	def speak(self) -> tuple[dict[int, list], dict]:
+		# returns the requests for each other part, as (hearer there, word,
+		# speaker here), and the changes so far
+		partition = self.partition
+		agents = self.agents
+		n = len(agents)
+		hearer_draws = rngs.uniforms(self.rng, n)
+		word_draws = rngs.uniforms(self.rng, n)
+		offsets, neighbors = partition.offsets, partition.neighbors
+		requests = dict()
+		for i, agent in enumerate(agents):
+			start = offsets[i]
+			degree = offsets[i+1] - start
+			if not degree:
+				continue
+			hearer = neighbors[start + int(hearer_draws[i]*degree)]
+			if hearer < n:
+				agent.tell(agents[hearer], word_draws[i])
+				continue
+			word_ids = agent.word_ids
+			word = word_ids[int(word_draws[i]*len(word_ids))]
+			part, remote = partition.owner(hearer)
+			requests.setdefault(part, list()).append((remote, word, i))
+		return requests, self.changes.take()
+
+	def hear(self, requests: dict[int, list]) -> tuple[dict[int, list], dict]:
+		# requests from each part; returns the answers for each, as (speaker
+		# there, word, whether it was known)
+		agents = self.agents
+		answers = dict()
+		for part, batch in requests.items():
+			answers[part] = [
+				(speaker, word, agents[hearer].hear(word))
+				for hearer, word, speaker in batch
+			]
+		return answers, self.changes.take()
+
+	def settle(self, answers: list) -> dict:
+		agents = self.agents
+		for speaker, word, known in answers:
+			if known:
+				agents[speaker].hear(word)
+		return self.changes.take()
+
+	def inventories(self) -> list[list[int]]:
+		return [ agent.word_ids for agent in self.agents ]
+
+def _serve(connection, args: tuple) -> None:
+	# a worker process: build the part, run each (method, args) that
+	# arrives, send back the result, and stop on None
+	worker = _PartWorker(*args)
+	while True:
+		message = connection.recv()
+		if message is None:
+			break
+		method, args = message
+		connection.send(getattr(worker, method)(*args))
+	connection.close()
+
+class _LocalPart:
+	# the same interface as a worker process, for a part played in this one
+	def __init__(self, worker: _PartWorker):
+		self.worker = worker
+		self.result = None
+
+	def send(self, message) -> None:
+		if message is not None:
+			method, args = message
+			self.result = getattr(self.worker, method)(*args)
+
+	def recv(self):
+		return self.result
+
+def _stop(parts: list, processes: list) -> None:
+	for part in parts:
+		part.send(None)
+	for process in processes:
+		process.join()
+	parts.clear()
+	processes.clear()
+
+class PartitionedNamingGame(IndexedGame):
+	# n agents on a network given by edges, a callable yielding its edges
+	# as pairs of positions 0..n-1 (an EdgeListFile, say), split between
+	# parts by assignment, the part of each position (contiguous blocks by
+	# default). every agent starts with up to words words (n by default).
+	# the parts are played in processes of their own unless processes is
+	# False
+	uniform_hearers = False
+
+	def __init__(
+		self,
+		n: int,
+		edges: typing.Callable[[], typing.Iterable[tuple[int, int]]],
+		parts: int=1,
+		assignment: array=None,
+		processes: bool=True,
+		rng: random.Random=None,
+		words: int=None,
+	):
+		rng = rngs.stream(rng)
+		if assignment is None:
+			assignment = partitioning.block_partition(n, parts)
+		if len(assignment) != n:
+			raise ValueError('the assignment needs a part for every agent')
+		self._start(assignment, parts, edges, processes, rng, words or n, [ None ] * parts)
+
+	@classmethod
+	def from_game(cls, game, parts: int, processes: bool=True):
+		# split a NetworkNamingGame's network with bfs_partition and hand the
+		# parts to workers. the game's agents stay where they are, untouched
+		network = game.network
+		assignment = partitioning.bfs_partition(network._graph, parts, game.rng)
+		assignment = array('i', [ assignment[agent] for agent in network.agents ])
+		inventories = [ list() for part in range(parts) ]
+		for agent, part in zip(network.agents, assignment):
+			inventories[part].append(agent.word_ids)
+		partitioned = cls.__new__(cls)
+		partitioned._start(
+			assignment, parts, partitioning.CSREdges(network.csr()), processes,
+			game.rng, None, inventories, game.iteration,
+		)
+		return partitioned
+
+	def _start(
+		self,
+		assignment: array,
+		parts: int,
+		edges: typing.Callable[[], typing.Iterable[tuple[int, int]]],
+		processes: bool,
+		rng: random.Random,
+		words: int,
+		inventories: list,
+		iteration: int=0,
+	) -> None:
+		self.rng = rng
+		self.iteration = iteration
+		self.assignment = assignment
+		self.n = len(assignment)
+		self.index = WordIndex()
+		self.parts = list()
+		self.processes = list()
+		self.stop = weakref.finalize(self, _stop, self.parts, self.processes)
+
+		seed = rng.getrandbits(64)
+		for part in range(parts):
+			args = (part, assignment, edges, seed, words, inventories[part])
+			if not processes:
+				self.parts.append(_LocalPart(_PartWorker(*args)))
+				continue
+			here, there = multiprocessing.Pipe()
+			process = multiprocessing.Process(target=_serve, args=(there, args), daemon=True)
+			process.start()
+			there.close()
+			self.parts.append(here)
+			self.processes.append(process)
+
+		started = self.__call('start', [ () ] * parts)
+		self.__apply(changes for changes, boundary in started)
+		self.edge_cut = sum(boundary for changes, boundary in started) // 2
+
+	def __call(self, method: str, args: list[tuple]) -> list:
+		# the same method on every part at once, each with its own arguments
+		for part, arguments in zip(self.parts, args):
+			part.send((method, arguments))
+		return [ part.recv() for part in self.parts ]
+
+	def __apply(self, changes: typing.Iterable[dict]) -> None:
+		# parts ran concurrently, so their changes are summed before any is
+		# applied
+		total = dict()
+		for part_changes in changes:
+			for word, delta in part_changes.items():
+				total[word] = total.get(word, 0) + delta
+		for word, delta in total.items():
+			self.index.adjust(word, delta)
+
+	def run(self) -> None:
+		parts = range(len(self.parts))
+		spoken = self.__call('speak', [ () ] * len(self.parts))
+		self.__apply(changes for requests, changes in spoken)
+
+		inboxes = [ dict() for part in parts ]
+		for source, (requests, changes) in enumerate(spoken):
+			for destination, batch in requests.items():
+				inboxes[destination][source] = batch
+		heard = self.__call('hear', [ (inbox,) for inbox in inboxes ])
+		self.__apply(changes for answers, changes in heard)
+
+		replies = [ list() for part in parts ]
+		for answers, changes in heard:
+			for source, batch in answers.items():
+				replies[source].extend(batch)
+		self.__apply(self.__call('settle', [ (batch,) for batch in replies ]))
+		self.iteration+=1
+
+	def num_agents(self) -> int:
+		return self.n
+
+	def inventories(self) -> list[list[int]]:
+		# every agent's word ids, in position order. each part holds its
+		# agents in position order too, so they're dealt back out by
+		# assignment
+		held = [ iter(inventories) for inventories in self.__call('inventories', [ () ] * len(self.parts)) ]
+		return [ next(held[part]) for part in self.assignment ]
+
+	def snapshot(self) -> list[list[str]]:
+		return [ [ nouns.vocabulary.word(word_id) for word_id in word_ids ] for word_ids in self.inventories() ]
+
+	def __str__(self) -> str:
+		return f'<#PartitionedNamingGame {self.iteration} {self.poll()} agents={self.n} parts={len(self.parts)} cut={self.edge_cut}>'
+
+	def close(self) -> None:
+		# stops the workers; also done when the game is dropped
+		self.stop()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args) -> None:
+		self.close()
+
+__all__ = ['PartitionedNamingGame']
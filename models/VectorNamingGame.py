@@ -0,0 +1,40 @@
+import random
+from . import rng as rngs
+from .NamingGame import NamingGame
+from .WordIndex import WordIndex
+from .AgentPopulation import AgentPopulation
+from .schedulers import SynchronousSweep
+
+class VectorNamingGame(NamingGame):
+	# same game as NamingGame, but the agents are rows of an AgentPopulation
+	# rather than Agent objects, and each round draws all of its randomness
+	# up front
+	def __init__(self, n: int, scheduler=None, rng: random.Random=None):
+		rng = rngs.stream(rng)
+		self._setup(AgentPopulation.random(n, rng), scheduler=scheduler, rng=rng)
+
+	def _setup(self, agents: AgentPopulation, iteration: int=0, scheduler=None, rng: random.Random=None) -> None:
+		self.rng = rngs.stream(rng)
+		self.n = len(agents)
+		self.agents = agents
+		self.iteration = iteration
+		self.scheduler = SynchronousSweep() if scheduler is None else scheduler
+		self.index = WordIndex()
+		self.agents.attach(self.index)
+
+	def sweep(self) -> None:
+		n = self.n
+		hearers = rngs.indices(self.rng, n, n)
+		draws = rngs.uniforms(self.rng, n)
+		# interactions are still applied in speaker order so a round sees the
+		# results of the interactions before it, exactly like NamingGame.run
+		self.agents.play(hearers, draws)
+
+	def interact(self, speaker: int, hearer: int) -> None:
+		self.agents.tell(speaker, hearer, self.rng.random())
+
+	def settled_word(self, i: int):
+		population = self.agents
+		return population.arena[population.start[i]] if population.length[i] == 1 else None
+
+__all__ = ['VectorNamingGame']
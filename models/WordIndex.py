@@ -0,0 +1,126 @@
+class WordIndex:
+	# counts how many inventory entries hold each word, with words bucketed
+	# by count so the most common word can be found without a scan
+	def __init__(self, words=[]):
+		self.counts: dict = dict()
+		self.buckets: dict[int, set] = dict()
+		self.max_count = 0
+		self.total = 0
+		self.update(words)
+
+	def __str__(self) -> str:
+		return f'<#WordIndex words={self.num_words()} total={self.total}>'
+
+	def add(self, word) -> None:
+		count = self.counts.get(word, 0)
+		if count:
+			self.__unbucket(word, count)
+		self.counts[word] = count+1
+		self.buckets.setdefault(count+1, set()).add(word)
+		if count+1 > self.max_count:
+			self.max_count = count+1
+		self.total+=1
+
+	def remove(self, word) -> None:
+		count = self.counts[word]
+		self.__unbucket(word, count)
+		if count == 1:
+			del self.counts[word]
+		else:
+			self.counts[word] = count-1
+			self.buckets.setdefault(count-1, set()).add(word)
+		self.total-=1
+
+	def adjust(self, word, delta: int) -> None:
+		# add (or, for a negative delta, remove) delta copies of word at once
+		if not delta:
+			return
+		count = self.counts.get(word, 0)
+		new = count+delta
+		if new < 0:
+			raise ValueError(f'cannot remove {-delta} copies of a word counted {count} times')
+		if count:
+			self.__unbucket(word, count)
+		if new:
+			self.counts[word] = new
+			self.buckets.setdefault(new, set()).add(word)
+		else:
+			del self.counts[word]
+		# unbucketing only steps max_count down by one, which is enough for
+		# a word moving down a single bucket but not for a bigger drop
+		if new > self.max_count:
+			self.max_count = new
+		while self.max_count and self.max_count not in self.buckets:
+			self.max_count-=1
+		self.total+=delta
+
+	def apply(self, changes: dict) -> None:
+		# adjust() for many words at once, from a dict of word: delta. every
+		# delta is checked before anything changes, and max_count is put
+		# right once at the end rather than after every word
+		counts = self.counts
+		for word, delta in changes.items():
+			if counts.get(word, 0) + delta < 0:
+				raise ValueError(f'cannot remove {-delta} copies of a word counted {counts.get(word, 0)} times')
+		buckets = self.buckets
+		total = self.total
+		for word, delta in changes.items():
+			if not delta:
+				continue
+			count = counts.get(word, 0)
+			new = count+delta
+			if count:
+				bucket = buckets[count]
+				bucket.remove(word)
+				if not bucket:
+					del buckets[count]
+			if new:
+				counts[word] = new
+				bucket = buckets.get(new)
+				if bucket is None:
+					buckets[new] = { word }
+				else:
+					bucket.add(word)
+			else:
+				del counts[word]
+			total += delta
+		self.total = total
+		self.max_count = max(buckets, default=0)
+
+	def update(self, words) -> None:
+		for word in words:
+			self.add(word)
+
+	def collapse(self, words, word) -> None:
+		# an inventory holding `words` is being replaced by just `word`
+		for old in words:
+			self.remove(old)
+		self.add(word)
+
+	def __unbucket(self, word, count: int) -> None:
+		bucket = self.buckets[count]
+		bucket.remove(word)
+		if not bucket:
+			del self.buckets[count]
+			# the word moves to count-1, so that bucket can't be empty
+			if count == self.max_count:
+				self.max_count-=1
+
+	def count(self, word) -> int:
+		return self.counts.get(word, 0)
+
+	def num_words(self) -> int:
+		return len(self.counts)
+
+	def consensus(self) -> bool:
+		return len(self.counts) == 1
+
+	def dominant_word(self):
+		if not self.max_count:
+			return None
+		return next(iter(self.buckets[self.max_count]))
+
+	def dominant_count(self) -> int:
+		return self.max_count
+
+__all__ = ['WordIndex']
@@ -1,5 +1,21 @@
 from .Agent import Agent
-from .AgentNetwork import Agent
+from .AgentPopulation import AgentPopulation, AgentView
+from .AgentNetwork import AgentNetwork
+from .LazyAgents import LazyAgents
+from .IndexedGame import IndexedGame
 from .NamingGame import NamingGame
+from .VectorNamingGame import VectorNamingGame
+from .NetworkNamingGame import NetworkNamingGame
+from .ParallelNamingGame import ParallelNamingGame
+from .PartitionedNamingGame import PartitionedNamingGame
+from .WordIndex import WordIndex
+from .Observation import Observation, ObservationQueue
+from . import rng
 from . import graph
+from . import schedulers
+from . import ensemble
+from . import snapshot
+from . import instrumentation
+from . import sweep
+from . import stopping
 __name__ = "models"
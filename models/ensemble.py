@@ -0,0 +1,88 @@
+import hashlib
+import multiprocessing
+import random
+import typing
+from .rng import RandomStream
+from .NamingGame import NamingGame
+from .NetworkNamingGame import NetworkNamingGame
+from . import stopping
+
+class EnsembleConfig(typing.NamedTuple):
+	n: int
+	# leave the coefficients as None to play the well-mixed NamingGame
+	min_edge_coeff: float = None
+	max_edge_coeff: float = None
+
+class ReplicaResult(typing.NamedTuple):
+	config: EnsembleConfig
+	replica: int
+	seed: int
+	iterations: int
+	converged: bool
+	word_counts: list[int]
+	# whether a stopping criterion ended the game early, and if so when it
+	# was expected to have reached consensus
+	stopped: bool = False
+	estimate: float = None
+
+def replica_seed(master_seed: int, config: EnsembleConfig, replica: int) -> int:
+	# derived from the replica's identity rather than drawn in sequence, so
+	# a replica gets the same seed however the work is sharded
+	key = f'{master_seed}:{tuple(config)}:{replica}'.encode()
+	return int.from_bytes(hashlib.sha256(key).digest()[:8], 'big')
+
+def make_game(config: EnsembleConfig, rng: random.Random=None) -> NamingGame:
+	if config.min_edge_coeff is None:
+		return NamingGame(config.n, rng=rng)
+	return NetworkNamingGame(config.n, config.min_edge_coeff, config.max_edge_coeff, rng=rng)
+
+def run_replica(task) -> ReplicaResult:
+	config, replica, seed, max_iterations = task[:4]
+	# an optional fifth entry is a stopping criterion
+	until = stopping.criterion(task[4] if len(task) > 4 else None)
+	# each replica plays on a stream of its own, leaving the worker's
+	# global random state alone
+	game = make_game(config, RandomStream(seed))
+	estimator = None if until is None else stopping.ConsensusEstimator(game.num_agents())
+	word_counts = list()
+	for observation in game.observe(max_iterations=max_iterations, until=until):
+		word_counts.append(observation.num_words)
+		if estimator is not None:
+			estimator(observation)
+	stopped = until is not None and until.fired is not None and not game.poll()
+	estimate = estimator.estimate() if stopped else None
+	return ReplicaResult(config, replica, seed, game.iteration, game.poll(), word_counts, stopped, estimate)
+
+def run_tasks(
+	tasks: typing.Iterable[tuple],
+	processes: int=None,
+	chunksize: int=1,
+) -> typing.Iterator[ReplicaResult]:
+	# run_replica over tasks, in a pool unless processes is 1; results come
+	# back in task order
+	if processes == 1:
+		yield from map(run_replica, tasks)
+		return
+	with multiprocessing.Pool(processes) as pool:
+		yield from pool.imap(run_replica, tasks, chunksize)
+
+def run_ensemble(
+	configs: list[EnsembleConfig],
+	replicas: int,
+	master_seed: int=0,
+	processes: int=None,
+	max_iterations: int=10000,
+	chunksize: int=1,
+	until=None,
+) -> typing.Iterator[ReplicaResult]:
+	# yields results as they finish, in (config, replica) order, so the
+	# output for a given master seed doesn't depend on the pool size. until
+	# stops every replica early, as in NamingGame.observe
+	tasks = (
+		(config, replica, replica_seed(master_seed, config, replica), max_iterations, until)
+		for config in (EnsembleConfig(*config) for config in configs)
+		for replica in range(replicas)
+	)
+	yield from run_tasks(tasks, processes, chunksize)
+
+__all__ = ['EnsembleConfig', 'ReplicaResult', 'replica_seed', 'run_replica', 'run_tasks', 'run_ensemble']
@@ -0,0 +1,73 @@
+import typing, random
+from array import array
+from bisect import bisect_left
+from ..rng import stream
+
+T = typing.TypeVar('T')
+
+class CSRGraph(typing.Generic[T]):
+	# frozen adjacency in compressed sparse row form: the neighbors of the
+	# node at position i are neighbors[offsets[i]:offsets[i+1]], sorted
+	def __init__(self, nodes: list[T], offsets: array, neighbors: array):
+		self.nodes: list[T] = nodes
+		self.index: dict[T, int] = { node: i for i, node in enumerate(nodes) }
+		self.offsets = offsets
+		self.neighbors = neighbors
+
+	@classmethod
+	def from_graph(cls, graph, nodes: list[T]=None):
+		# nodes fixes the position order; it defaults to the graph's own order
+		nodes = list(graph.nodes if nodes is None else nodes)
+		index = { node: i for i, node in enumerate(nodes) }
+		offsets = array('q', [ 0 ])
+		neighbors = array('q')
+		for node in nodes:
+			neighbors.extend(sorted(index[adjacent] for adjacent in graph.edges[node]))
+			offsets.append(len(neighbors))
+		return cls(nodes, offsets, neighbors)
+
+	def num_nodes(self) -> int:
+		return len(self.nodes)
+
+	def has_node(self, node: T) -> bool:
+		return node in self.index
+
+	def _position(self, node: T) -> int:
+		if node not in self.index:
+			raise ValueError("node not element of graph")
+		return self.index[node]
+
+	def has_edge(self, source: T, target: T) -> bool:
+		i = self._position(source)
+		j = self._position(target)
+		end = self.offsets[i+1]
+		k = bisect_left(self.neighbors, j, self.offsets[i], end)
+		return k < end and self.neighbors[k] == j
+
+	def adjacent_nodes(self, node: T) -> list[T]:
+		i = self._position(node)
+		nodes = self.nodes
+		return [ nodes[j] for j in self.neighbors[self.offsets[i]:self.offsets[i+1]] ]
+
+	def num_edges(self) -> int:
+		# counts directed entries; a frozen Graph stores each edge twice
+		return len(self.neighbors)
+
+	def degree(self, i: int) -> int:
+		return self.offsets[i+1] - self.offsets[i]
+
+	def random_neighbor_index(self, i: int, u: float=None, rng: random.Random=None) -> int:
+		# u, if given, is the uniform draw in [0, 1) that picks the neighbor;
+		# otherwise it's drawn from rng
+		start = self.offsets[i]
+		degree = self.offsets[i+1] - start
+		if not degree:
+			raise ValueError(f'node at position {i} has no neighbors')
+		if u is None:
+			u = stream(rng).random()
+		return self.neighbors[start + int(u*degree)]
+
+	def random_neighbor(self, node: T, u: float=None, rng: random.Random=None) -> T:
+		return self.nodes[self.random_neighbor_index(self._position(node), u, rng)]
+
+__all__ = ['CSRGraph']
@@ -0,0 +1,166 @@
+import typing
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from .DirectedGraph import DirectedGraph
+from .CSRGraph import CSRGraph
+
+T = typing.TypeVar('T')
+
+class _EdgeView(Mapping):
+	# read-only stand-in for DirectedGraph.edges, for code that walks
+	# graph.edges[node] directly
+	def __init__(self, graph):
+		self._graph = graph
+
+	def __getitem__(self, node):
+		return tuple(self._graph.adjacent_nodes(node))
+
+	def __iter__(self):
+		return iter(self._graph.nodes)
+
+	def __len__(self):
+		return self._graph.num_nodes()
+
+class CompactDirectedGraph(DirectedGraph):
+	# same interface as DirectedGraph, but nodes are interned to dense
+	# positions and each node's successors are a sorted array of positions
+	TYPECODE = 'i'
+
+	def __init__(self, nodes: list[T]):
+		self._nodes: list[T] = list(dict.fromkeys(nodes))
+		self._index: dict[T, int] = { node: i for i, node in enumerate(self._nodes) }
+		self._adjacency: list[array] = [ array(self.TYPECODE) for node in self._nodes ]
+		self._num_edges = 0
+
+	@property
+	def nodes(self):
+		return self._index.keys()
+
+	@property
+	def edges(self):
+		return _EdgeView(self)
+
+	def _position(self, node: T) -> int:
+		try:
+			return self._index[node]
+		except (KeyError, TypeError):
+			raise ValueError(f'node not element of graph ({node})')
+
+	def add_node(self, node: T) -> None:
+		if node not in self._index:
+			self._index[node] = len(self._nodes)
+			self._nodes.append(node)
+			self._adjacency.append(array(self.TYPECODE))
+
+	def remove_node(self, node: T) -> None:
+		# drops the node and every edge into or out of it. the nodes after it
+		# move down a position, which keeps every array sorted, but means a
+		# pass over the whole graph
+		i = self._position(node)
+		self._num_edges -= len(self._adjacency[i])
+		del self._nodes[i]
+		del self._adjacency[i]
+		del self._index[node]
+		for j in range(i, len(self._nodes)):
+			self._index[self._nodes[j]] = j
+		for adjacency in self._adjacency:
+			k = bisect_left(adjacency, i)
+			if k < len(adjacency) and adjacency[k] == i:
+				del adjacency[k]
+				self._num_edges-=1
+			if k < len(adjacency):
+				adjacency[k:] = array(self.TYPECODE, [ j-1 for j in adjacency[k:] ])
+
+	def has_node(self, node: T):
+		return node in self._index
+
+	def num_nodes(self):
+		return len(self._nodes)
+
+	def has_edge(self, source: T, target: T):
+		adjacency = self._adjacency[self._position(source)]
+		j = self._position(target)
+		k = bisect_left(adjacency, j)
+		return k < len(adjacency) and adjacency[k] == j
+
+	def add_edge(self, source: T, target: T) -> None:
+		if target == source:
+			raise ValueError('cannot add edges from self to self')
+		adjacency = self._adjacency[self._position(source)]
+		j = self._position(target)
+		k = bisect_left(adjacency, j)
+		if k == len(adjacency) or adjacency[k] != j:
+			adjacency.insert(k, j)
+			self._num_edges+=1
+
+	def remove_edge(self, source: T, target: T) -> bool:
+		adjacency = self._adjacency[self._position(source)]
+		j = self._position(target)
+		k = bisect_left(adjacency, j)
+		if k < len(adjacency) and adjacency[k] == j:
+			del adjacency[k]
+			self._num_edges-=1
+			return True
+		return False
+
+	def edge_mask(self, edgelist) -> typing.Iterator[bool]:
+		for source, target in edgelist:
+			yield self.has_edge(source, target)
+
+	def add_edges(self, edgelist) -> None:
+		# everything is validated before anything changes, then each touched
+		# node's array is rebuilt once rather than inserted into edge by edge
+		position = self._position
+		pending: dict[int, list[int]] = dict()
+		for source, target in edgelist:
+			if target == source:
+				raise ValueError('cannot add edges from self to self')
+			pending.setdefault(position(source), []).append(position(target))
+		for i, targets in pending.items():
+			adjacency = self._adjacency[i]
+			merged = sorted(set(adjacency).union(targets))
+			self._num_edges += len(merged) - len(adjacency)
+			self._adjacency[i] = array(self.TYPECODE, merged)
+
+	def remove_edges(self, edgelist) -> int:
+		# validated up front, like add_edges
+		position = self._position
+		pairs = [ (position(source), position(target)) for source, target in edgelist ]
+		removed = 0
+		for i, j in pairs:
+			adjacency = self._adjacency[i]
+			k = bisect_left(adjacency, j)
+			if k < len(adjacency) and adjacency[k] == j:
+				del adjacency[k]
+				removed+=1
+		self._num_edges -= removed
+		return removed
+
+	def num_edges(self) -> int:
+		return self._num_edges
+
+	def complete(self):
+		n = len(self._nodes)
+		for i in range(n):
+			adjacency = array(self.TYPECODE, range(i))
+			adjacency.extend(range(i+1, n))
+			self._adjacency[i] = adjacency
+		self._num_edges = n*(n-1)
+
+	def degree(self, node: T) -> int:
+		return len(self._adjacency[self._position(node)])
+
+	def adjacent_nodes(self, node) -> list[T]:
+		nodes = self._nodes
+		return [ nodes[j] for j in self._adjacency[self._position(node)] ]
+
+	def freeze(self) -> CSRGraph:
+		offsets = array('q', [ 0 ])
+		neighbors = array('q')
+		for adjacency in self._adjacency:
+			neighbors.extend(iter(adjacency))
+			offsets.append(len(neighbors))
+		return CSRGraph(list(self._nodes), offsets, neighbors)
+
+__all__ = ['CompactDirectedGraph']
@@ -0,0 +1,13 @@
+from .Graph import Graph
+from .CompactDirectedGraph import CompactDirectedGraph
+
+# Graph's symmetric add/remove and connectivity code run unchanged on top
+# of the compact storage, since Graph calls through super()
+class CompactGraph(Graph, CompactDirectedGraph):
+	def remove_node(self, node) -> None:
+		# Graph's version edits the edge sets in place, which compact storage
+		# doesn't have
+		CompactDirectedGraph.remove_node(self, node)
+		self._components = None
+
+__all__ = ['CompactGraph']
@@ -1,16 +1,28 @@
-import typing, random
+import typing, random, math, itertools
+from .CSRGraph import CSRGraph
+from ..rng import stream
 
 T = typing.TypeVar('T')
 EdgeMapping = dict[T, set[T]]
 
 class DirectedGraph(typing.Generic[T]):
+	# graphs with more nodes than this print a summary instead of a matrix
+	MATRIX_LIMIT = 32
+
 	def __init__(self, nodes: list[T]):
-		self.nodes: set[T] = set(nodes)
+		# a dict used as an insertion-ordered set, so that walks over the
+		# nodes don't depend on how the nodes happen to hash
+		self.nodes: dict[T, None] = dict.fromkeys(nodes)
 		self.edges: EdgeMapping = {
 			node: set() for node in self.nodes
 		}
 
 	def __str__(self) -> str:
+		if self.num_nodes() > self.MATRIX_LIMIT:
+			return self.summary()
+		return self.matrix()
+
+	def matrix(self) -> str:
 		symbolic_table = list()
 		matrix = list()
 		num_nodes = self.num_nodes()
@@ -39,13 +51,58 @@ class DirectedGraph(typing.Generic[T]):
 		
 		return f'SYMBOLS: {symbolic_table}\n{header}\n{matrix}'	
 
+	def degree(self, node: T) -> int:
+		return len(self.edges[node])
+
+	def degree_stats(self) -> tuple[int, float, int]:
+		# (min, mean, max) out-degree
+		if not self.num_nodes():
+			return (0, 0.0, 0)
+		low, high, total = None, 0, 0
+		for node in self.nodes:
+			degree = self.degree(node)
+			total += degree
+			high = max(high, degree)
+			low = degree if low is None else min(low, degree)
+		return (low, total / self.num_nodes(), high)
+
+	def summary(self) -> str:
+		low, mean, high = self.degree_stats()
+		return (
+			f'<#{self.__class__.__name__} nodes={self.num_nodes()} '
+			f'edges={self.num_edges()} degree={low}/{mean:.2f}/{high}>'
+		)
+
+	def render(
+		self,
+		start: int=0,
+		stop: int=None,
+		label: typing.Callable[[T], str]=str,
+	) -> typing.Iterator[str]:
+		# a summary line, then one line of neighbors for each node at
+		# positions start..stop-1, produced lazily one line at a time
+		yield self.summary()
+		for node in itertools.islice(self.nodes, start, stop):
+			yield label(node)+': '+' '.join(label(adjacent) for adjacent in self.edges[node])
+
+	def add_node(self, node: T) -> None:
+		if node not in self.nodes:
+			self.nodes[node] = None
+			self.edges[node] = set()
+
+	def remove_node(self, node: T) -> None:
+		# drops the node and every edge into or out of it
+		self.__validate_all_nodes(node)
+		del self.nodes[node]
+		del self.edges[node]
+		for adjacencies in self.edges.values():
+			adjacencies.discard(node)
+
 	def has_node(self, node: T):
 		return node in self.nodes
 
 	def has_nodes(self, *nodes: T):
-		return all([
-			self.has_node(node) for node in nodes
-		])
+		return all(node in self.nodes for node in nodes)
 	
 	def num_nodes(self):
 		return len(self.nodes)
@@ -60,10 +117,57 @@ class DirectedGraph(typing.Generic[T]):
 		return target in self.edges[source]
 
 	def has_edges (self, edgelist: list[list[T]]) -> bool:
-		for edge in edgelist:
-			if not self.has_edge(*edge):
-				return False
-		return True 
+		return all(self.edge_mask(edgelist))
+
+	def _bad_edge(self, source: T, target: T) -> ValueError:
+		return ValueError(f'all arguments must be elements of graph (args {(source, target)})')
+
+	# the bulk operations below take any iterable of (source, target) pairs
+	# and work through it without a method call per edge. add_edges and
+	# remove_edges check every pair before changing anything, so a bad pair
+	# leaves the graph as it was
+
+	def edge_mask (self, edgelist: typing.Iterable[typing.Sequence[T]]) -> typing.Iterator[bool]:
+		# whether each edge is present, lazily and in order
+		edges = self.edges
+		for source, target in edgelist:
+			if target not in edges:
+				raise self._bad_edge(source, target)
+			try:
+				yield target in edges[source]
+			except KeyError:
+				raise self._bad_edge(source, target)
+
+	def _checked_edges(self, edgelist: typing.Iterable[typing.Sequence[T]]) -> list[tuple[set[T], T]]:
+		# each pair as (the source's adjacencies, target), once every pair is
+		# known to be between nodes of the graph
+		edges = self.edges
+		checked = list()
+		for source, target in edgelist:
+			if target not in edges:
+				raise self._bad_edge(source, target)
+			try:
+				checked.append((edges[source], target))
+			except (KeyError, TypeError):
+				raise self._bad_edge(source, target)
+		return checked
+
+	def add_edges (self, edgelist: typing.Iterable[typing.Sequence[T]]) -> None:
+		pairs = list(edgelist)
+		for source, target in pairs:
+			if target == source:
+				raise ValueError('cannot add edges from self to self')
+		for adjacencies, target in self._checked_edges(pairs):
+			adjacencies.add(target)
+
+	def remove_edges (self, edgelist: typing.Iterable[typing.Sequence[T]]) -> int:
+		# returns how many of the edges were present
+		removed = 0
+		for adjacencies, target in self._checked_edges(edgelist):
+			if target in adjacencies:
+				adjacencies.remove(target)
+				removed+=1
+		return removed
 
 	def add_edge (self, source: T, target: T) -> None:
 		if target == source:
@@ -100,21 +204,28 @@ class DirectedGraph(typing.Generic[T]):
 				self.add_edge(n, m)
 				self.add_edge(m, n)
 	
+	# ordered pairs (i, j) of node positions with i != j are numbered
+	# 0..max_edges-1 row by row, so random edges can be drawn as integers
+	@staticmethod
+	def _encode_pair(i: int, j: int, n: int) -> int:
+		return i*(n-1) + (j if j < i else j-1)
+
+	@staticmethod
+	def _decode_pair(k: int, n: int) -> tuple[int, int]:
+		i, j = divmod(k, n-1)
+		return (i, j+1 if j >= i else j)
+
 	@classmethod
 	def random_graph (
 		cls,
 		nodes: list[T], 
 		num_edges: int, 
 		guaranteed_edges: list[list[T]]=[],
+		rng: random.Random=None,
 	):
-		# optimization for later: if we're constructing an almost-complete
-		# graph, start with a complete graph and then remove edges
-
+		nodes = list(nodes)
 		dg = cls(nodes)
 
-		# it's very slow to construct a complete graph by picking random edges,
-		# so if we're asking for one, just do it from the start
-		#
 		# this also gets us the case for graphs with zero or one nodes for
 		# free
 		if len(guaranteed_edges) + num_edges >= dg.max_edges():
@@ -123,21 +234,71 @@ class DirectedGraph(typing.Generic[T]):
 
 		for edge in guaranteed_edges:
 			dg.add_edge(*edge)
-		
-		for i in range(num_edges):
-			if dg.num_edges() == dg.num_nodes()*(dg.num_nodes()-1):
-				return dg
-			
-			n1 = random.choice(nodes)
-			n2 = random.choice(nodes)
 
-			# guarantees we add a new, valid edge each time
-			while (n1 == n2 or dg.has_edge(n1, n2)):
-				n1 = random.choice(nodes)
-				n2 = random.choice(nodes)
+		n = len(nodes)
+		total_pairs = cls.max_edges_for_n_nodes(n)
+		index = { node: i for i, node in enumerate(nodes) }
+		taken = set(
+			cls._encode_pair(index[source], index[target], n)
+			for source, target in guaranteed_edges
+		)
+
+		if len(taken) + num_edges <= total_pairs // 2:
+			# sparse: draw pair numbers directly. at most half of all pairs
+			# are ever taken or chosen, so at least half of all draws land on
+			# a free one, and this is O(num_edges)
+			chosen = cls.__sample_pairs(num_edges, total_pairs, taken, rng)
+		else:
+			# dense, or mostly guaranteed: rejection could take many draws
+			# per edge, so list the free pairs, O(total_pairs), and sample
+			# them without replacement
+			free = [ k for k in range(total_pairs) if k not in taken ]
+			chosen = stream(rng).sample(free, num_edges)
+
+		decode = cls._decode_pair
+		dg.add_edges(
+			(nodes[i], nodes[j]) for i, j in (decode(k, n) for k in chosen)
+		)
+		return dg
+
+	@staticmethod
+	def __sample_pairs(count: int, total_pairs: int, taken: set[int], rng: random.Random=None) -> set[int]:
+		randrange = stream(rng).randrange
+		chosen = set()
+		while len(chosen) < count:
+			k = randrange(total_pairs)
+			if k not in taken:
+				chosen.add(k)
+		return chosen
+
+	@classmethod
+	def random_graph_gnp(cls, nodes: list[T], p: float, rng: random.Random=None):
+		# G(n, p): every possible edge is present independently with
+		# probability p. rather than flipping a coin per pair, jump straight
+		# to the next present pair using geometrically distributed gaps
+		nodes = list(nodes)
+		dg = cls(nodes)
+		if p <= 0:
+			return dg
+		if p >= 1:
+			dg.complete()
+			return dg
+
+		n = len(nodes)
+		total_pairs = cls.max_edges_for_n_nodes(n)
+		log_q = math.log(1.0 - p)
+		r = stream(rng).random
 
-			dg.add_edge(n1, n2)
+		def present_pairs():
+			k = -1
+			while True:
+				k += 1 + int(math.log(1.0 - r()) / log_q)
+				if k >= total_pairs:
+					return
+				i, j = cls._decode_pair(k, n)
+				yield nodes[i], nodes[j]
 
+		dg.add_edges(present_pairs())
 		return dg
 
 	def adjacent_nodes(self, node) -> list[T]:
@@ -145,4 +306,7 @@ class DirectedGraph(typing.Generic[T]):
 			return list(self.edges[node])
 		raise ValueError("node not element of graph")
 
+	def freeze(self) -> CSRGraph:
+		return CSRGraph.from_graph(self)
+
 __all__ = ['DirectedGraph']
\ No newline at end of file
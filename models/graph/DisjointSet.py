@@ -0,0 +1,49 @@
+import typing
+
+T = typing.TypeVar('T')
+
+class DisjointSet(typing.Generic[T]):
+	# union-find with union by size and path halving
+	def __init__(self, items: typing.Iterable[T]=[]):
+		self.parent: dict[T, T] = dict()
+		self.size: dict[T, int] = dict()
+		self.num_sets = 0
+		for item in items:
+			self.add(item)
+
+	def add(self, item: T) -> None:
+		if item not in self.parent:
+			self.parent[item] = item
+			self.size[item] = 1
+			self.num_sets+=1
+
+	def find(self, item: T) -> T:
+		parent = self.parent
+		while parent[item] != item:
+			parent[item] = parent[parent[item]]
+			item = parent[item]
+		return item
+
+	def union(self, a: T, b: T) -> bool:
+		a = self.find(a)
+		b = self.find(b)
+		if a == b:
+			return False
+		if self.size[a] < self.size[b]:
+			a, b = b, a
+		self.parent[b] = a
+		self.size[a] += self.size.pop(b)
+		self.num_sets-=1
+		return True
+
+	def connected(self, a: T, b: T) -> bool:
+		return self.find(a) == self.find(b)
+
+	def groups(self, items: typing.Iterable[T]=None) -> list[list[T]]:
+		# members of each set, in order of first appearance in items
+		groups: dict[T, list[T]] = dict()
+		for item in (self.parent if items is None else items):
+			groups.setdefault(self.find(item), []).append(item)
+		return list(groups.values())
+
+__all__ = ['DisjointSet']
@@ -0,0 +1,140 @@
+import typing, random
+from ..rng import stream
+
+T = typing.TypeVar('T')
+
+class DynamicAdjacency(typing.Generic[T]):
+	# undirected adjacency for topologies that change while they're being
+	# sampled. each node's neighbors are kept in a list, plus a dict of
+	# where each neighbor sits in it, so adding an edge, removing one (by
+	# swapping the last neighbor into its slot) and drawing a random
+	# neighbor are all O(1)
+	def __init__(self, nodes: typing.Iterable[T]=()):
+		self.neighbors: dict[T, list[T]] = dict()
+		self.positions: dict[T, dict[T, int]] = dict()
+		for node in nodes:
+			self.add_node(node)
+
+	@classmethod
+	def from_graph(cls, graph, nodes: list[T]=None):
+		# rows follow the order of nodes (the graph's own by default) rather
+		# than set order, so sampling doesn't depend on how nodes hash
+		nodes = list(graph.nodes if nodes is None else nodes)
+		order = { node: i for i, node in enumerate(nodes) }
+		adjacency = cls()
+		for node in nodes:
+			row = sorted(graph.edges[node], key=order.__getitem__)
+			adjacency.neighbors[node] = row
+			adjacency.positions[node] = { adjacent: i for i, adjacent in enumerate(row) }
+		return adjacency
+
+	def num_nodes(self) -> int:
+		return len(self.neighbors)
+
+	def has_node(self, node: T) -> bool:
+		return node in self.neighbors
+
+	def _row(self, node: T) -> list[T]:
+		if node not in self.neighbors:
+			raise ValueError("node not element of graph")
+		return self.neighbors[node]
+
+	def add_node(self, node: T) -> None:
+		if node not in self.neighbors:
+			self.neighbors[node] = list()
+			self.positions[node] = dict()
+
+	def remove_node(self, node: T) -> list[T]:
+		# drops the node and its edges, O(degree); returns its old neighbors
+		row = self._row(node)
+		for adjacent in row:
+			self.__unlink(adjacent, node)
+		del self.neighbors[node]
+		del self.positions[node]
+		return row
+
+	def has_edge(self, node1: T, node2: T) -> bool:
+		self._row(node1)
+		self._row(node2)
+		return node2 in self.positions[node1]
+
+	def add_edge(self, node1: T, node2: T) -> bool:
+		# returns whether the edge is new
+		if node1 == node2:
+			raise ValueError('cannot add edges from self to self')
+		self._row(node1)
+		self._row(node2)
+		if node2 in self.positions[node1]:
+			return False
+		self.__link(node1, node2)
+		self.__link(node2, node1)
+		return True
+
+	def remove_edge(self, node1: T, node2: T) -> bool:
+		# returns whether the edge was present
+		self._row(node1)
+		self._row(node2)
+		if node2 not in self.positions[node1]:
+			return False
+		self.__unlink(node1, node2)
+		self.__unlink(node2, node1)
+		return True
+
+	def __link(self, node: T, adjacent: T) -> None:
+		row = self.neighbors[node]
+		self.positions[node][adjacent] = len(row)
+		row.append(adjacent)
+
+	def __unlink(self, node: T, adjacent: T) -> None:
+		row = self.neighbors[node]
+		positions = self.positions[node]
+		i = positions.pop(adjacent)
+		last = row.pop()
+		if i < len(row):
+			row[i] = last
+			positions[last] = i
+
+	def degree(self, node: T) -> int:
+		return len(self._row(node))
+
+	def adjacent_nodes(self, node: T) -> list[T]:
+		return list(self._row(node))
+
+	def random_neighbor(self, node: T, u: float=None, rng: random.Random=None) -> T:
+		# u, if given, is the uniform draw in [0, 1) that picks the neighbor;
+		# otherwise it's drawn from rng
+		row = self._row(node)
+		if not row:
+			raise ValueError("node has no neighbors")
+		if u is None:
+			u = stream(rng).random()
+		return row[int(u*len(row))]
+
+	def connected(self, node1: T, node2: T) -> tuple[bool, list[T]]:
+		# breadth-first searches from both nodes, one node at a time each,
+		# until they meet or one runs out. if the nodes aren't connected the
+		# cost is bounded by the smaller side, so a small piece split off by
+		# an edge removal is all that's walked; if they are, it depends on
+		# how far apart they are, up to O(n). returns whether the nodes are
+		# connected and, if not, the nodes on the side that ran out
+		if node1 == node2:
+			return True, []
+		neighbors = self.neighbors
+		frontiers = ([ node1 ], [ node2 ])
+		seen = ({ node1 }, { node2 })
+		heads = [ 0, 0 ]
+		while True:
+			for side in (0, 1):
+				frontier = frontiers[side]
+				if heads[side] == len(frontier):
+					return False, frontier
+				node = frontier[heads[side]]
+				heads[side] += 1
+				for adjacent in neighbors[node]:
+					if adjacent in seen[1-side]:
+						return True, []
+					if adjacent not in seen[side]:
+						seen[side].add(adjacent)
+						frontier.append(adjacent)
+
+__all__ = ['DynamicAdjacency']
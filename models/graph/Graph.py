@@ -1,6 +1,9 @@
 import typing
 import random
+import math
 from . import DirectedGraph
+from .DisjointSet import DisjointSet
+from ..rng import stream
 
 T = typing.TypeVar('T')
 EdgeMapping = dict[T, set[T]]
@@ -8,67 +11,140 @@ EdgeMapping = dict[T, set[T]]
 class Graph(DirectedGraph):
 	def __init__(self, nodes):
 		super().__init__(nodes)
+		# connectivity is kept up to date as edges are added; removing an
+		# edge can split a component, so that drops it to be rebuilt lazily
+		self._components = DisjointSet(self.nodes)
+
+	def add_node(self, node: T) -> None:
+		super().add_node(node)
+		if self._components is not None:
+			self._components.add(node)
+
+	def remove_node(self, node: T) -> None:
+		# edges run both ways, so only the node's neighbors point at it
+		if node not in self.nodes:
+			raise ValueError("node not element of graph")
+		edges = self.edges
+		for adjacent in edges[node]:
+			edges[adjacent].discard(node)
+		del edges[node]
+		del self.nodes[node]
+		self._components = None
 
 	def add_edge (self, node1: T, node2: T) -> None:
 		super().add_edge(node1, node2)
 		super().add_edge(node2, node1)
+		if self._components is not None:
+			self._components.union(node1, node2)
 	
 	def remove_edge(self, source: T, target: T) -> bool:
-		return (
+		removed = (
 			super().remove_edge(source, target) and
 			super().remove_edge(target, source)
 		)
+		if removed:
+			self._components = None
+		return removed
+
+	def add_edges (self, edgelist) -> None:
+		pairs = list(edgelist)
+		super().add_edges(
+			edge
+			for node1, node2 in pairs
+			for edge in ((node1, node2), (node2, node1))
+		)
+		# nothing is added unless everything is, so the unions come after
+		if self._components is not None:
+			for node1, node2 in pairs:
+				self._components.union(node1, node2)
+
+	def remove_edges(self, edgelist) -> int:
+		def both_directions():
+			for source, target in edgelist:
+				yield source, target
+				yield target, source
+
+		removed = super().remove_edges(both_directions()) // 2
+		if removed:
+			self._components = None
+		return removed
+
+	def complete(self):
+		super().complete()
+		self._components = None
 
 	def num_edges(self):
 		return super().num_edges() // 2
-	
-	def __construct_connected_subgraph(self, node):
-		node_stack = list()
-		seen_nodes = set()
-		node_stack.append(node)
 
-		while(node_stack):
-			curr = node_stack.pop()
-			seen_nodes.add(curr)
-			for adjacent_node in self.edges[curr]:
-				if adjacent_node not in seen_nodes:
-					node_stack.append(adjacent_node)
+	def _connectivity(self) -> DisjointSet:
+		if self._components is None:
+			components = DisjointSet(self.nodes)
+			for node in self.nodes:
+				for adjacent_node in self.edges[node]:
+					components.union(node, adjacent_node)
+			self._components = components
+		return self._components
 
-		g = Graph(list(seen_nodes))
+	def num_components(self) -> int:
+		return self._connectivity().num_sets
 
-		for node in seen_nodes:
-			for adjacency in self.edges[node]:
-				g.add_edge(node, adjacency)
+	def is_connected(self) -> bool:
+		return self.num_components() <= 1
 
-		return g
+	def components(self) -> list[list[T]]:
+		return self._connectivity().groups(self.nodes)
 	
 	def connected_subgraphs(self):
 		if self.num_nodes() == 0:
 			return [ Graph(list()) ]
-		
-		seen_nodes: set[T] = set()
-		graphs: list[Graph] = list()
 
-		for node in self.nodes:
-			if node not in seen_nodes:
-				g = self.__construct_connected_subgraph(node)
-				graphs.append(g)
-				for subgraph_node in g.nodes:
-					seen_nodes.add(subgraph_node)
+		graphs: list[Graph] = list()
+		for component in self.components():
+			g = Graph(component)
+			for node in component:
+				for adjacency in self.edges[node]:
+					g.add_edge(node, adjacency)
+			graphs.append(g)
 		
 		return graphs
 	
-	def merge_subgraphs(self):
-		connected_subgraphs = self.connected_subgraphs()
-		working_subgraphs = list(connected_subgraphs)
-		while (len(working_subgraphs) > 1):
-			subgraph1 = working_subgraphs.pop()
-			subgraph2 = random.choice(working_subgraphs)
+	def merge_subgraphs(self, rng: random.Random=None):
+		rng = stream(rng)
+		components = self._connectivity()
+
+		# pick a uniformly random member of every component in one pass
+		representatives = dict()
+		seen = dict()
+		for node in self.nodes:
+			root = components.find(node)
+			seen[root] = seen.get(root, 0) + 1
+			if rng.randrange(seen[root]) == 0:
+				representatives[root] = node
+
+		# then join the components along a random tree
+		representatives = list(representatives.values())
+		rng.shuffle(representatives)
+		for i in range(1, len(representatives)):
 			self.add_edge(
-				random.choice(list(subgraph1.nodes)),
-				random.choice(list(subgraph2.nodes))
-			)		
+				representatives[i],
+				representatives[rng.randrange(i)]
+			)
 
 	def max_edges_for_n_nodes(n: int):
 		return (n*(n-1)) // 2
+
+	# unordered pairs i < j, numbered row by row: row i holds n-1-i pairs
+	@staticmethod
+	def _encode_pair(i: int, j: int, n: int) -> int:
+		if i > j:
+			i, j = j, i
+		return i*(n-1) - (i*(i-1))//2 + (j-i-1)
+
+	@staticmethod
+	def _decode_pair(k: int, n: int) -> tuple[int, int]:
+		# count rows from the end, where row sizes are 1, 2, 3, ...
+		remaining = (n*(n-1))//2 - 1 - k
+		r = (math.isqrt(8*remaining + 1) - 1) // 2
+		i = n - 2 - r
+		return (i, k - (i*(n-1) - (i*(i-1))//2) + i + 1)
 __all__ = ["Graph"]
@@ -1,3 +1,9 @@
 from .DirectedGraph import DirectedGraph
 from .Graph import Graph
-__all__ = ["Graph", "DirectedGraph"]
\ No newline at end of file
+from .CSRGraph import CSRGraph
+from .CompactDirectedGraph import CompactDirectedGraph
+from .CompactGraph import CompactGraph
+from .DisjointSet import DisjointSet
+from .DynamicAdjacency import DynamicAdjacency
+from . import formats, generators, partition
+__all__ = ["Graph", "DirectedGraph", "CSRGraph", "CompactDirectedGraph", "CompactGraph", "DisjointSet", "DynamicAdjacency", "formats", "generators", "partition"]
\ No newline at end of file
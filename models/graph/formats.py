@@ -0,0 +1,142 @@
+import struct
+import typing
+from array import array
+from .DirectedGraph import DirectedGraph
+from .Graph import Graph
+
+# readers and writers for three formats:
+#
+#   edge list   one "source target" pair per line; a line holding a single
+#               node records a node with no edges
+#   adjacency   one "node: neighbor neighbor ..." line per node
+#   binary      BINARY_MAGIC, a directed flag and the node and edge counts
+#               (little-endian uint64s), then the edges as pairs of native
+#               int64 node positions
+#
+# in the text formats lines starting with '#' are comments. an undirected
+# Graph writes each edge once; either kind of graph can read either.
+# readers work line by line (or chunk by chunk), adding to the graph as
+# they go, and can add to an existing graph
+
+BINARY_MAGIC = b'NGEDGES1'
+CHUNK_SIZE = 1 << 16
+
+def _is_directed(graph) -> bool:
+	return not isinstance(graph, Graph)
+
+def _edges(graph) -> typing.Iterator[tuple]:
+	# every edge once, treating a Graph's two directions as one edge
+	directed = _is_directed(graph)
+	done = set()
+	for node in graph.nodes:
+		for adjacent in graph.edges[node]:
+			if directed or adjacent not in done:
+				yield node, adjacent
+		if not directed:
+			done.add(node)
+
+def _lines(f) -> typing.Iterator[str]:
+	for line in f:
+		line = line.strip()
+		if line and not line.startswith('#'):
+			yield line
+
+def write_edgelist(graph: DirectedGraph, f: typing.TextIO) -> None:
+	for node in graph.nodes:
+		if not graph.edges[node]:
+			f.write(f'{node}\n')
+	for source, target in _edges(graph):
+		f.write(f'{source} {target}\n')
+
+def edge_pairs(f: typing.TextIO, nodetype: typing.Callable[[str], typing.Any]=int) -> typing.Iterator[tuple]:
+	# the edges of an edge list, one pair at a time, without building a
+	# graph; lines naming a single node are skipped
+	for line in _lines(f):
+		fields = line.split()
+		if len(fields) > 1:
+			yield nodetype(fields[0]), nodetype(fields[1])
+
+def read_edgelist(
+	f: typing.TextIO,
+	graph_cls: type=Graph,
+	nodetype: typing.Callable[[str], typing.Any]=int,
+	graph: DirectedGraph=None,
+) -> DirectedGraph:
+	graph = graph_cls([]) if graph is None else graph
+	for line in _lines(f):
+		fields = line.split()
+		source = nodetype(fields[0])
+		graph.add_node(source)
+		if len(fields) > 1:
+			target = nodetype(fields[1])
+			graph.add_node(target)
+			graph.add_edge(source, target)
+	return graph
+
+def write_adjacency(graph: DirectedGraph, f: typing.TextIO) -> None:
+	for node in graph.nodes:
+		f.write(f'{node}: ' + ' '.join(str(adjacent) for adjacent in graph.edges[node]) + '\n')
+
+def read_adjacency(
+	f: typing.TextIO,
+	graph_cls: type=Graph,
+	nodetype: typing.Callable[[str], typing.Any]=int,
+	graph: DirectedGraph=None,
+) -> DirectedGraph:
+	graph = graph_cls([]) if graph is None else graph
+	for line in _lines(f):
+		node, _, adjacencies = line.partition(':')
+		node = nodetype(node.strip())
+		graph.add_node(node)
+		for adjacent in adjacencies.split():
+			adjacent = nodetype(adjacent)
+			graph.add_node(adjacent)
+			graph.add_edge(node, adjacent)
+	return graph
+
+def write_binary(graph: DirectedGraph, f: typing.BinaryIO, chunk_size: int=CHUNK_SIZE) -> None:
+	# nodes are written as their positions in graph.nodes, so give
+	# read_binary the same node list to get the original labels back
+	index = { node: i for i, node in enumerate(graph.nodes) }
+	f.write(BINARY_MAGIC)
+	f.write(struct.pack('<QQQ', _is_directed(graph), len(index), graph.num_edges()))
+	chunk = array('q')
+	for source, target in _edges(graph):
+		chunk.append(index[source])
+		chunk.append(index[target])
+		if len(chunk) >= 2*chunk_size:
+			chunk.tofile(f)
+			del chunk[:]
+	chunk.tofile(f)
+
+def read_binary(
+	f: typing.BinaryIO,
+	graph_cls: type=None,
+	nodes: list=None,
+	chunk_size: int=CHUNK_SIZE,
+) -> DirectedGraph:
+	if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+		raise ValueError('not a binary edge file')
+	directed, num_nodes, num_edges = struct.unpack('<QQQ', f.read(24))
+	if graph_cls is None:
+		graph_cls = DirectedGraph if directed else Graph
+	nodes = list(range(num_nodes)) if nodes is None else list(nodes)
+	if len(nodes) != num_nodes:
+		raise ValueError(f'file has {num_nodes} nodes but {len(nodes)} were given')
+
+	graph = graph_cls(nodes)
+	remaining = num_edges
+	while remaining:
+		count = min(remaining, chunk_size)
+		chunk = array('q')
+		chunk.fromfile(f, 2*count)
+		for k in range(0, 2*count, 2):
+			graph.add_edge(nodes[chunk[k]], nodes[chunk[k+1]])
+		remaining -= count
+	return graph
+
+__all__ = [
+	'write_edgelist', 'read_edgelist', 'edge_pairs',
+	'write_adjacency', 'read_adjacency',
+	'write_binary', 'read_binary',
+]
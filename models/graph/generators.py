@@ -0,0 +1,110 @@
+import typing, random
+from array import array
+from .Graph import Graph
+from ..rng import stream
+
+T = typing.TypeVar('T')
+
+# structured topologies, built in time linear in the number of edges. each
+# generator works out its edges over node positions 0..n-1 and hands them
+# to the graph in a single add_edges call, so any Graph subclass (such as
+# CompactGraph) can be used as the backend
+
+def _lattice_pairs(n: int, k: int) -> typing.Iterator[tuple[int, int]]:
+	# every position joined to the k//2 nearest on either side around a
+	# ring, and for odd k also to the position directly across
+	for j in range(1, k//2 + 1):
+		for i in range(n):
+			yield i, (i+j) % n
+	if k % 2:
+		for i in range(n//2):
+			yield i, i + n//2
+
+def _check_lattice(n: int, k: int) -> None:
+	if not 0 <= k < n:
+		raise ValueError(f'k must be between 0 and {n-1} for {n} nodes (got {k})')
+	if k % 2 and n % 2:
+		raise ValueError('an odd k needs an even number of nodes')
+
+def ring_lattice(nodes: list[T], k: int, graph_cls=Graph) -> Graph:
+	# the k-regular ring lattice
+	nodes = list(nodes)
+	_check_lattice(len(nodes), k)
+	graph = graph_cls(nodes)
+	graph.add_edges((nodes[i], nodes[j]) for i, j in _lattice_pairs(len(nodes), k))
+	return graph
+
+def watts_strogatz(nodes: list[T], k: int, p: float, graph_cls=Graph, rng: random.Random=None) -> Graph:
+	# a ring lattice where each edge, with probability p, keeps one end and
+	# has the other moved to a uniformly random node (never making a loop
+	# or a duplicate edge). edges are held as pair numbers i*n + j, i < j,
+	# while rewiring, so membership tests don't need a graph
+	nodes = list(nodes)
+	n = len(nodes)
+	_check_lattice(n, k)
+	rng = stream(rng)
+
+	def key(i: int, j: int) -> int:
+		return i*n + j if i < j else j*n + i
+
+	present = dict.fromkeys(key(i, j) for i, j in _lattice_pairs(n, k))
+	degrees = array('l', [ k ]) * n
+	for i, j in list(_lattice_pairs(n, k)):
+		if rng.random() >= p or degrees[i] >= n-1:
+			continue
+		target = rng.randrange(n)
+		while target == i or key(i, target) in present:
+			target = rng.randrange(n)
+		del present[key(i, j)]
+		present[key(i, target)] = None
+		degrees[j] -= 1
+		degrees[target] += 1
+
+	graph = graph_cls(nodes)
+	graph.add_edges((nodes[pair // n], nodes[pair % n]) for pair in present)
+	return graph
+
+def barabasi_albert(nodes: list[T], m: int, graph_cls=Graph, rng: random.Random=None) -> Graph:
+	# preferential attachment: nodes arrive in order, each joining m
+	# distinct earlier nodes chosen with odds proportional to their degree.
+	# every edge appends both of its ends to a flat array, so a uniform draw
+	# from the array is a degree-weighted draw of a node
+	nodes = list(nodes)
+	n = len(nodes)
+	if not 1 <= m < max(n, 2):
+		raise ValueError(f'm must be between 1 and {n-1} for {n} nodes (got {m})')
+
+	rng = stream(rng)
+	# the first arrival joins all of the m starting nodes
+	ends = array('q')
+	pairs = array('q')
+	for i in range(m, n):
+		if i == m:
+			targets = range(m)
+		else:
+			targets = set()
+			while len(targets) < m:
+				targets.add(ends[rng.randrange(len(ends))])
+			targets = sorted(targets)
+		for j in targets:
+			pairs.append(i)
+			pairs.append(j)
+			ends.append(i)
+			ends.append(j)
+
+	graph = graph_cls(nodes)
+	graph.add_edges(
+		(nodes[pairs[e]], nodes[pairs[e+1]]) for e in range(0, len(pairs), 2)
+	)
+	return graph
+
+GENERATORS = {
+	'ring_lattice': ring_lattice,
+	'watts_strogatz': watts_strogatz,
+	'barabasi_albert': barabasi_albert,
+}
+
+# the generators that draw nothing, and so take no rng
+DETERMINISTIC = frozenset([ ring_lattice ])
+
+__all__ = ['ring_lattice', 'watts_strogatz', 'barabasi_albert', 'GENERATORS', 'DETERMINISTIC']
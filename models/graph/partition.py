@@ -0,0 +1,194 @@
+import typing, random
+from array import array
+from collections import deque
+from ..rng import stream
+from . import formats
+
+T = typing.TypeVar('T')
+
+# splitting a graph between workers. each part gets the nodes it owns,
+# numbered 0..k-1, plus a ghost for every node elsewhere that one of them is
+# adjacent to, numbered from k on; adjacency is stored per part in CSR form
+# over those local numbers. a ghost records which part owns the node and
+# the node's number there, which is all a message to it needs.
+#
+# split() cuts up a graph that's already in memory. for one that isn't,
+# build_part() makes a single part from a stream of edges over node
+# positions 0..n-1, keeping only what touches the part, so each worker can
+# build its own without anyone holding the whole graph
+
+def bfs_partition(graph, parts: int, rng: random.Random=None) -> dict[T, int]:
+	# grows the parts one at a time, breadth first from a random unassigned
+	# node, until each holds its share of the nodes. neighbors tend to land
+	# in the same part, so few edges cross between parts
+	if parts < 1:
+		raise ValueError('need at least one part')
+	rng = stream(rng)
+	nodes = list(graph.nodes)
+	position = { node: i for i, node in enumerate(nodes) }
+	order = nodes[:]
+	rng.shuffle(order)
+	seeds = iter(order)
+	assignment: dict[T, int] = dict()
+
+	for part in range(parts):
+		quota = len(nodes)*(part+1) // parts - len(nodes)*part // parts
+		frontier = deque()
+		while quota:
+			if not frontier:
+				seed = next(seeds)
+				while seed in assignment:
+					seed = next(seeds)
+				assignment[seed] = part
+				quota -= 1
+				frontier.append(seed)
+				continue
+			# in the graph's order rather than set order, so the parts don't
+			# depend on how nodes hash
+			for adjacent in sorted(graph.edges[frontier.popleft()], key=position.__getitem__):
+				if quota and adjacent not in assignment:
+					assignment[adjacent] = part
+					quota -= 1
+					frontier.append(adjacent)
+	return assignment
+
+def block_partition(n: int, parts: int) -> array:
+	# the part of each position: contiguous, equal ranges. for graphs whose
+	# numbering follows their layout (lattices, small worlds, most
+	# generated or spatial networks) most edges stay inside a range
+	if parts < 1:
+		raise ValueError('need at least one part')
+	return array('i', [ v*parts // n for v in range(n) ])
+
+def edge_cut(graph, assignment: dict[T, int]) -> int:
+	# how many edges join nodes in different parts
+	return sum(
+		1
+		for node in graph.nodes
+		for adjacent in graph.edges[node]
+		if assignment[node] != assignment[adjacent]
+	) // 2
+
+class Partition(typing.Generic[T]):
+	def __init__(self, part: int, nodes: list[T]):
+		self.part = part
+		self.nodes: list[T] = nodes
+		self.ghosts: list[T] = list()
+		self.ghost_parts = array('q')
+		self.ghost_ids = array('q')
+		self.offsets = array('q', [ 0 ])
+		self.neighbors = array('q')
+
+	def __str__(self) -> str:
+		return f'<#Partition {self.part} nodes={len(self.nodes)} ghosts={len(self.ghosts)}>'
+
+	def num_nodes(self) -> int:
+		return len(self.nodes)
+
+	def is_ghost(self, local: int) -> bool:
+		return local >= len(self.nodes)
+
+	def owner(self, local: int) -> tuple[int, int]:
+		# (part, number in that part) of a ghost
+		g = local - len(self.nodes)
+		return self.ghost_parts[g], self.ghost_ids[g]
+
+	def degree(self, i: int) -> int:
+		return self.offsets[i+1] - self.offsets[i]
+
+	def adjacent(self, i: int) -> list[int]:
+		return self.neighbors[self.offsets[i]:self.offsets[i+1]].tolist()
+
+def split(graph, assignment: dict[T, int], parts: int) -> list[Partition]:
+	# the parts, each with its nodes in the graph's order
+	partitions = [ Partition(part, list()) for part in range(parts) ]
+	position = { node: i for i, node in enumerate(graph.nodes) }
+	local: dict[T, int] = dict()
+	for node in graph.nodes:
+		partition = partitions[assignment[node]]
+		local[node] = len(partition.nodes)
+		partition.nodes.append(node)
+
+	for partition in partitions:
+		ghosts: dict[T, int] = dict()
+		k = len(partition.nodes)
+		for node in partition.nodes:
+			row = list()
+			for adjacent in sorted(graph.edges[node], key=position.__getitem__):
+				if assignment[adjacent] == partition.part:
+					row.append(local[adjacent])
+					continue
+				if adjacent not in ghosts:
+					ghosts[adjacent] = k + len(partition.ghosts)
+					partition.ghosts.append(adjacent)
+					partition.ghost_parts.append(assignment[adjacent])
+					partition.ghost_ids.append(local[adjacent])
+				row.append(ghosts[adjacent])
+			partition.neighbors.extend(sorted(row))
+			partition.offsets.append(len(partition.neighbors))
+	return partitions
+
+def build_part(part: int, assignment: array, edges: typing.Callable[[], typing.Iterable[tuple[int, int]]]) -> Partition:
+	# part's Partition, from assignment (the part of every position) and
+	# edges(), which yields every edge as a pair of positions, in either
+	# direction, at least once. its nodes are positions, in order; ghosts
+	# are numbered in order of position too
+	nodes = [ v for v, owner in enumerate(assignment) if owner == part ]
+	local = { v: i for i, v in enumerate(nodes) }
+	rows: list[set[int]] = [ set() for v in nodes ]
+	for u, v in edges():
+		if u == v:
+			continue
+		if u in local:
+			rows[local[u]].add(v)
+		if v in local:
+			rows[local[v]].add(u)
+
+	partition = Partition(part, nodes)
+	k = len(nodes)
+	partition.ghosts = sorted({ v for row in rows for v in row if v not in local })
+	ghost_local = { v: k+g for g, v in enumerate(partition.ghosts) }
+	# a ghost's number in its own part is how many of that part's nodes
+	# come before it
+	counts = dict()
+	for v, owner in enumerate(assignment):
+		if v in ghost_local:
+			partition.ghost_parts.append(owner)
+			partition.ghost_ids.append(counts.get(owner, 0))
+		counts[owner] = counts.get(owner, 0) + 1
+	for row in rows:
+		partition.neighbors.extend(sorted(local[v] if v in local else ghost_local[v] for v in row))
+		partition.offsets.append(len(partition.neighbors))
+	return partition
+
+# edge sources for build_part: callables yielding position pairs, which can
+# be sent to a worker process
+
+class EdgeListFile:
+	# an edge list file over positions, read afresh by each caller
+	def __init__(self, path: str):
+		self.path = path
+
+	def __repr__(self) -> str:
+		return f'EdgeListFile({self.path!r})'
+
+	def __call__(self) -> typing.Iterator[tuple[int, int]]:
+		with open(self.path) as f:
+			yield from formats.edge_pairs(f)
+
+class CSREdges:
+	# the edges of a CSRGraph over its positions, without its nodes
+	def __init__(self, csr):
+		self.offsets = csr.offsets
+		self.neighbors = csr.neighbors
+
+	def __call__(self) -> typing.Iterator[tuple[int, int]]:
+		offsets, neighbors = self.offsets, self.neighbors
+		for i in range(len(offsets)-1):
+			for k in range(offsets[i], offsets[i+1]):
+				yield i, neighbors[k]
+
+__all__ = [
+	'bfs_partition', 'block_partition', 'edge_cut', 'Partition', 'split',
+	'build_part', 'EdgeListFile', 'CSREdges',
+]
@@ -0,0 +1,162 @@
+import collections
+import functools
+import random
+import time
+import typing
+from . import rng
+from .Agent import Agent
+from .AgentPopulation import AgentPopulation
+from .AgentNetwork import AgentNetwork
+from .graph import DirectedGraph, Graph, CompactDirectedGraph, CSRGraph
+
+# hooks run around an instrumented call to gather game statistics. a
+# `before` hook sees the call's arguments, an `after` hook also its result
+
+def _agent_speaks(profiler, args) -> None:
+	profiler.interactions+=1
+	profiler.inventory_total += len(args[0].word_ids)
+
+def _population_speaks(profiler, args) -> None:
+	population, speaker = args[0], args[1]
+	profiler.interactions+=1
+	profiler.inventory_total += population.length[speaker]
+
+def _population_played(profiler, args, result) -> None:
+	successes, spoken = result
+	profiler.interactions += len(args[1])
+	profiler.successes += successes
+	profiler.failures += len(args[1]) - successes
+	profiler.inventory_total += spoken
+
+def _heard(profiler, args, result) -> None:
+	if result:
+		profiler.successes+=1
+	else:
+		profiler.failures+=1
+
+# (owner, attribute, before hook, after hook). draws are counted on
+# random.Random, which every stream is, the random module's own included;
+# the module's functions are bound before profiling starts, but nothing
+# calls them anymore
+HOT_PATHS = [
+	(random.Random, 'random', None, None),
+	(random.Random, 'randrange', None, None),
+	(random.Random, 'choice', None, None),
+	(random.Random, 'choices', None, None),
+	(rng, 'indices', None, None),
+	(rng, 'uniforms', None, None),
+	(Agent, 'tell', _agent_speaks, None),
+	(Agent, 'hear', None, _heard),
+	(AgentPopulation, 'tell', _population_speaks, None),
+	(AgentPopulation, 'hear', None, _heard),
+	(AgentPopulation, 'play', None, _population_played),
+	(AgentNetwork, 'random_neighbor', None, None),
+	(CSRGraph, 'random_neighbor_index', None, None),
+	(DirectedGraph, 'adjacent_nodes', None, None),
+	(DirectedGraph, 'has_edge', None, None),
+	(DirectedGraph, 'add_edge', None, None),
+	(DirectedGraph, '_DirectedGraph__validate_all_nodes', None, None),
+	(Graph, 'add_edge', None, None),
+	(CompactDirectedGraph, 'has_edge', None, None),
+	(CompactDirectedGraph, 'add_edge', None, None),
+	(CompactDirectedGraph, 'adjacent_nodes', None, None),
+]
+
+def _label(owner, attribute: str) -> str:
+	owner = owner.__name__.rpartition('.')[2]
+	return f'{owner}.{attribute.rpartition("__")[2] or attribute}'
+
+class ProfileReport(typing.NamedTuple):
+	interactions: int
+	successes: int
+	failures: int
+	mean_inventory: float
+	calls: dict[str, int]
+	seconds: dict[str, float]
+
+	def __str__(self) -> str:
+		lines = [
+			f'interactions: {self.interactions} '
+			f'(successes {self.successes}, failures {self.failures}, '
+			f'mean speaker inventory {self.mean_inventory:.2f})'
+		]
+		for label in sorted(self.calls, key=lambda label: -self.seconds[label]):
+			lines.append(f'  {label:<36} {self.calls[label]:>10} calls {self.seconds[label]:>10.4f}s')
+		return '\n'.join(lines)
+
+class Profiler:
+	# counts calls to, and time spent in, the hot paths in HOT_PATHS while
+	# enabled. enabling swaps instrumented wrappers onto the classes and
+	# modules, and disabling puts the originals back, so nothing is
+	# paid when profiling is off. times include nested instrumented calls
+	def __init__(self, hot_paths: list[tuple]=HOT_PATHS):
+		self.hot_paths = hot_paths
+		self.calls: collections.Counter = collections.Counter()
+		self.seconds: collections.defaultdict = collections.defaultdict(float)
+		self.interactions = 0
+		self.successes = 0
+		self.failures = 0
+		self.inventory_total = 0
+		self._originals = list()
+
+	def __enter__(self):
+		self.enable()
+		return self
+
+	def __exit__(self, *args):
+		self.disable()
+
+	def enabled(self) -> bool:
+		return bool(self._originals)
+
+	def enable(self) -> None:
+		if self.enabled():
+			return
+		for owner, attribute, before, after in self.hot_paths:
+			original = fn = getattr(owner, attribute)
+			if isinstance(owner, type):
+				# None for a method the class inherits (random.Random.random
+				# comes from the C base class), which is deleted again rather
+				# than put back
+				original = owner.__dict__.get(attribute)
+				fn = fn if original is None else original
+			self._originals.append((owner, attribute, original))
+			setattr(owner, attribute, self.__wrap(_label(owner, attribute), fn, before, after))
+
+	def disable(self) -> None:
+		while self._originals:
+			owner, attribute, original = self._originals.pop()
+			if original is None:
+				delattr(owner, attribute)
+			else:
+				setattr(owner, attribute, original)
+
+	def __wrap(self, label: str, fn, before, after):
+		calls = self.calls
+		seconds = self.seconds
+		clock = time.perf_counter
+
+		@functools.wraps(fn)
+		def instrumented(*args, **kwargs):
+			if before is not None:
+				before(self, args)
+			start = clock()
+			result = fn(*args, **kwargs)
+			seconds[label] += clock() - start
+			calls[label] += 1
+			if after is not None:
+				after(self, args, result)
+			return result
+		return instrumented
+
+	def report(self) -> ProfileReport:
+		return ProfileReport(
+			self.interactions,
+			self.successes,
+			self.failures,
+			self.inventory_total / self.interactions if self.interactions else 0.0,
+			dict(self.calls),
+			dict(self.seconds),
+		)
+
+__all__ = ['Profiler', 'ProfileReport', 'HOT_PATHS']
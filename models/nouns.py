@@ -1,4 +1,5 @@
 import random
+from .rng import stream
 nouns = list(x.upper() for x in [ 
 	"time", "way", "year", "work", "government",
 	"day", "man", "world", "life", "part", "house", "course", "case", "system",
@@ -139,7 +140,39 @@ nouns = list(x.upper() for x in [
 	"limit", "championship"
 ])
 
-def random_noun():
-	return random.choice(nouns)
+class Vocabulary:
+	# interns words to small integer ids, so agents can store and compare
+	# ids and only turn them back into strings for display
+	def __init__(self, words: list[str]=[]):
+		self.words: list[str] = list()
+		self.ids: dict[str, int] = dict()
+		for word in words:
+			self.intern(word)
 
-__all__ = ['random_noun']
\ No newline at end of file
+	def __len__(self) -> int:
+		return len(self.words)
+
+	def intern(self, word: str) -> int:
+		word_id = self.ids.get(word)
+		if word_id is None:
+			word_id = len(self.words)
+			self.ids[word] = word_id
+			self.words.append(word)
+		return word_id
+
+	def word(self, word_id: int) -> str:
+		return self.words[word_id]
+
+vocabulary = Vocabulary(nouns)
+
+# the id of each entry of nouns, repeats included, so drawing from this
+# keeps the same odds as drawing from nouns itself
+noun_ids = [ vocabulary.intern(noun) for noun in nouns ]
+
+def random_noun(rng: random.Random=None):
+	return stream(rng).choice(nouns)
+
+def random_noun_id(rng: random.Random=None) -> int:
+	return stream(rng).choice(noun_ids)
+
+__all__ = ['random_noun', 'random_noun_id', 'Vocabulary', 'vocabulary', 'noun_ids']
\ No newline at end of file
@@ -0,0 +1,44 @@
+import hashlib
+import random
+from array import array
+
+# everything that draws random numbers takes an optional rng: any
+# random.Random. left as None, draws come from the random module's own
+# generator, so random.seed() still decides a run that doesn't ask for
+# anything else. games keep their stream in game.rng and pass it down
+
+def stream(rng: random.Random=None) -> random.Random:
+	# the random module's functions are bound methods of this instance
+	return random._inst if rng is None else rng
+
+class RandomStream(random.Random):
+	# an independent seedable stream. children are derived from the seed and
+	# a key rather than drawn from the stream, so spawn(k) is the same stream
+	# however many others were spawned or used before it, in whichever
+	# process asks for it
+	def __init__(self, seed: int=None):
+		if seed is None:
+			seed = random.getrandbits(64)
+		self.origin = seed
+		super().__init__(seed)
+
+	def __repr__(self) -> str:
+		return f'<#RandomStream origin={self.origin}>'
+
+	def spawn(self, key) -> 'RandomStream':
+		digest = hashlib.sha256(f'{self.origin}:{key}'.encode()).digest()
+		return RandomStream(int.from_bytes(digest[:8], 'big'))
+
+# bulk draws, for loops that would otherwise make a call per draw. they
+# use the same floor(random()*n) that random.choices does
+
+def indices(rng: random.Random, n: int, k: int) -> array:
+	# k positions drawn uniformly from range(n)
+	r = rng.random
+	return array('q', [ int(r()*n) for i in range(k) ])
+
+def uniforms(rng: random.Random, k: int) -> array:
+	r = rng.random
+	return array('d', [ r() for i in range(k) ])
+
+__all__ = ['stream', 'RandomStream', 'indices', 'uniforms']
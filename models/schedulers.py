@@ -0,0 +1,355 @@
+import abc
+import heapq
+import math
+import random
+import typing
+from . import nouns
+
+# a scheduler decides who speaks during one iteration of a game. games
+# provide sweep() (everyone speaks once, in order), random_hearer(speaker)
+# (a position, or None if the speaker has nobody to talk to),
+# interact(speaker, hearer) and settled_word(i), and keep the stream
+# every draw comes from in game.rng. games whose agents come and go tell
+# their scheduler: added(game, i) when an agent joins at position i (the
+# end), removed(game, i, last) when the agent at i leaves and the one at
+# position last moves into its place.
+#
+# snapshots save a scheduler as its settings() (keyword arguments for its
+# constructor, or None if they can't be written as JSON) and its state(game),
+# whatever it has drawn that the game's next round depends on, which
+# restore(game, state) puts back
+
+class Scheduler(abc.ABC):
+	@abc.abstractmethod
+	def run(self, game) -> None:
+		pass
+
+	def added(self, game, i: int) -> None:
+		pass
+
+	def removed(self, game, i: int, last: int) -> None:
+		pass
+
+	def settings(self) -> dict:
+		return dict()
+
+	def state(self, game) -> dict:
+		return None
+
+	def restore(self, game, state: dict) -> None:
+		pass
+
+class SynchronousSweep(Scheduler):
+	# every agent speaks once per iteration, in order; the original game
+	def run(self, game) -> None:
+		game.sweep()
+
+class SequentialRandom(Scheduler):
+	# an iteration is num_agents interactions, each with a speaker drawn
+	# uniformly at random, so some agents speak several times and some not
+	# at all.
+	#
+	# with focus=True the interactions that can't change anything are never
+	# played: a speaker holding only the word w, heard by an agent holding
+	# only w. late in a game nearly every interaction is one of these, so
+	# instead each iteration draws how many of them there would have been
+	# and jumps straight to the interactions that matter. the game's
+	# dynamics are unchanged. this needs uniformly chosen hearers
+	def __init__(self, focus: bool=False):
+		self.focus = focus
+		self._state = None
+
+	def added(self, game, i: int) -> None:
+		# the settled state is indexed by position; it's rebuilt next time
+		self._state = None
+
+	def removed(self, game, i: int, last: int) -> None:
+		self._state = None
+
+	def settings(self) -> dict:
+		return { 'focus': self.focus }
+
+	def state(self, game) -> dict:
+		# which agent a draw picks depends on the order the settled state
+		# holds them in, which depends on how the game got there
+		if self._state is None or not self._state.tracks(game):
+			return None
+		return self._state.orders()
+
+	def restore(self, game, state: dict) -> None:
+		self._state = _SettledState(game, state)
+
+	def run(self, game) -> None:
+		if self.focus:
+			if not game.uniform_hearers:
+				raise ValueError('focused sampling needs a game with uniformly chosen hearers')
+			if self._state is None or not self._state.tracks(game):
+				self._state = _SettledState(game)
+			self._state.run()
+			return
+
+		n = game.num_agents()
+		for speaker in game.rng.choices(range(n), k=n):
+			hearer = game.random_hearer(speaker)
+			if hearer is not None:
+				game.interact(speaker, hearer)
+
+class ContinuousTime(Scheduler):
+	# each agent speaks at the ticks of its own Poisson clock, and an
+	# iteration is one unit of time. the next tick of every clock is kept
+	# in a priority queue. rates(i) gives agent i's rate (1 by default); an
+	# agent with rate 0 never speaks
+	def __init__(self, rates: typing.Callable[[int], float]=None):
+		self.rates = rates
+		self.game = None
+		self.queue = None
+		self.time = 0.0
+
+	def __rate(self, i: int) -> float:
+		return 1.0 if self.rates is None else self.rates(i)
+
+	def settings(self) -> dict:
+		# a rates function can't be saved
+		return dict() if self.rates is None else None
+
+	def state(self, game) -> dict:
+		if self.game is not game:
+			return None
+		return { 'time': self.time, 'queue': [ list(entry) for entry in self.queue ] }
+
+	def restore(self, game, state: dict) -> None:
+		self.game = game
+		self.time = state['time']
+		self.queue = [ tuple(entry) for entry in state['queue'] ]
+
+	def added(self, game, i: int) -> None:
+		# a new agent's clock starts now
+		if self.game is game:
+			rate = self.__rate(i)
+			if rate > 0:
+				heapq.heappush(self.queue, (self.time + game.rng.expovariate(rate), i))
+
+	def removed(self, game, i: int, last: int) -> None:
+		# the leaving agent's clock stops, and the moved agent's keeps
+		# running under its new position
+		if self.game is game:
+			self.queue = [ (time, i if j == last else j) for time, j in self.queue if j != i ]
+			heapq.heapify(self.queue)
+
+	def run(self, game) -> None:
+		if self.game is not game:
+			self.game = game
+			self.time = float(game.iteration)
+			self.queue = [
+				(self.time + game.rng.expovariate(rate), i)
+				for i, rate in ((i, self.__rate(i)) for i in range(game.num_agents()))
+				if rate > 0
+			]
+			heapq.heapify(self.queue)
+
+		horizon = self.time + 1.0
+		queue = self.queue
+		expovariate = game.rng.expovariate
+		while queue and queue[0][0] < horizon:
+			time, speaker = queue[0]
+			hearer = game.random_hearer(speaker)
+			if hearer is not None:
+				game.interact(speaker, hearer)
+			heapq.heapreplace(queue, (time + expovariate(self.__rate(speaker)), speaker))
+		self.time = horizon
+
+class _IndexedSet:
+	# a set that can also hand out a uniformly random member in O(1)
+	def __init__(self):
+		self.items = list()
+		self.positions = dict()
+
+	def __len__(self) -> int:
+		return len(self.items)
+
+	def __getitem__(self, i: int):
+		return self.items[i]
+
+	def add(self, item) -> None:
+		self.positions[item] = len(self.items)
+		self.items.append(item)
+
+	def remove(self, item) -> None:
+		i = self.positions.pop(item)
+		last = self.items.pop()
+		if i < len(self.items):
+			self.items[i] = last
+			self.positions[last] = i
+
+	def choice(self, rng: random.Random):
+		return self.items[rng.randrange(len(self.items))]
+
+class _FenwickTree:
+	# prefix sums over integer weights, with O(log n) updates and lookups
+	def __init__(self, size: int):
+		self.size = size
+		self.tree = [ 0 ] * (size+1)
+
+	def add(self, i: int, delta: int) -> None:
+		i+=1
+		while i <= self.size:
+			self.tree[i] += delta
+			i += i & -i
+
+	def prefix(self, i: int) -> int:
+		# sum of the weights at positions 0..i-1
+		total = 0
+		while i > 0:
+			total += self.tree[i]
+			i -= i & -i
+		return total
+
+	def find(self, r: int) -> int:
+		# the position whose weight covers r, counting from 0 at position 0
+		position = 0
+		step = 1 << self.size.bit_length()
+		while step:
+			if position+step <= self.size and self.tree[position+step] <= r:
+				position += step
+				r -= self.tree[position]
+			step >>= 1
+		return position
+
+class _SettledState:
+	# which agents hold a single word (and which word), kept in step with a
+	# game so SequentialRandom(focus=True) can sample the interactions that
+	# aren't no-ops directly. with n agents, c_w of them holding only w:
+	#
+	#   an active speaker (more than one word) with any hearer: n*active
+	#   a speaker holding only w with a hearer that doesn't:    c_w*(n-c_w)
+	#
+	# out of n*n equally likely (speaker, hearer) pairs, which leaves
+	# n*n - sum(c_w**2) pairs that matter
+	def __init__(self, game, orders: dict=None):
+		self.game = game
+		self.rng = game.rng
+		self.iteration = game.iteration
+		self.n = game.num_agents()
+		self.active = _IndexedSet()
+		self.settled: dict[int, _IndexedSet] = dict()
+		self.count: dict[int, int] = dict()
+		self.squares = 0
+		self.state = [ None ] * self.n
+		self.__build_trees(len(nouns.vocabulary))
+		if orders is None:
+			for i in range(self.n):
+				self.__place(i, game.settled_word(i))
+		else:
+			# in the order a saved game held them
+			for i in orders['active']:
+				self.__place(i, None)
+			for agents in orders['settled']:
+				for i in agents:
+					self.__place(i, game.settled_word(i))
+
+	def orders(self) -> dict:
+		return {
+			'active': list(self.active.items),
+			'settled': [ list(agents.items) for agents in self.settled.values() if len(agents) ],
+		}
+
+	def tracks(self, game) -> bool:
+		# false if the game has been played some other way since
+		return game is self.game and game.iteration == self.iteration
+
+	def __build_trees(self, size: int) -> None:
+		n = self.n
+		self.counts = _FenwickTree(size)
+		self.weights = _FenwickTree(size)
+		for word, c in self.count.items():
+			self.counts.add(word, c)
+			self.weights.add(word, c*(n-c))
+
+	def __tally(self, word: int, delta: int) -> None:
+		if word >= self.counts.size:
+			self.__build_trees(max(2*self.counts.size, word+1))
+		n = self.n
+		c = self.count.get(word, 0)
+		new = c+delta
+		if new:
+			self.count[word] = new
+		else:
+			del self.count[word]
+		self.counts.add(word, delta)
+		self.weights.add(word, new*(n-new) - c*(n-c))
+		self.squares += new*new - c*c
+
+	def __place(self, i: int, word) -> None:
+		self.state[i] = word
+		if word is None:
+			self.active.add(i)
+		else:
+			self.settled.setdefault(word, _IndexedSet()).add(i)
+			self.__tally(word, 1)
+
+	def __unplace(self, i: int) -> None:
+		word = self.state[i]
+		if word is None:
+			self.active.remove(i)
+		else:
+			self.settled[word].remove(i)
+			self.__tally(word, -1)
+
+	def __update(self, i: int) -> None:
+		word = self.game.settled_word(i)
+		if word != self.state[i]:
+			self.__unplace(i)
+			self.__place(i, word)
+
+	def __draw(self, total: int) -> tuple[int, int]:
+		n = self.n
+		rng = self.rng
+		active = self.active
+		r = rng.randrange(total)
+		if r < n*len(active):
+			return active.choice(rng), rng.randrange(n)
+
+		word = self.weights.find(r - n*len(active))
+		speaker = self.settled[word].choice(rng)
+
+		# the hearer is uniform over agents not holding only `word`: either
+		# an active agent, or one settled on some other word
+		c = self.count[word]
+		r = rng.randrange(n - c)
+		if r < len(active):
+			return speaker, active[r]
+		r -= len(active)
+		if r >= self.counts.prefix(word):
+			r += c
+		return speaker, self.settled[self.counts.find(r)].choice(rng)
+
+	def run(self) -> None:
+		n = self.n
+		remaining = n
+		while True:
+			total = n*n - self.squares
+			if not total:
+				# everyone holds the same single word
+				break
+
+			# the number of no-ops before the next interaction that matters
+			# is geometric; past the end of the iteration, forget it (the
+			# draw is memoryless) and let the next iteration redraw
+			p = total / (n*n)
+			skip = 0 if p >= 1.0 else int(math.log(1.0 - self.rng.random()) / math.log(1.0 - p))
+			if skip >= remaining:
+				break
+			remaining -= skip+1
+
+			speaker, hearer = self.__draw(total)
+			self.game.interact(speaker, hearer)
+			self.__update(speaker)
+			if hearer != speaker:
+				self.__update(hearer)
+		self.iteration = self.game.iteration + 1
+
+SCHEDULERS = {
+	cls.__name__: cls for cls in (SynchronousSweep, SequentialRandom, ContinuousTime)
+}
+
+__all__ = ['Scheduler', 'SynchronousSweep', 'SequentialRandom', 'ContinuousTime', 'SCHEDULERS']
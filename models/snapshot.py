@@ -0,0 +1,191 @@
+import json
+import mmap
+import os
+import random
+import struct
+from array import array
+from . import nouns
+from .rng import RandomStream
+from .Agent import Agent
+from .AgentNetwork import AgentNetwork
+from .AgentPopulation import AgentPopulation
+from .NamingGame import NamingGame
+from .NetworkNamingGame import NetworkNamingGame
+from .VectorNamingGame import VectorNamingGame
+from .graph import Graph
+from .schedulers import SCHEDULERS
+
+# layout: MAGIC, the header length as a little-endian uint64, a JSON header
+# padded to a multiple of 8 bytes, then each section as raw native int64s.
+# the header records every section's byte offset and length, so a section
+# can be viewed straight out of a memory map without reading the rest
+MAGIC = b'NGSNAP01'
+TYPECODE = 'q'
+
+GAMES = {
+	cls.__name__: cls for cls in (NamingGame, VectorNamingGame, NetworkNamingGame)
+}
+
+def _csr(rows) -> tuple[array, array]:
+	offsets = array(TYPECODE, [ 0 ])
+	values = array(TYPECODE)
+	for row in rows:
+		values.extend(row)
+		offsets.append(len(values))
+	return offsets, values
+
+def save(game: NamingGame, path: str) -> None:
+	kind = type(game).__name__
+	if kind not in GAMES:
+		raise ValueError(f'cannot snapshot games of type {kind}')
+
+	sections = dict()
+	sections['inventory_offsets'], sections['inventory_words'] = _csr(
+		agent.word_ids for agent in game.agents
+	)
+	if isinstance(game, NetworkNamingGame):
+		neighbors = game.network.csr()
+		sections['adjacency_offsets'] = neighbors.offsets
+		sections['adjacency_neighbors'] = neighbors.neighbors
+
+	version, state, gauss_next = game.rng.getstate()
+	header = {
+		'kind': kind,
+		'iteration': game.iteration,
+		'num_agents': len(game.agents),
+		'rng_state': [ version, list(state), gauss_next ],
+		'vocabulary': nouns.vocabulary.words,
+		'scheduler': {
+			'kind': type(game.scheduler).__name__,
+			'settings': game.scheduler.settings(),
+			'state': game.scheduler.state(game),
+		},
+		'sections': dict(),
+	}
+	if isinstance(game, NetworkNamingGame) and game.network.dynamic:
+		# neighbor lists come back in agent order, not the order they'd
+		# been shuffled into by rewiring
+		header['dynamic'] = True
+
+	# section offsets depend on the header's size and the header holds the
+	# offsets, so recompute until they stop moving (a pass or two)
+	while True:
+		encoded = json.dumps(header).encode()
+		encoded += b' ' * (-len(encoded) % 8)
+		offset = len(MAGIC) + 8 + len(encoded)
+		placed = dict()
+		for name, values in sections.items():
+			placed[name] = [ offset, len(values) ]
+			offset += 8*len(values)
+		if placed == header['sections']:
+			break
+		header['sections'] = placed
+
+	with open(path, 'wb') as f:
+		f.write(MAGIC)
+		f.write(struct.pack('<Q', len(encoded)))
+		f.write(encoded)
+		for values in sections.values():
+			array(TYPECODE, values).tofile(f)
+
+class Snapshot:
+	# a memory-mapped view of a saved game: the header is parsed up front,
+	# but sections are only paged in as they're read
+	def __init__(self, path: str):
+		self._file = open(path, 'rb')
+		self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+		if self._map[:len(MAGIC)] != MAGIC:
+			self.close()
+			raise ValueError(f'{path} is not a naming game snapshot')
+		(length,) = struct.unpack_from('<Q', self._map, len(MAGIC))
+		start = len(MAGIC) + 8
+		self.header = json.loads(bytes(self._map[start:start+length]))
+		self.kind: str = self.header['kind']
+		self.iteration: int = self.header['iteration']
+		self.num_agents: int = self.header['num_agents']
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+	def close(self) -> None:
+		self._map.close()
+		self._file.close()
+
+	def has_section(self, name: str) -> bool:
+		return name in self.header['sections']
+
+	def section(self, name: str) -> memoryview:
+		offset, count = self.header['sections'][name]
+		return memoryview(self._map)[offset:offset+8*count].cast(TYPECODE)
+
+	def inventory(self, i: int) -> list[int]:
+		offsets = self.section('inventory_offsets')
+		return self.section('inventory_words')[offsets[i]:offsets[i+1]].tolist()
+
+	def neighbors(self, i: int) -> list[int]:
+		offsets = self.section('adjacency_offsets')
+		return self.section('adjacency_neighbors')[offsets[i]:offsets[i+1]].tolist()
+
+	def restore(self, restore_rng: bool=True, rng: random.Random=None, scheduler=None) -> NamingGame:
+		# the game draws from rng (a stream of its own by default, so the
+		# random module's generator is left alone), which is put back in the saved game's state if restore_rng is set.
+		# the saved scheduler is rebuilt unless one is given, which is needed
+		# when its settings couldn't be saved; either way, one of the saved
+		# kind picks up where the saved one left off
+
+		# snapshots from before schedulers were saved used the default
+		saved = self.header.get('scheduler')
+		if scheduler is None and saved is not None:
+			if saved['kind'] not in SCHEDULERS or saved['settings'] is None:
+				raise ValueError(f'the saved {saved["kind"]} scheduler has to be passed to restore')
+			scheduler = SCHEDULERS[saved['kind']](**saved['settings'])
+
+		if rng is None:
+			# seeded from the system, as RandomStream() would draw its seed
+			# from the random module
+			rng = RandomStream(int.from_bytes(os.urandom(8), 'big'))
+		# saved ids are mapped through the current vocabulary, which only
+		# matters if words were interned in a different order
+		remap = [ nouns.vocabulary.intern(word) for word in self.header['vocabulary'] ]
+		offsets = self.section('inventory_offsets')
+		words = self.section('inventory_words')
+		inventories = (
+			[ remap[word_id] for word_id in words[offsets[i]:offsets[i+1]] ]
+			for i in range(self.num_agents)
+		)
+
+		cls = GAMES[self.kind]
+		if cls is VectorNamingGame:
+			game = cls.from_agents(AgentPopulation(inventories), self.iteration, scheduler, rng)
+		else:
+			agents = [ Agent.from_word_ids(word_ids) for word_ids in inventories ]
+			if cls is NetworkNamingGame:
+				game = cls.from_network(self.__network(agents, rng), self.iteration, scheduler)
+			else:
+				game = cls.from_agents(agents, self.iteration, scheduler, rng)
+
+		if restore_rng:
+			version, state, gauss_next = self.header['rng_state']
+			game.rng.setstate((version, tuple(state), gauss_next))
+		if saved is not None and saved['state'] is not None and type(game.scheduler).__name__ == saved['kind']:
+			game.scheduler.restore(game, saved['state'])
+		return game
+
+	def __network(self, agents: list[Agent], rng: random.Random=None) -> AgentNetwork:
+		offsets = self.section('adjacency_offsets')
+		neighbors = self.section('adjacency_neighbors')
+		graph = Graph(agents)
+		for i, agent in enumerate(agents):
+			for j in neighbors[offsets[i]:offsets[i+1]]:
+				if j > i:
+					graph.add_edge(agent, agents[j])
+		return AgentNetwork.from_graph(agents, graph, self.header.get('dynamic', False), rng)
+
+def load(path: str, restore_rng: bool=True, rng: random.Random=None, scheduler=None) -> NamingGame:
+	with Snapshot(path) as snapshot:
+		return snapshot.restore(restore_rng, rng, scheduler)
+
+__all__ = ['save', 'load', 'Snapshot']
@@ -0,0 +1,194 @@
+import abc
+import math
+import typing
+from collections import deque
+from .Observation import Observation
+
+# conditions for stopping a game before it reaches consensus, for runs that
+# only need, say, the time to 90% agreement. each is a callable taking the
+# game's observation after every iteration and returning True once the game
+# should stop. observations come from the WordIndex's running counts, so
+# checking them costs nothing per agent; criteria that need history keep
+# their own running state, which reset() clears before the next game.
+# a criterion's repr keys cached sweep results, so it must name the
+# criterion and its settings and nothing else; by default it's built from
+# the attributes, and criteria with running state write their own
+
+class Criterion(abc.ABC):
+	def __repr__(self) -> str:
+		settings = ', '.join(f'{name}={value!r}' for name, value in vars(self).items())
+		return f'{type(self).__name__}({settings})'
+
+	@abc.abstractmethod
+	def __call__(self, observation: Observation) -> bool:
+		pass
+
+	def reset(self) -> None:
+		pass
+
+class Dominance(Criterion):
+	# the most common word is held by at least share of the agents
+	def __init__(self, share: float):
+		self.share = share
+
+	def __repr__(self) -> str:
+		return f'Dominance({self.share!r})'
+
+	def __call__(self, observation: Observation) -> bool:
+		return observation.dominant_share >= self.share
+
+class DistinctWords(Criterion):
+	# at most count different words are left in play
+	def __init__(self, count: int):
+		self.count = count
+
+	def __repr__(self) -> str:
+		return f'DistinctWords({self.count!r})'
+
+	def __call__(self, observation: Observation) -> bool:
+		return observation.num_words <= self.count
+
+class Budget(Criterion):
+	def __init__(self, iterations: int):
+		self.iterations = iterations
+
+	def __repr__(self) -> str:
+		return f'Budget({self.iterations!r})'
+
+	def __call__(self, observation: Observation) -> bool:
+		return observation.iteration >= self.iterations
+
+class Plateau(Criterion):
+	# window iterations have gone by without the dominant share rising by
+	# more than tolerance or the number of words falling
+	def __init__(self, window: int, tolerance: float=0.0):
+		self.window = window
+		self.tolerance = tolerance
+		self.reset()
+
+	def __repr__(self) -> str:
+		return f'Plateau({self.window!r}, {self.tolerance!r})'
+
+	def reset(self) -> None:
+		self.best_share = None
+		self.fewest_words = None
+		self.progress = None
+
+	def __call__(self, observation: Observation) -> bool:
+		if (
+			self.progress is None
+			or observation.dominant_share > self.best_share + self.tolerance
+			or observation.num_words < self.fewest_words
+		):
+			self.best_share = observation.dominant_share
+			self.fewest_words = observation.num_words
+			self.progress = observation.iteration
+			return False
+		return observation.iteration - self.progress >= self.window
+
+class AnyOf(Criterion):
+	def __init__(self, *criteria: Criterion):
+		self.criteria = criteria
+		# the criterion that stopped the game, if one has
+		self.fired = None
+
+	def __repr__(self) -> str:
+		return f'AnyOf({", ".join(map(repr, self.criteria))})'
+
+	def reset(self) -> None:
+		self.fired = None
+		for criterion in self.criteria:
+			criterion.reset()
+
+	def __call__(self, observation: Observation) -> bool:
+		# every criterion sees every observation, so stateful ones stay in
+		# step even after an earlier one has fired
+		for criterion in self.criteria:
+			if criterion(observation) and self.fired is None:
+				self.fired = criterion
+		return self.fired is not None
+
+def criterion(until: typing.Union[Criterion, typing.Iterable[Criterion]]) -> AnyOf:
+	# observe() and the ensembles take a single criterion or several, any of
+	# which stops the game. they get back an AnyOf either way, which also
+	# says which one fired
+	if until is None or isinstance(until, AnyOf):
+		return until
+	if isinstance(until, Criterion):
+		return AnyOf(until)
+	return AnyOf(*until)
+
+class ConsensusEstimator:
+	# extrapolates when a game will reach consensus. late in a game the
+	# dominant word spreads roughly logistically, so log((1-s)/s), for a
+	# dominant share s, falls about linearly; a least squares line through
+	# the last window observations is followed down to the point where less
+	# than one agent is left without the word. the line's sums are updated
+	# as observations come and go, so each one costs O(1). a rough guide,
+	# best once the dominant word has a clear majority
+	def __init__(self, num_agents: int, window: int=5):
+		self.num_agents = num_agents
+		self.window = window
+		self.reset()
+
+	def __str__(self) -> str:
+		return f'<#ConsensusEstimator points={len(self.points)} estimate={self.estimate()}>'
+
+	def reset(self) -> None:
+		self.points: deque[tuple[int, float]] = deque()
+		self.sums = [ 0.0 ] * 4
+		self.first = None
+		self.iteration = None
+		self.settled = False
+
+	def __call__(self, observation: Observation) -> None:
+		self.iteration = observation.iteration
+		self.settled = observation.num_words <= 1
+		if self.settled:
+			return
+		# a share of 0 or 1 (everyone holds the word, but some hold others
+		# too) is pulled in by half an agent, to keep the logarithm finite
+		margin = 0.5 / self.num_agents
+		share = min(max(observation.dominant_share, margin), 1 - margin)
+		# iterations are counted from the first point, to keep the sums small
+		if self.first is None:
+			self.first = observation.iteration
+		point = (observation.iteration - self.first, math.log((1-share) / share))
+		self.__add(point, 1)
+		self.points.append(point)
+		if len(self.points) > self.window:
+			self.__add(self.points.popleft(), -1)
+
+	def __add(self, point: tuple[int, float], sign: int) -> None:
+		x, y = point
+		self.sums[0] += sign*x
+		self.sums[1] += sign*y
+		self.sums[2] += sign*x*x
+		self.sums[3] += sign*x*y
+
+	def remaining(self) -> float:
+		# iterations left until consensus, or None while the trend isn't
+		# downward (or there are fewer than two points to draw it through)
+		if self.settled:
+			return 0.0
+		k = len(self.points)
+		if k < 2:
+			return None
+		sx, sy, sxx, sxy = self.sums
+		spread = k*sxx - sx*sx
+		if spread <= 0:
+			return None
+		slope = (k*sxy - sx*sy) / spread
+		if slope >= 0:
+			return None
+		intercept = (sy - slope*sx) / k
+		# where the line reaches a share of 1 - 1/num_agents
+		target = math.log(1 / (self.num_agents-1)) if self.num_agents > 1 else 0.0
+		return max(0.0, (target - intercept) / slope - self.points[-1][0])
+
+	def estimate(self) -> float:
+		# the iteration at which consensus is expected
+		remaining = self.remaining()
+		return None if remaining is None else self.iteration + remaining
+
+__all__ = ['Criterion', 'Dominance', 'DistinctWords', 'Budget', 'Plateau', 'AnyOf', 'criterion', 'ConsensusEstimator']
@@ -0,0 +1,164 @@
+import hashlib
+import itertools
+import json
+import os
+import typing
+from .ensemble import EnsembleConfig, ReplicaResult, replica_seed, run_tasks
+from . import stopping
+
+# parameter sweeps whose replicas are memoized on disk. a replica is fully
+# determined by its config, seed and iteration budget, plus the code that
+# plays it (and any stopping criterion), so results are stored under a
+# hash of these and a rerun of the same sweep only plays what isn't stored
+# yet
+
+_code_version = None
+
+def code_version() -> str:
+	# a hash of the models package's sources: editing the simulation code
+	# retires everything cached before the edit
+	global _code_version
+	if _code_version is None:
+		root = os.path.dirname(os.path.abspath(__file__))
+		digest = hashlib.sha256()
+		paths = sorted(
+			os.path.relpath(os.path.join(directory, name), root)
+			for directory, subdirectories, names in os.walk(root)
+			for name in names if name.endswith('.py')
+		)
+		for path in paths:
+			digest.update(path.encode()+b'\0')
+			with open(os.path.join(root, path), 'rb') as f:
+				digest.update(f.read()+b'\0')
+		_code_version = digest.hexdigest()
+	return _code_version
+
+def result_key(config: EnsembleConfig, seed: int, max_iterations: int, version: str, until=None) -> str:
+	# a stopping criterion is keyed by its repr, which names it and its
+	# settings; without one the key is what it was before criteria existed
+	fields = [ list(config), seed, max_iterations, version ]
+	if until is not None:
+		fields.append(repr(stopping.criterion(until)))
+	key = json.dumps(fields)
+	return hashlib.sha256(key.encode()).hexdigest()
+
+class ResultCache:
+	# one small JSON file per replica. when the files pass max_bytes the
+	# least recently used are deleted, down to 3/4 of the limit so that
+	# eviction (which lists the directory) doesn't happen on every store
+	def __init__(self, directory: str, max_bytes: int=256*1024*1024):
+		self.directory = directory
+		self.max_bytes = max_bytes
+		self.hits = 0
+		self.misses = 0
+		os.makedirs(directory, exist_ok=True)
+		self.size = sum(entry.stat().st_size for entry in self.__entries())
+
+	def __str__(self) -> str:
+		return f'<#ResultCache {self.directory} bytes={self.size} hits={self.hits} misses={self.misses}>'
+
+	def __entries(self) -> list[os.DirEntry]:
+		with os.scandir(self.directory) as entries:
+			return [ entry for entry in entries if entry.name.endswith('.json') ]
+
+	def __path(self, key: str) -> str:
+		return os.path.join(self.directory, key+'.json')
+
+	def get(self, key: str) -> ReplicaResult:
+		path = self.__path(key)
+		try:
+			with open(path) as f:
+				stored = json.load(f)
+		except (FileNotFoundError, json.JSONDecodeError):
+			self.misses+=1
+			return None
+		# reading counts as a use
+		os.utime(path)
+		self.hits+=1
+		stored['config'] = EnsembleConfig(*stored['config'])
+		return ReplicaResult(**stored)
+
+	def put(self, key: str, result: ReplicaResult) -> None:
+		path = self.__path(key)
+		encoded = json.dumps(result._asdict()).encode()
+		if os.path.exists(path):
+			self.size -= os.path.getsize(path)
+		# written aside and renamed, so a reader never sees half a file
+		with open(path+'.tmp', 'wb') as f:
+			f.write(encoded)
+		os.replace(path+'.tmp', path)
+		self.size += len(encoded)
+		if self.size > self.max_bytes:
+			self.evict(self.max_bytes * 3 // 4)
+
+	def evict(self, max_bytes: int=0) -> int:
+		# delete least recently used results until at most max_bytes remain;
+		# returns how many were deleted
+		entries = sorted(self.__entries(), key=lambda entry: entry.stat().st_mtime_ns)
+		self.size = sum(entry.stat().st_size for entry in entries)
+		deleted = 0
+		for entry in entries:
+			if self.size <= max_bytes:
+				break
+			self.size -= entry.stat().st_size
+			os.remove(entry.path)
+			deleted+=1
+		return deleted
+
+def expand_grid(grid: dict[str, list]) -> list[EnsembleConfig]:
+	# every combination of the listed values; fields left out keep their
+	# defaults
+	fields = [ field for field in EnsembleConfig._fields if field in grid ]
+	unknown = set(grid) - set(fields)
+	if unknown:
+		raise ValueError(f'unknown parameters {sorted(unknown)}')
+	return [
+		EnsembleConfig(**dict(zip(fields, values)))
+		for values in itertools.product(*(grid[field] for field in fields))
+	]
+
+def run_sweep(
+	grid: typing.Union[dict[str, list], list[EnsembleConfig]],
+	replicas: int,
+	cache: ResultCache,
+	master_seed: int=0,
+	processes: int=None,
+	max_iterations: int=10000,
+	chunksize: int=1,
+	version: str=None,
+	until=None,
+) -> typing.Iterator[ReplicaResult]:
+	# like run_ensemble, taking either a grid or a list of configs, but
+	# replicas already in the cache are read back instead of played. the
+	# rest are fanned out over a pool (only started if there's work) and
+	# stored as they finish. results come in (config, replica) order. with
+	# until, replicas stop as soon as it is met and are cached under it
+	configs = expand_grid(grid) if isinstance(grid, dict) else [ EnsembleConfig(*config) for config in grid ]
+	version = code_version() if version is None else version
+
+	tasks = list()
+	keys = list()
+	cached = dict()
+	for config in configs:
+		for replica in range(replicas):
+			seed = replica_seed(master_seed, config, replica)
+			key = result_key(config, seed, max_iterations, version, until)
+			result = cache.get(key)
+			if result is not None:
+				# the key covers the seed, but not which replica it was
+				cached[len(keys)] = result._replace(replica=replica)
+			else:
+				tasks.append((config, replica, seed, max_iterations, until))
+			keys.append(key)
+
+	played = run_tasks(tasks, processes, chunksize)
+	for i, key in enumerate(keys):
+		if i in cached:
+			yield cached[i]
+		else:
+			result = next(played)
+			cache.put(key, result)
+			yield result
+	played.close()
+
+__all__ = ['code_version', 'result_key', 'ResultCache', 'expand_grid', 'run_sweep']
@@ -1,2 +1,12 @@
-from . import test_DirectedGraph, test_Graph
-__all__ = ['test_DirectedGraph', 'test_Graph']
\ No newline at end of file
+from . import test_DirectedGraph, test_Graph, test_CompactGraph, test_formats, test_generators
+from . import test_Agent, test_AgentPopulation, test_VectorNamingGame, test_WordIndex, test_NetworkNamingGame
+from . import test_ensemble, test_Observation, test_snapshot, test_schedulers
+from . import test_instrumentation, test_AgentNetwork, test_sweep, test_rng, test_LazyAgents
+from . import test_ParallelNamingGame, test_partition, test_stopping
+__all__ = [
+	'test_DirectedGraph', 'test_Graph', 'test_CompactGraph', 'test_formats', 'test_generators',
+	'test_Agent', 'test_AgentPopulation', 'test_VectorNamingGame', 'test_WordIndex', 'test_NetworkNamingGame',
+	'test_ensemble', 'test_Observation', 'test_snapshot', 'test_schedulers',
+	'test_instrumentation', 'test_AgentNetwork', 'test_sweep', 'test_rng', 'test_LazyAgents',
+	'test_ParallelNamingGame', 'test_partition', 'test_stopping'
+]
\ No newline at end of file
@@ -0,0 +1,47 @@
+from .context import models
+Agent = models.Agent
+nouns = models.nouns
+import unittest
+
+class VocabularyInternsWords(unittest.TestCase):
+	def test_intern(self):
+		vocabulary = nouns.Vocabulary(['A', 'B', 'A'])
+		assert len(vocabulary) == 2
+		assert vocabulary.intern('A') == 0
+		assert vocabulary.intern('C') == 2
+		assert vocabulary.word(1) == 'B'
+
+	def test_noun_ids_cover_nouns(self):
+		assert len(nouns.noun_ids) == len(nouns.nouns)
+		for noun, word_id in zip(nouns.nouns, nouns.noun_ids):
+			assert nouns.vocabulary.word(word_id) == noun
+
+class AgentsUseWordIds(unittest.TestCase):
+	def setUp(self):
+		self.agent = Agent(20)
+
+	def test_inventory_has_no_repeats(self):
+		assert 1 <= len(self.agent.word_ids) <= 20
+		assert len(set(self.agent.word_ids)) == len(self.agent.word_ids)
+		assert self.agent.words == [ nouns.vocabulary.word(i) for i in self.agent.word_ids ]
+
+	def test_hear(self):
+		known = self.agent.word_ids[0]
+		new = nouns.vocabulary.intern('NOT-A-NOUN')
+		size = len(self.agent.word_ids)
+		assert not self.agent.hear(new)
+		assert len(self.agent.word_ids) == size+1
+		assert self.agent.hear(known)
+		assert self.agent.word_ids == [ known ]
+		assert self.agent.hear('NOT-A-NOUN') is False
+		assert self.agent.words == [ nouns.vocabulary.word(known), 'NOT-A-NOUN' ]
+
+	def test_tell(self):
+		hearer = Agent(20)
+		hearer.hear(self.agent.word_ids[0])
+		self.agent.hear(self.agent.word_ids[0])
+		self.agent.tell(hearer)
+		assert hearer.word_ids == self.agent.word_ids
+
+if __name__ == '__main__':
+	unittest.main()
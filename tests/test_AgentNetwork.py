@@ -0,0 +1,162 @@
+from .context import models
+Agent = models.Agent
+AgentNetwork = models.AgentNetwork
+NetworkNamingGame = models.NetworkNamingGame
+DynamicAdjacency = models.graph.DynamicAdjacency
+Graph = models.graph.Graph
+import random
+import unittest
+
+class DynamicAdjacencyCanChange(unittest.TestCase):
+	def setUp(self):
+		self.g = Graph([1, 2, 3, 4, 5])
+		self.g.add_edges([(1, 2), (2, 3), (3, 4), (1, 3)])
+		self.adjacency = DynamicAdjacency.from_graph(self.g)
+
+	def test_matches_graph(self):
+		for node in self.g.nodes:
+			assert sorted(self.adjacency.adjacent_nodes(node)) == sorted(self.g.adjacent_nodes(node))
+		assert self.adjacency.neighbors[1] == [2, 3]
+
+	def test_add_and_remove_edges(self):
+		assert self.adjacency.add_edge(4, 5)
+		assert not self.adjacency.add_edge(5, 4)
+		assert self.adjacency.remove_edge(3, 2)
+		assert not self.adjacency.remove_edge(2, 3)
+		assert self.adjacency.degree(3) == 2
+		assert sorted(self.adjacency.neighbors[3]) == [1, 4]
+		for node, row in self.adjacency.neighbors.items():
+			assert { adjacent: i for i, adjacent in enumerate(row) } == self.adjacency.positions[node]
+
+	def test_remove_node(self):
+		assert sorted(self.adjacency.remove_node(3)) == [1, 2, 4]
+		assert not self.adjacency.has_node(3)
+		assert self.adjacency.degree(4) == 0
+		with self.assertRaises(ValueError):
+			self.adjacency.random_neighbor(4)
+
+	def test_connected(self):
+		assert self.adjacency.connected(1, 4)[0]
+		connected, piece = self.adjacency.connected(4, 5)
+		assert not connected
+		assert piece == [5]
+		self.adjacency.remove_edge(3, 4)
+		connected, piece = self.adjacency.connected(1, 4)
+		assert not connected
+		assert piece == [4]
+
+class DynamicNetworkStaysConnected(unittest.TestCase):
+	def setUp(self):
+		random.seed(5)
+		self.agents = [ Agent(3) for i in range(40) ]
+		self.network = AgentNetwork(self.agents, 0.02, 0.05, dynamic=True)
+
+	def check(self):
+		network = self.network
+		graph = network._graph
+		assert graph.is_connected()
+		assert graph.num_nodes() == len(network.agents)
+		for i, agent in enumerate(network.agents):
+			assert network._positions[agent] == i
+			assert sorted(graph.edges[agent], key=network._positions.get) == \
+				[ network.agents[j] for j in network.neighbor_positions(i) ]
+		csr = network.csr()
+		assert csr.num_edges() == 2*graph.num_edges()
+
+	def test_static_networks_refuse_changes(self):
+		network = AgentNetwork([ Agent(3) for i in range(5) ], 0.5, 0.5)
+		assert not network.dynamic
+		with self.assertRaises(ValueError):
+			network.add_agent(Agent(3))
+
+	def test_rewire(self):
+		for i in range(200):
+			agent = self.network.random_agent()
+			old = self.network.random_neighbor(agent)
+			new = self.network.rewire(agent, old)
+			assert self.network._graph.has_edge(agent, new)
+		self.check()
+
+	def test_rewire_checks_edges(self):
+		agent = self.agents[0]
+		neighbor = self.network.random_neighbor(agent)
+		with self.assertRaises(ValueError):
+			self.network.rewire(agent, agent)
+		new = self.network.rewire(agent, neighbor)
+		with self.assertRaises(ValueError):
+			self.network.rewire(agent, new, new)
+
+	def test_rewire_reconnects_a_leaf(self):
+		agents = [ Agent(3) for i in range(4) ]
+		graph = Graph(agents)
+		graph.add_edges(zip(agents, agents[1:]))
+		network = AgentNetwork.from_graph(agents, graph, dynamic=True)
+		network.rewire(agents[1], agents[0], agents[3])
+		assert graph.is_connected()
+		assert graph.num_edges() == 4
+		assert network.degree(0) == 1
+
+	def test_agents_join_and_leave(self):
+		for i in range(300):
+			if random.random() < 0.5 and len(self.network.agents) > 2:
+				self.network.remove_agent(self.network.random_agent())
+			else:
+				self.network.add_agent(Agent(3), k=random.randint(1, 3))
+		self.check()
+
+	def test_removing_a_hub_reconnects_its_neighbors(self):
+		agents = [ Agent(3) for i in range(6) ]
+		graph = Graph(agents)
+		graph.add_edges((agents[0], agent) for agent in agents[1:])
+		network = AgentNetwork.from_graph(agents, graph, dynamic=True)
+		hub = agents[0]
+		network.remove_agent(hub)
+		assert hub not in network.agents
+		assert len(network.agents) == 5
+		assert graph.is_connected()
+
+class DynamicNetworkGame(unittest.TestCase):
+	def test_game_on_changing_network(self):
+		random.seed(8)
+		game = NetworkNamingGame(30, 0.1, 0.2, dynamic=True)
+		for i in range(30):
+			game.run()
+			game.remove_agent(random.randrange(game.num_agents()))
+			game.add_agent(Agent(3), k=2)
+			network = game.network
+			agent = network.random_agent()
+			network.rewire(agent, network.random_neighbor(agent))
+			assert game.index.total == sum(len(agent.word_ids) for agent in game.agents)
+		assert game.num_agents() == 30
+		assert game.network._graph.is_connected()
+
+	def test_continuous_time_follows_membership(self):
+		random.seed(9)
+		scheduler = models.schedulers.ContinuousTime()
+		game = NetworkNamingGame(30, 0.1, 0.2, dynamic=True, scheduler=scheduler)
+		game.run()
+		for i in range(10):
+			game.remove_agent(game.num_agents()-1)
+		game.remove_agent(3)
+		game.run()
+		assert sorted(i for time, i in scheduler.queue) == list(range(19))
+		game.add_agent(Agent(3), k=2)
+		assert sorted(i for time, i in scheduler.queue) == list(range(20))
+		for i in range(5):
+			game.run()
+
+class NetworkFromGenerator(unittest.TestCase):
+	def test_generate_by_name(self):
+		random.seed(4)
+		agents = [ Agent(3) for i in range(50) ]
+		network = AgentNetwork.generate(agents, 'barabasi_albert', m=2)
+		assert network._graph.num_edges() == 96
+		assert network.degree(0) >= 2
+		network = AgentNetwork.generate(agents, 'watts_strogatz', dynamic=True, k=4, p=0.3)
+		assert network.dynamic
+		assert network._graph.is_connected()
+		with self.assertRaises(ValueError):
+			AgentNetwork.generate(agents, 'hypercube')
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,107 @@
+from .context import models
+AgentPopulation = models.AgentPopulation
+AgentNetwork = models.AgentNetwork
+Agent = models.Agent
+WordIndex = models.WordIndex
+import random
+import unittest
+
+class AgentPopulationStoresInventories(unittest.TestCase):
+	def setUp(self):
+		self.population = AgentPopulation([[1, 2], [3], [2, 4, 5]])
+		self.index = WordIndex()
+		self.population.attach(self.index)
+
+	def test_words(self):
+		assert len(self.population) == 3
+		assert self.population.words(2) == [2, 4, 5]
+		assert self.population.contains(0, 2)
+		assert not self.population.contains(1, 2)
+		assert self.index.count(2) == 2
+
+	def test_hear_grows_and_collapses(self):
+		assert not self.population.hear(1, 7)
+		assert not self.population.hear(1, 8)
+		assert self.population.words(1) == [3, 7, 8]
+		assert self.population.words(2) == [2, 4, 5]
+		assert self.population.hear(1, 7)
+		assert self.population.words(1) == [7]
+		assert self.index.count(3) == 0
+		assert self.index.count(7) == 1
+
+	def test_compaction_keeps_inventories(self):
+		for word_id in range(10, 40):
+			self.population.hear(0, word_id)
+		assert self.population.words(0) == [1, 2] + list(range(10, 40))
+		assert self.population.words(2) == [2, 4, 5]
+		self.population.compact()
+		assert self.population.garbage == 0
+		assert len(self.population.arena) == 32 + 1 + 3
+		assert self.population.words(0)[-1] == 39
+
+	def test_long_inventories_keep_a_set(self):
+		for word_id in range(10, 20):
+			assert not self.population.hear(0, word_id)
+		assert self.population.sets[0] == { 1, 2 } | set(range(10, 20))
+		assert self.population.contains(0, 15)
+		assert not self.population.contains(0, 25)
+		assert 1 not in self.population.sets
+		assert self.population.hear(0, 12)
+		assert 0 not in self.population.sets
+		assert not self.population.contains(0, 15)
+
+	def test_tell(self):
+		self.population.hear(1, 1)
+		self.population.tell(0, 1, u=0.0)
+		assert self.population.words(0) == [1]
+		assert self.population.words(1) == [1]
+
+	def test_play_matches_tell(self):
+		rng = models.rng.RandomStream(5)
+		told = AgentPopulation.random(40, rng)
+		played = AgentPopulation([ told.words(i) for i in range(40) ])
+		told_index, played_index = WordIndex(), WordIndex()
+		told.attach(told_index)
+		played.attach(played_index)
+		for round in range(6):
+			hearers = models.rng.indices(rng, 40, 40)
+			draws = models.rng.uniforms(rng, 40)
+			for speaker in range(40):
+				told.tell(speaker, hearers[speaker], draws[speaker])
+			played.play(hearers, draws)
+			assert [ played.words(i) for i in range(40) ] == [ told.words(i) for i in range(40) ]
+			assert played_index.counts == told_index.counts
+			assert played_index.dominant_count() == told_index.dominant_count()
+
+class AgentViewsActLikeAgents(unittest.TestCase):
+	def test_views(self):
+		population = AgentPopulation([[1], [2]])
+		a, b = population
+		assert a == population[0]
+		assert hash(a) == hash(population[0])
+		assert a != b
+		a.tell(b)
+		assert b.word_ids == [2, 1]
+		assert str(b) == '<#Agent ['+', '.join(b.words)+']>'
+
+	def test_views_talk_to_agents(self):
+		population = AgentPopulation([[1]])
+		agent = Agent(3)
+		population[0].tell(agent)
+		assert 1 in agent.word_ids
+
+	def test_views_in_network(self):
+		random.seed(8)
+		population = AgentPopulation.random(10)
+		network = AgentNetwork(population, 0.1, 0.3)
+		for i, view in enumerate(population):
+			neighbor = network.random_neighbor(view)
+			assert neighbor.population is population
+			assert network._graph.has_edge(view, neighbor)
+
+	def test_agent_has_slots(self):
+		with self.assertRaises(AttributeError):
+			Agent(2).other = 1
+
+if __name__ == '__main__':
+	unittest.main()
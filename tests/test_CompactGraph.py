@@ -0,0 +1,119 @@
+from .context import models
+CompactDirectedGraph = models.graph.CompactDirectedGraph
+CompactGraph = models.graph.CompactGraph
+Graph = models.graph.Graph
+import unittest
+
+class CompactDirectedGraphCanAddEdges(unittest.TestCase):
+	def setUp(self):
+		self.dg = CompactDirectedGraph(['a', 'b', 'c', 'd'])
+
+	def test_Initialize(self):
+		assert self.dg.num_nodes() == 4
+		assert self.dg.num_edges() == 0
+		assert 'a' in self.dg.nodes
+
+	def test_CanAddAndRemoveEdges(self):
+		self.dg.add_edge('a', 'c')
+		self.dg.add_edge('a', 'b')
+		self.dg.add_edge('a', 'b')
+		assert self.dg.num_edges() == 2
+		assert self.dg.has_edge('a', 'b')
+		assert not self.dg.has_edge('b', 'a')
+		assert self.dg.adjacent_nodes('a') == ['b', 'c']
+		assert self.dg.edges['a'] == ('b', 'c')
+
+		assert self.dg.remove_edge('a', 'b')
+		assert not self.dg.remove_edge('a', 'b')
+		assert self.dg.num_edges() == 1
+
+	def test_BadNodeRaisesError(self):
+		with self.assertRaises(ValueError):
+			self.dg.has_edge('a', 'e')
+		with self.assertRaises(ValueError):
+			self.dg.add_edge('a', 'a')
+
+	def test_complete(self):
+		self.dg.complete()
+		assert self.dg.num_edges() == 12
+		assert self.dg.has_edge('d', 'a')
+
+	def test_random_graph(self):
+		dg = CompactDirectedGraph.random_graph(range(10), 30, [[0, 1]])
+		assert dg.has_edge(0, 1)
+		assert dg.num_edges() == 31
+
+class CompactGraphMatchesGraph(unittest.TestCase):
+	def setUp(self):
+		self.g = CompactGraph(range(6))
+		self.g.add_edge(0, 1)
+		self.g.add_edge(2, 1)
+		self.g.add_edge(4, 5)
+
+	def test_edges_are_symmetric(self):
+		assert self.g.num_edges() == 3
+		assert self.g.has_edges([[1, 0], [1, 2], [5, 4]])
+		assert self.g.remove_edge(1, 0)
+		assert not self.g.has_edge(0, 1)
+		assert self.g.num_edges() == 2
+
+	def test_connected_subgraphs(self):
+		assert len(self.g.connected_subgraphs()) == 3
+		self.g.merge_subgraphs()
+		assert len(self.g.connected_subgraphs()) == 1
+
+	def test_random_graph(self):
+		g = CompactGraph.random_graph(range(10), 20)
+		assert isinstance(g, CompactGraph)
+		assert g.num_edges() == 20
+
+	def test_bulk_edges(self):
+		self.g.add_edges([(3, 2), (3, 4), (0, 1)])
+		assert self.g.num_edges() == 5
+		assert self.g.adjacent_nodes(3) == [2, 4]
+		assert self.g.is_connected()
+		assert list(self.g.edge_mask([(2, 3), (0, 5)])) == [True, False]
+		assert self.g.remove_edges([(3, 2), (3, 0)]) == 1
+		assert self.g.num_edges() == 4
+		with self.assertRaises(ValueError):
+			self.g.add_edges([(0, 2), (0, 9)])
+		assert not self.g.has_edge(0, 2)
+		with self.assertRaises(ValueError):
+			self.g.remove_edges([(3, 4), (0, 9)])
+		assert self.g.has_edge(3, 4)
+		assert self.g.num_edges() == 4
+
+	def test_remove_node(self):
+		self.g.add_edge(3, 5)
+		self.g.remove_node(1)
+		assert not self.g.has_node(1)
+		assert list(self.g.nodes) == [0, 2, 3, 4, 5]
+		assert self.g.num_edges() == 2
+		assert self.g.adjacent_nodes(0) == []
+		assert self.g.adjacent_nodes(5) == [3, 4]
+		assert self.g.has_edge(4, 5)
+		assert self.g.num_components() == 3
+		assert self.g.freeze().adjacent_nodes(3) == [5]
+		with self.assertRaises(ValueError):
+			self.g.remove_node(1)
+
+		dg = CompactDirectedGraph(['a', 'b', 'c'])
+		dg.add_edges([('a', 'c'), ('c', 'b'), ('b', 'a')])
+		dg.remove_node('a')
+		assert dg.num_edges() == 1
+		assert dg.adjacent_nodes('c') == ['b']
+
+	def test_freeze(self):
+		csr = self.g.freeze()
+		assert csr.num_edges() == 6
+		assert csr.has_edge(1, 2)
+		assert not csr.has_edge(0, 2)
+		assert csr.adjacent_nodes(1) == [0, 2]
+
+		plain = Graph(range(6))
+		plain.add_edge(3, 1)
+		plain.add_edge(3, 0)
+		assert plain.freeze().adjacent_nodes(3) == [0, 1]
+
+if __name__ == '__main__':
+	unittest.main()
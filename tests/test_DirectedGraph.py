@@ -33,6 +33,11 @@ class DirectedGraphCanBeInitialized(unittest.TestCase):
 			guaranteed_edges=[[1, 2]]
 		)
 
+	def test_random_graph_mostly_guaranteed(self):
+		nodes = list(range(10))
+		edgelist = [ [i, j] for i in nodes for j in nodes if i != j ][:80]
+		DirectedGraphCanBeInitialized.random_graph_assertions(nodes, 5, guaranteed_edges=edgelist)
+
 	def test_random_complete_graph(self):
 		nodes = [1, 2, 3, 4]
 		edgelist = [
@@ -49,6 +54,31 @@ class DirectedGraphCanBeInitialized(unittest.TestCase):
 		nodelist = []
 		DirectedGraphCanBeInitialized.random_graph_assertions(nodelist, 0)
 
+	def test_random_dense_graph(self):
+		nodes = list(range(10))
+		DirectedGraphCanBeInitialized.random_graph_assertions(nodes, 80, guaranteed_edges=[[0, 1], [1, 0]])
+		DirectedGraphCanBeInitialized.random_graph_assertions(nodes, 20, guaranteed_edges=[[0, 1], [1, 0]])
+
+	def test_pair_numbering(self):
+		n = 6
+		pairs = set()
+		for k in range(DirectedGraph.max_edges_for_n_nodes(n)):
+			i, j = DirectedGraph._decode_pair(k, n)
+			assert i != j
+			assert DirectedGraph._encode_pair(i, j, n) == k
+			pairs.add((i, j))
+		assert len(pairs) == n*(n-1)
+
+	def test_random_graph_gnp(self):
+		nodes = list(range(20))
+		assert DirectedGraph.random_graph_gnp(nodes, 0).num_edges() == 0
+		assert DirectedGraph.random_graph_gnp(nodes, 1).num_edges() == 20*19
+
+		dg = DirectedGraph.random_graph_gnp(nodes, 0.5)
+		assert 0 < dg.num_edges() < 20*19
+		for node in nodes:
+			assert node not in dg.edges[node]
+
 
 class DirectedGraphCanAddEdges(unittest.TestCase):
 	def setUp(self):
@@ -116,6 +146,68 @@ class DirectedGraphCanRemoveEdges(unittest.TestCase):
 		assert self.dg.remove_edge(2, 1)
 		assert not self.dg.remove_edge(2, 1)
 
+class DirectedGraphBulkEdgeOperations(unittest.TestCase):
+	def setUp(self):
+		self.dg: DirectedGraph = DirectedGraph([1, 2, 3, 4, 5])
+
+	def test_add_and_remove_edges(self):
+		self.dg.add_edges([(1, 2), (2, 3), (1, 2)])
+		self.dg.add_edges(iter([[3, 4]]))
+		assert self.dg.num_edges() == 3
+		assert list(self.dg.edge_mask([(1, 2), (2, 1), (3, 4)])) == [True, False, True]
+		assert self.dg.has_edges([(1, 2), (2, 3)])
+		assert not self.dg.has_edges([(1, 2), (3, 2)])
+
+		assert self.dg.remove_edges([(1, 2), (2, 1), (3, 4)]) == 2
+		assert self.dg.num_edges() == 1
+
+	def test_bad_edges_raise(self):
+		with self.assertRaises(ValueError):
+			self.dg.add_edges([(1, 6)])
+		with self.assertRaises(ValueError):
+			self.dg.add_edges([(6, 1)])
+		with self.assertRaises(ValueError):
+			self.dg.add_edges([(1, 1)])
+		with self.assertRaises(ValueError):
+			self.dg.has_edges([(0, 1)])
+		with self.assertRaises(ValueError):
+			self.dg.remove_edges([(1, 0)])
+
+	def test_bad_edges_change_nothing(self):
+		self.dg.add_edge(2, 3)
+		with self.assertRaises(ValueError):
+			self.dg.add_edges([(1, 2), (1, 6)])
+		with self.assertRaises(ValueError):
+			self.dg.add_edges([(1, 2), (3, 3)])
+		with self.assertRaises(ValueError):
+			self.dg.remove_edges([(2, 3), (6, 1)])
+		assert self.dg.num_edges() == 1
+		assert self.dg.has_edge(2, 3)
+
+class DirectedGraphCanBeRendered(unittest.TestCase):
+	def setUp(self):
+		self.dg = DirectedGraph(range(40))
+		self.dg.add_edge(0, 1)
+		self.dg.add_edge(0, 2)
+		self.dg.add_edge(3, 0)
+
+	def test_degree_stats(self):
+		assert self.dg.degree(0) == 2
+		assert self.dg.degree_stats() == (0, 3/40, 2)
+		assert DirectedGraph([]).degree_stats() == (0, 0.0, 0)
+
+	def test_large_graphs_print_summary(self):
+		assert str(self.dg) == '<#DirectedGraph nodes=40 edges=3 degree=0/0.07/2>'
+		small = DirectedGraph([1, 2])
+		assert str(small) == small.matrix()
+		assert str(small).startswith('SYMBOLS')
+
+	def test_render_pages(self):
+		lines = list(self.dg.render(0, 4))
+		assert lines[0] == self.dg.summary()
+		assert lines[1:] == ['0: 1 2', '1: ', '2: ', '3: 0']
+		assert len(list(self.dg.render(38))) == 3
+
 class DirectedGraphCanAddObjects(unittest.TestCase):
 	def test_InitializingObjectGraph(self):
 		self.dg = DirectedGraph(
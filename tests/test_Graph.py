@@ -1,5 +1,6 @@
 from .context import models
 Graph = models.graph.Graph 
+DisjointSet = models.graph.DisjointSet
 import unittest
 
 class GraphCanBeInitialized(unittest.TestCase):
@@ -25,6 +26,30 @@ class GraphCanBeInitialized(unittest.TestCase):
 		assert g.num_edges() == 5
 		assert g.num_nodes() == 5
 
+	def test_initialize_dense_random_graph(self):
+		g: Graph = Graph.random_graph(range(10), 40, [[2, 1]])
+		assert g.has_edges([[1, 2], [2, 1]])
+		assert g.num_edges() == 41
+
+	def test_pair_numbering(self):
+		n = 7
+		pairs = set()
+		for k in range(Graph.max_edges_for_n_nodes(n)):
+			i, j = Graph._decode_pair(k, n)
+			assert i < j
+			assert Graph._encode_pair(i, j, n) == k
+			assert Graph._encode_pair(j, i, n) == k
+			pairs.add((i, j))
+		assert len(pairs) == (n*(n-1))//2
+
+	def test_initialize_random_graph_gnp(self):
+		g: Graph = Graph.random_graph_gnp(range(10), 1)
+		assert g.num_edges() == 45
+		g = Graph.random_graph_gnp(range(10), 0.3)
+		for node in range(10):
+			for adjacent in g.adjacent_nodes(node):
+				assert g.has_edge(adjacent, node)
+
 class GraphCanAddEdges(unittest.TestCase):
 	def setUp(self):
 		self.dg: Graph = Graph([1, 2, 3, 4, 5])
@@ -256,7 +281,94 @@ class GraphCanMergeSubgraphs(unittest.TestCase):
 
 	def test_can_merge_singlets(self):
 		GraphCanMergeSubgraphs.check_merge(5, [])
+
+	def test_merge_adds_minimum_edges(self):
+		g = Graph(range(8))
+		g.add_edge(0, 1)
+		g.add_edge(2, 3)
+		assert g.num_components() == 6
+		g.merge_subgraphs()
+		assert g.is_connected()
+		assert g.num_edges() == 2 + 5
+
+class GraphBulkEdgeOperations(unittest.TestCase):
+	def test_add_and_remove_edges(self):
+		g = Graph(range(6))
+		g.add_edges((i, i+1) for i in range(0, 4))
+		assert g.num_edges() == 4
+		assert g.has_edges([[1, 0], [4, 3]])
+		assert g.components() == [[0, 1, 2, 3, 4], [5]]
+
+		assert g.remove_edges([(1, 0), (2, 1), (5, 0)]) == 2
+		assert not g.has_edge(0, 1)
+		assert g.num_components() == 4
+
+	def test_failed_add_keeps_components_right(self):
+		g = Graph(range(3))
+		with self.assertRaises(ValueError):
+			g.add_edges([(0, 1), (1, 7)])
+		assert g.num_components() == 3
+		assert g.num_edges() == 0
+
+	def test_failed_remove_changes_nothing(self):
+		g = Graph(range(3))
+		g.add_edges([(0, 1), (1, 2)])
+		with self.assertRaises(ValueError):
+			g.remove_edges([(0, 1), (1, 7)])
+		assert g.num_edges() == 2
+		assert g.is_connected()
+
+class GraphTracksComponents(unittest.TestCase):
+	def test_components_follow_edges(self):
+		g = Graph(range(5))
+		assert g.num_components() == 5
+		g.add_edge(0, 1)
+		g.add_edge(3, 4)
+		assert g.components() == [[0, 1], [2], [3, 4]]
+		g.add_edge(1, 4)
+		assert g.num_components() == 2
+
+	def test_removal_splits_components(self):
+		g = Graph(range(4))
+		g.add_edge(0, 1)
+		g.add_edge(1, 2)
+		assert g.num_components() == 2
+		g.remove_edge(1, 2)
+		assert g.components() == [[0, 1], [2], [3]]
+		g.complete()
+		assert g.is_connected()
+
+class DisjointSetCanUnion(unittest.TestCase):
+	def test_union_and_find(self):
+		ds = DisjointSet('abcde')
+		assert ds.num_sets == 5
+		assert ds.union('a', 'b')
+		assert ds.union('c', 'b')
+		assert not ds.union('a', 'c')
+		assert ds.connected('a', 'c')
+		assert not ds.connected('a', 'd')
+		assert ds.num_sets == 3
+		assert ds.groups() == [['a', 'b', 'c'], ['d'], ['e']]
+
+	def test_add(self):
+		ds = DisjointSet()
+		ds.add(1)
+		ds.add(1)
+		assert ds.num_sets == 1
+		assert ds.find(1) == 1
 	
 
+class GraphCanRemoveNodes(unittest.TestCase):
+	def test_remove_node_drops_its_edges(self):
+		g = Graph([1, 2, 3, 4])
+		g.add_edges([(1, 2), (2, 3), (3, 4)])
+		g.remove_node(2)
+		assert not g.has_node(2)
+		assert g.num_edges() == 1
+		assert g.adjacent_nodes(1) == []
+		assert g.num_components() == 2
+		with self.assertRaises(ValueError):
+			g.remove_node(2)
+
 if __name__ == '__main__':
-	unittest.main()
\ No newline at end of file
+	unittest.main()
@@ -0,0 +1,46 @@
+from .context import models
+LazyAgents = models.LazyAgents
+NamingGame = models.NamingGame
+schedulers = models.schedulers
+RandomStream = models.rng.RandomStream
+import unittest
+
+class LazyAgentsAreBuiltOnUse(unittest.TestCase):
+	def test_inventories_depend_only_on_position(self):
+		a, b = LazyAgents(100, 5, seed=9), LazyAgents(100, 5, seed=9)
+		forward = [ a[i].word_ids for i in (3, 50, 99) ]
+		backward = [ b[i].word_ids for i in (99, 50, 3) ]
+		assert forward == backward[::-1]
+		assert a[-1] is a[99]
+		assert a.pending == 97
+		assert 1 <= len(a[3].word_ids) <= 5
+		with self.assertRaises(IndexError):
+			a[100]
+
+	def test_index_counts_built_agents(self):
+		game = NamingGame(10**6, rng=RandomStream(1), lazy=True)
+		assert game.num_agents() == 10**6
+		assert game.pending() == 10**6
+		assert game.index.total == 0
+		game.interact(5, 7)
+		assert game.pending() == 10**6 - 2
+		assert game.index.total == sum(len(game.agents[i].word_ids) for i in (5, 7))
+
+class LazyGameReachesConsensus(unittest.TestCase):
+	def test_no_consensus_until_everyone_played(self):
+		game = NamingGame(30, rng=RandomStream(2), lazy=True)
+		game.interact(0, 1)
+		game.interact(0, 1)
+		assert not game.poll()
+
+	def test_plays_to_consensus(self):
+		for scheduler in (None, schedulers.SequentialRandom()):
+			game = NamingGame(30, scheduler, rng=RandomStream(3), lazy=True)
+			while not game.poll() and game.iteration < 1000:
+				game.run()
+			assert game.poll()
+			assert game.pending() == 0
+			assert game.num_words() == 1
+
+if __name__ == '__main__':
+	unittest.main()
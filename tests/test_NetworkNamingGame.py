@@ -0,0 +1,62 @@
+from .context import models
+NetworkNamingGame = models.NetworkNamingGame
+CSRGraph = models.graph.CSRGraph
+Graph = models.graph.Graph
+import random
+import unittest
+
+class CSRGraphSamplesNeighbors(unittest.TestCase):
+	def setUp(self):
+		self.g = Graph([1, 2, 3, 4])
+		self.g.add_edge(1, 2)
+		self.g.add_edge(1, 3)
+		self.csr = CSRGraph.from_graph(self.g, [1, 2, 3, 4])
+
+	def test_degrees(self):
+		assert self.csr.num_nodes() == 4
+		assert [ self.csr.degree(i) for i in range(4) ] == [2, 1, 1, 0]
+
+	def test_random_neighbor(self):
+		for i in range(20):
+			assert self.csr.random_neighbor(1) in (2, 3)
+			assert self.csr.random_neighbor(2) == 1
+
+	def test_isolated_node_raises(self):
+		with self.assertRaises(ValueError):
+			self.csr.random_neighbor(4)
+		with self.assertRaises(ValueError):
+			self.csr.random_neighbor(5)
+
+class NetworkNamingGameCanRun(unittest.TestCase):
+	def test_neighbors_are_adjacent(self):
+		random.seed(2)
+		game = NetworkNamingGame(12, 0.1, 0.2)
+		for i, agent in enumerate(game.agents):
+			neighbor = game.agents[game.network.random_neighbor_index(i)]
+			assert game.network._graph.has_edge(agent, neighbor)
+
+	def test_reaches_consensus(self):
+		random.seed(3)
+		game = NetworkNamingGame(12, 0.2, 0.4)
+		while not game.poll():
+			game.run()
+		assert game.num_words() == 1
+
+	def test_render(self):
+		random.seed(14)
+		game = NetworkNamingGame(40, 0.05, 0.1)
+		network = game.network
+		lines = list(network.render(2, 5, sample=3))
+		assert lines[0] == '<#AgentNetwork agents=40>'
+		assert lines[2] == network._graph.summary()
+		assert lines[3].startswith('2: ')
+		assert len(lines) == 3 + 3 + 1 + 3
+		assert str(network) == '\n'.join(lines[:3])
+
+	def test_single_agent(self):
+		game = NetworkNamingGame(1, 0.0, 0.0)
+		game.run()
+		assert game.poll()
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,57 @@
+from .context import models
+NamingGame = models.NamingGame
+VectorNamingGame = models.VectorNamingGame
+ObservationQueue = models.ObservationQueue
+import random
+import unittest
+
+class GamesCanBeObserved(unittest.TestCase):
+	def test_observe_until_consensus(self):
+		random.seed(4)
+		game = NamingGame(10)
+		observations = list(game.observe())
+		assert observations[0].iteration == 0
+		assert [ o.iteration for o in observations ] == list(range(game.iteration+1))
+		final = observations[-1]
+		assert final.num_words == 1
+		assert final.inventory_size == 10
+		assert final.dominant_share == 1.0
+		assert final.snapshot is None
+
+	def test_interval_keeps_final_state(self):
+		random.seed(5)
+		game = VectorNamingGame(10)
+		observations = list(game.observe(interval=4))
+		for observation in observations[:-1]:
+			assert observation.iteration % 4 == 0
+		assert observations[-1].num_words == 1
+
+	def test_snapshots_and_budget(self):
+		game = NamingGame(30)
+		observations = list(game.observe(snapshots=True, max_iterations=2))
+		assert observations[-1].iteration <= 2
+		assert len(observations[0].snapshot) == 30
+		assert all(isinstance(word, str) for word in observations[0].snapshot[0])
+
+	def test_execute_with_queue(self):
+		random.seed(6)
+		seen = list()
+		with ObservationQueue(seen.append, maxsize=2) as observer:
+			NamingGame(8).execute(observer)
+		assert seen[-1].num_words == 1
+		assert str(seen[0]).startswith('<#Observation 0')
+
+	def test_queue_reports_observer_errors(self):
+		def observer(observation):
+			raise RuntimeError('disk full')
+		game = NamingGame(8)
+		queue = ObservationQueue(observer, maxsize=1)
+		with self.assertRaises(RuntimeError):
+			# without the error being passed on this would block for good
+			for observation in game.observe(max_iterations=50):
+				queue(observation)
+			queue.close()
+		queue.close()
+
+if __name__ == '__main__':
+	unittest.main()
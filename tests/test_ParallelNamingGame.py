@@ -0,0 +1,92 @@
+from .context import models
+ParallelNamingGame = models.ParallelNamingGame
+NetworkNamingGame = models.NetworkNamingGame
+RandomStream = models.rng.RandomStream
+from multiprocessing.shared_memory import SharedMemory
+import gc
+import unittest
+
+def check_index(game):
+	words = [ word for i in range(game.num_agents()) for word in game.words(i) ]
+	assert game.index.total == len(words)
+	assert game.num_words() == len(set(words))
+
+class ParallelGameReachesConsensus(unittest.TestCase):
+	def play(self, game):
+		with game:
+			while not game.poll() and game.iteration < 500:
+				game.run()
+				check_index(game)
+			assert game.poll()
+			assert len(set(tuple(game.words(i)) for i in range(game.num_agents()))) == 1
+
+	def test_in_process(self):
+		self.play(ParallelNamingGame(200, processes=1, rng=RandomStream(1)))
+
+	def test_workers(self):
+		self.play(ParallelNamingGame(200, processes=3, rng=RandomStream(2)))
+
+	def test_in_process_runs_repeat(self):
+		def play():
+			with ParallelNamingGame(100, processes=1, rng=RandomStream(3)) as game:
+				for i in range(5):
+					game.run()
+				return game.snapshot()
+		assert play() == play()
+
+	def test_network(self):
+		network_game = NetworkNamingGame(60, 0.05, 0.1, rng=RandomStream(4))
+		game = ParallelNamingGame.from_game(network_game, processes=2)
+		assert not game.uniform_hearers
+		assert game.snapshot() == network_game.snapshot()
+		self.play(game)
+
+class ParallelGameManagesMemory(unittest.TestCase):
+	def test_compact_keeps_inventories(self):
+		with ParallelNamingGame(100, processes=2, rng=RandomStream(5)) as game:
+			game.run()
+			before = game.snapshot()
+			game.compact()
+			assert game.snapshot() == before
+			assert game.top == game.index.total
+			game.run()
+			check_index(game)
+
+	def test_close_frees_segments(self):
+		game = ParallelNamingGame(20, processes=1, rng=RandomStream(6))
+		names = [ segment.name for segment in game.segments.values() ]
+		game.close()
+		for name in names:
+			with self.assertRaises(FileNotFoundError):
+				SharedMemory(name)
+
+	def test_dropped_game_frees_segments(self):
+		game = ParallelNamingGame(20, processes=2, rng=RandomStream(7))
+		game.run()
+		names = [ segment.name for segment in game.segments.values() ]
+		del game
+		gc.collect()
+		for name in names:
+			with self.assertRaises(FileNotFoundError):
+				SharedMemory(name)
+
+class ParallelGameInterface(unittest.TestCase):
+	def test_only_what_it_supports(self):
+		with ParallelNamingGame(30, processes=1, rng=RandomStream(8)) as game:
+			assert not hasattr(game, 'interact')
+			assert not hasattr(game, 'agents')
+			while not game.poll():
+				game.run()
+			assert game.settled_word(0) == game.words(0)[0]
+			assert game.observation().dominant_share == 1.0
+
+	def test_games_provide_the_basics(self):
+		class Silent(models.IndexedGame):
+			def run(self):
+				pass
+
+		with self.assertRaises(TypeError):
+			Silent()
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,41 @@
+from .context import models
+VectorNamingGame = models.VectorNamingGame
+import random
+import unittest
+
+class VectorNamingGameCanBeInitialized(unittest.TestCase):
+	def test_Initialize(self):
+		game = VectorNamingGame(10)
+		assert game.iteration == 0
+		assert len(game.agents) == 10
+		for agent in game.agents:
+			assert 1 <= len(agent.word_ids) <= 10
+
+	def test_single_agent_has_consensus(self):
+		game = VectorNamingGame(1)
+		assert game.poll()
+
+class VectorNamingGameCanRun(unittest.TestCase):
+	def test_run_increments_iteration(self):
+		game = VectorNamingGame(5)
+		game.run()
+		game.run()
+		assert game.iteration == 2
+
+	def test_reaches_consensus(self):
+		random.seed(0)
+		game = VectorNamingGame(20)
+		while not game.poll():
+			game.run()
+		words = game.agents[0].word_ids
+		assert len(words) == 1
+		for agent in game.agents:
+			assert agent.word_ids == words
+
+	def test_str_renders_nouns(self):
+		game = VectorNamingGame(3)
+		assert str(game).startswith('<#NamingGame 0')
+		assert '<#Agent [' in str(game)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,96 @@
+from .context import models
+WordIndex = models.WordIndex
+NamingGame = models.NamingGame
+import random
+import unittest
+
+class WordIndexCountsWords(unittest.TestCase):
+	def setUp(self):
+		self.index = WordIndex(['A', 'B', 'A', 'C'])
+
+	def test_counts(self):
+		assert self.index.num_words() == 3
+		assert self.index.count('A') == 2
+		assert self.index.total == 4
+		assert self.index.dominant_word() == 'A'
+		assert self.index.dominant_count() == 2
+		assert not self.index.consensus()
+
+	def test_remove_updates_dominant(self):
+		self.index.remove('A')
+		self.index.remove('A')
+		assert self.index.count('A') == 0
+		assert self.index.num_words() == 2
+		assert self.index.dominant_count() == 1
+
+		self.index.add('C')
+		assert self.index.dominant_word() == 'C'
+
+	def test_collapse(self):
+		self.index.collapse(['A', 'B'], 'B')
+		assert self.index.count('A') == 1
+		assert self.index.count('B') == 1
+		self.index.collapse(['A', 'C'], 'B')
+		assert self.index.consensus()
+		assert self.index.dominant_word() == 'B'
+		assert self.index.total == 2
+
+	def test_empty_index(self):
+		index = WordIndex()
+		assert index.dominant_word() is None
+		assert index.num_words() == 0
+		assert not index.consensus()
+
+class WordIndexAdjustsInBulk(unittest.TestCase):
+	def test_adjust(self):
+		index = WordIndex(['a', 'a', 'a', 'b', 'b', 'c'])
+		index.adjust('a', -3)
+		assert index.count('a') == 0
+		assert index.dominant_word() == 'b'
+		assert index.dominant_count() == 2
+		index.adjust('c', 4)
+		assert index.dominant_word() == 'c'
+		assert index.total == 7
+		assert index.count('c') == 5
+		index.adjust('b', -2)
+		index.adjust('c', -5)
+		assert index.num_words() == 0
+		assert index.dominant_count() == 0
+		with self.assertRaises(ValueError):
+			index.adjust('c', -1)
+
+	def test_apply(self):
+		index = WordIndex(['a', 'a', 'a', 'b', 'b', 'c'])
+		index.apply({ 'a': -3, 'b': 0, 'c': 2, 'd': 1 })
+		assert index.counts == { 'b': 2, 'c': 3, 'd': 1 }
+		assert index.dominant_word() == 'c'
+		assert index.total == 6
+		with self.assertRaises(ValueError):
+			index.apply({ 'c': -1, 'b': -3 })
+		assert index.counts == { 'b': 2, 'c': 3, 'd': 1 }
+		index.apply({ 'b': -2, 'c': -3, 'd': -1 })
+		assert index.num_words() == 0
+		assert index.dominant_count() == 0
+
+def check_index(game):
+	all_words = list()
+	for agent in game.agents:
+		all_words.extend(agent.word_ids)
+	assert game.num_words() == len(set(all_words))
+	assert game.index.total == len(all_words)
+	dominant = game.index.dominant_word()
+	assert game.index.count(dominant) == max(all_words.count(w) for w in all_words)
+	assert game.dominant_word() == models.nouns.vocabulary.word(dominant)
+
+class WordIndexTracksNamingGame(unittest.TestCase):
+	def test_index_matches_inventories(self):
+		random.seed(1)
+		game = NamingGame(15)
+		check_index(game)
+		while not game.poll():
+			game.run()
+			check_index(game)
+		assert game.num_words() == 1
+
+if __name__ == '__main__':
+	unittest.main()
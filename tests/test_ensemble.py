@@ -0,0 +1,34 @@
+from .context import models
+ensemble = models.ensemble
+import unittest
+
+class EnsembleIsDeterministic(unittest.TestCase):
+	def setUp(self):
+		self.configs = [ (6,), (6, 0.2, 0.5) ]
+
+	def test_seeds_depend_on_replica(self):
+		config = ensemble.EnsembleConfig(6)
+		assert ensemble.replica_seed(1, config, 0) == ensemble.replica_seed(1, config, 0)
+		assert ensemble.replica_seed(1, config, 0) != ensemble.replica_seed(1, config, 1)
+		assert ensemble.replica_seed(1, config, 0) != ensemble.replica_seed(2, config, 0)
+
+	def test_results_match_across_pool_sizes(self):
+		serial = list(ensemble.run_ensemble(self.configs, 3, master_seed=7, processes=1))
+		pooled = list(ensemble.run_ensemble(self.configs, 3, master_seed=7, processes=2))
+		assert serial == pooled
+		assert len(serial) == 6
+		assert [ (r.config.n, r.replica) for r in serial ][:3] == [ (6, 0), (6, 1), (6, 2) ]
+
+	def test_results_record_convergence(self):
+		for result in ensemble.run_ensemble(self.configs, 2, processes=1):
+			assert result.converged
+			assert result.word_counts[-1] == 1
+			assert len(result.word_counts) == result.iterations + 1
+
+	def test_iteration_budget(self):
+		result = ensemble.run_replica((ensemble.EnsembleConfig(30), 0, 1, 0))
+		assert result.iterations == 0
+		assert not result.converged
+
+if __name__ == '__main__':
+	unittest.main()
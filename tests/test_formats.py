@@ -0,0 +1,79 @@
+from .context import models
+formats = models.graph.formats
+Graph = models.graph.Graph
+DirectedGraph = models.graph.DirectedGraph
+CompactGraph = models.graph.CompactGraph
+import io
+import random
+import unittest
+
+def same_graph(a, b):
+	assert set(a.nodes) == set(b.nodes)
+	assert a.num_edges() == b.num_edges()
+	for node in a.nodes:
+		assert set(a.adjacent_nodes(node)) == set(b.adjacent_nodes(node))
+
+class GraphsRoundTrip(unittest.TestCase):
+	def setUp(self):
+		random.seed(13)
+		self.g = Graph.random_graph(range(30), 40)
+		self.g.add_node(30)
+		self.dg = DirectedGraph.random_graph(range(20), 50)
+
+	def test_edgelist(self):
+		f = io.StringIO()
+		formats.write_edgelist(self.g, f)
+		isolated = sum(1 for node in self.g.nodes if not self.g.adjacent_nodes(node))
+		assert len(f.getvalue().splitlines()) == 40 + isolated
+		f.seek(0)
+		same_graph(self.g, formats.read_edgelist(f))
+
+		f = io.StringIO()
+		formats.write_edgelist(self.dg, f)
+		f.seek(0)
+		same_graph(self.dg, formats.read_edgelist(f, DirectedGraph))
+
+	def test_adjacency(self):
+		f = io.StringIO()
+		formats.write_adjacency(self.g, f)
+		f.seek(0)
+		same_graph(self.g, formats.read_adjacency(f, CompactGraph))
+
+	def test_binary(self):
+		f = io.BytesIO()
+		formats.write_binary(self.dg, f, chunk_size=7)
+		f.seek(0)
+		dg = formats.read_binary(f, chunk_size=5)
+		assert isinstance(dg, DirectedGraph) and not isinstance(dg, Graph)
+		same_graph(self.dg, dg)
+
+		f = io.BytesIO()
+		formats.write_binary(self.g, f)
+		f.seek(0)
+		g = formats.read_binary(f, nodes=list(self.g.nodes))
+		assert isinstance(g, Graph)
+		same_graph(self.g, g)
+
+	def test_comments_and_labels(self):
+		f = io.StringIO('# a triangle\nA B\nB C\n\nC A\nD\n')
+		g = formats.read_edgelist(f, nodetype=str)
+		assert g.num_nodes() == 4
+		assert g.num_edges() == 3
+		assert g.num_components() == 2
+
+	def test_bad_binary(self):
+		with self.assertRaises(ValueError):
+			formats.read_binary(io.BytesIO(b'nonsense' * 4))
+
+class AgentNetworkFromTopology(unittest.TestCase):
+	def test_from_topology(self):
+		topology = formats.read_edgelist(io.StringIO('0 1\n1 2\n2 3\n'))
+		agents = [ models.Agent(2) for i in range(4) ]
+		network = models.AgentNetwork.from_topology(agents, topology)
+		assert network.random_neighbor(agents[0]) is agents[1]
+		assert network.degree(1) == 2
+		with self.assertRaises(ValueError):
+			models.AgentNetwork.from_topology(agents[:3], topology)
+
+if __name__ == '__main__':
+	unittest.main()
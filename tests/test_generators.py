@@ -0,0 +1,66 @@
+from .context import models
+generators = models.graph.generators
+Graph = models.graph.Graph
+CompactGraph = models.graph.CompactGraph
+import random
+import unittest
+
+class RingLatticeIsRegular(unittest.TestCase):
+	def test_even_k(self):
+		g = generators.ring_lattice(range(10), 4)
+		assert g.num_edges() == 20
+		assert g.degree_stats() == (4, 4.0, 4)
+		assert sorted(g.adjacent_nodes(0)) == [1, 2, 8, 9]
+
+	def test_odd_k(self):
+		g = generators.ring_lattice(range(10), 3)
+		assert g.degree_stats() == (3, 3.0, 3)
+		assert g.has_edge(2, 7)
+		with self.assertRaises(ValueError):
+			generators.ring_lattice(range(9), 3)
+
+	def test_bad_k(self):
+		with self.assertRaises(ValueError):
+			generators.ring_lattice(range(5), 5)
+
+	def test_compact_backend(self):
+		g = generators.ring_lattice(range(10), 2, graph_cls=CompactGraph)
+		assert isinstance(g, CompactGraph)
+		assert g.num_edges() == 10
+
+class WattsStrogatzRewires(unittest.TestCase):
+	def test_keeps_edge_count(self):
+		random.seed(1)
+		g = generators.watts_strogatz(range(200), 6, 0.2)
+		assert g.num_edges() == 600
+		lattice = generators.ring_lattice(range(200), 6)
+		moved = sum(1 for node in g.nodes for adjacent in g.edges[node] if not lattice.has_edge(node, adjacent))
+		assert 0 < moved < 600
+
+	def test_p_zero_is_the_lattice(self):
+		g = generators.watts_strogatz(range(20), 4, 0.0)
+		assert g.degree_stats() == (4, 4.0, 4)
+
+	def test_p_one_on_a_small_graph(self):
+		random.seed(2)
+		g = generators.watts_strogatz(range(6), 4, 1.0)
+		assert g.num_edges() == 12
+
+class BarabasiAlbertPrefersHubs(unittest.TestCase):
+	def test_edge_count_and_degrees(self):
+		random.seed(3)
+		g = generators.barabasi_albert(range(500), 2)
+		assert g.num_edges() == 2*(500-2)
+		low, mean, high = g.degree_stats()
+		assert low >= 1
+		assert high > 20
+		assert g.is_connected()
+
+	def test_bad_m(self):
+		with self.assertRaises(ValueError):
+			generators.barabasi_albert(range(5), 5)
+		with self.assertRaises(ValueError):
+			generators.barabasi_albert(range(5), 0)
+
+if __name__ == '__main__':
+	unittest.main()
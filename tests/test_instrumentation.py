@@ -0,0 +1,81 @@
+from .context import models
+instrumentation = models.instrumentation
+Agent = models.Agent
+Graph = models.graph.Graph
+RandomStream = models.rng.RandomStream
+schedulers = models.schedulers
+import random
+import unittest
+
+class ProfilerCountsHotPaths(unittest.TestCase):
+	def test_game_statistics(self):
+		random.seed(20)
+		game = models.NamingGame(10)
+		with instrumentation.Profiler() as profiler:
+			game.run()
+		report = profiler.report()
+		assert report.interactions == 10
+		assert report.successes + report.failures == 10
+		assert report.calls['Agent.tell'] == 10
+		assert report.calls['rng.indices'] == 1
+		assert report.calls['rng.uniforms'] == 1
+		assert report.mean_inventory >= 1
+		assert report.seconds['Agent.tell'] >= report.seconds['Agent.hear']
+		assert 'interactions: 10' in str(report)
+
+	def test_population_statistics(self):
+		random.seed(21)
+		game = models.VectorNamingGame(10)
+		with instrumentation.Profiler() as profiler:
+			game.run()
+		report = profiler.report()
+		assert report.interactions == 10
+		assert report.successes + report.failures == 10
+		assert report.calls['AgentPopulation.play'] == 1
+		assert report.mean_inventory >= 1
+
+	def test_random_draws(self):
+		games = [
+			models.NamingGame(20, schedulers.SequentialRandom(), RandomStream(22)),
+			models.NetworkNamingGame(20, 0.1, 0.3, rng=RandomStream(23)),
+			models.NamingGame(20),
+		]
+		with instrumentation.Profiler() as profiler:
+			for game in games:
+				game.run()
+		calls = profiler.report().calls
+		assert calls['Random.choices'] == 1
+		assert calls['Random.randrange'] >= 20
+		assert calls['Random.random'] >= 3*2*20
+
+	def test_graph_operations(self):
+		g = Graph(range(4))
+		with instrumentation.Profiler() as profiler:
+			g.add_edge(0, 1)
+			g.has_edge(0, 1)
+			g.adjacent_nodes(0)
+		calls = profiler.report().calls
+		assert calls['Graph.add_edge'] == 1
+		assert calls['DirectedGraph.add_edge'] == 2
+		assert calls['DirectedGraph.validate_all_nodes'] == 1
+		assert calls['DirectedGraph.adjacent_nodes'] == 1
+
+	def test_disabling_restores_originals(self):
+		tell = Agent.tell
+		choice = random.choice
+		draw = random.Random.random
+		profiler = instrumentation.Profiler()
+		profiler.enable()
+		assert Agent.tell is not tell
+		assert profiler.enabled()
+		profiler.disable()
+		assert Agent.tell is tell
+		assert random.choice == choice
+		assert random.Random.random is draw
+		assert 'random' not in random.Random.__dict__
+		assert not hasattr(Graph.add_edge, '__wrapped__')
+		Agent(3).tell(Agent(3))
+		assert profiler.report().interactions == 0
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,129 @@
+from .context import models
+Graph = models.graph.Graph
+partition = models.graph.partition
+generators = models.graph.generators
+NetworkNamingGame = models.NetworkNamingGame
+PartitionedNamingGame = models.PartitionedNamingGame
+formats = models.graph.formats
+RandomStream = models.rng.RandomStream
+import os
+from array import array
+import tempfile
+import unittest
+
+def small_world(n):
+	return generators.watts_strogatz(list(range(n)), 6, 0.05, rng=RandomStream(1))
+
+class BFSPartitionSplitsEvenly(unittest.TestCase):
+	def test_balanced(self):
+		graph = small_world(1001)
+		assignment = partition.bfs_partition(graph, 4, RandomStream(2))
+		sizes = [ list(assignment.values()).count(part) for part in range(4) ]
+		assert sorted(sizes) == [250, 250, 250, 251]
+
+	def test_cut_beats_round_robin(self):
+		graph = small_world(1000)
+		assignment = partition.bfs_partition(graph, 4, RandomStream(3))
+		round_robin = { node: node % 4 for node in graph.nodes }
+		assert partition.edge_cut(graph, assignment) < partition.edge_cut(graph, round_robin) / 2
+
+	def test_repeats(self):
+		graph = small_world(200)
+		assert partition.bfs_partition(graph, 3, RandomStream(4)) == partition.bfs_partition(graph, 3, RandomStream(4))
+
+class SplitMapsGhosts(unittest.TestCase):
+	def test_ghosts_point_at_owners(self):
+		graph = small_world(300)
+		assignment = partition.bfs_partition(graph, 3, RandomStream(5))
+		partitions = partition.split(graph, assignment, 3)
+		assert sum(part.num_nodes() for part in partitions) == 300
+		for part in partitions:
+			for i, node in enumerate(part.nodes):
+				adjacent = set()
+				for local in part.adjacent(i):
+					if part.is_ghost(local):
+						owner, remote = part.owner(local)
+						assert owner != part.part
+						adjacent.add(partitions[owner].nodes[remote])
+					else:
+						adjacent.add(part.nodes[local])
+				assert adjacent == graph.edges[node]
+
+class BuildPartMatchesSplit(unittest.TestCase):
+	def test_same_parts(self):
+		graph = small_world(300)
+		assignment = partition.bfs_partition(graph, 3, RandomStream(7))
+		positions = array('i', [ assignment[node] for node in graph.nodes ])
+		edges = lambda: ((u, v) for u in graph.nodes for v in graph.edges[u])
+		for part in partition.split(graph, assignment, 3):
+			built = partition.build_part(part.part, positions, edges)
+			assert built.nodes == part.nodes
+			assert built.ghosts == sorted(part.ghosts)
+			for i in range(part.num_nodes()):
+				expected = set()
+				for local in part.adjacent(i):
+					expected.add(part.owner(local) if part.is_ghost(local) else (part.part, local))
+				found = set()
+				for local in built.adjacent(i):
+					found.add(built.owner(local) if built.is_ghost(local) else (built.part, local))
+				assert found == expected
+
+	def test_block_partition(self):
+		assert partition.block_partition(10, 3).tolist() == [0, 0, 0, 0, 1, 1, 1, 2, 2, 2]
+
+class PartitionedGameReachesConsensus(unittest.TestCase):
+	def play(self, processes):
+		network_game = NetworkNamingGame(150, 0.03, 0.06, rng=RandomStream(6))
+		with PartitionedNamingGame.from_game(network_game, 3, processes) as game:
+			assert game.snapshot() == network_game.snapshot()
+			while not game.poll() and game.iteration < 2000:
+				game.run()
+				words = [ word for word_ids in game.inventories() for word in word_ids ]
+				assert game.index.total == len(words)
+				assert game.num_words() == len(set(words))
+			assert game.poll()
+			assert len(set(tuple(word_ids) for word_ids in game.inventories())) == 1
+
+	def test_in_process(self):
+		self.play(False)
+
+	def test_workers(self):
+		self.play(True)
+
+class PartitionedGameFromEdges(unittest.TestCase):
+	def play(self, game):
+		with game:
+			assert game.num_agents() == 120
+			assert game.index.total == sum(map(len, game.inventories()))
+			while not game.poll() and game.iteration < 2000:
+				game.run()
+			assert game.poll()
+
+	def test_edge_list_file(self):
+		graph = small_world(120)
+		with tempfile.TemporaryDirectory() as directory:
+			path = os.path.join(directory, 'edges.txt')
+			with open(path, 'w') as f:
+				formats.write_edgelist(graph, f)
+			game = PartitionedNamingGame(120, partition.EdgeListFile(path), 3, rng=RandomStream(8))
+			assert game.edge_cut == partition.edge_cut(graph, { node: node*3 // 120 for node in graph.nodes })
+			self.play(game)
+
+	def test_inventories_ignore_the_split(self):
+		edges = partition.CSREdges(models.graph.CSRGraph.from_graph(small_world(120)))
+		one = PartitionedNamingGame(120, edges, 1, processes=False, rng=RandomStream(9))
+		four = PartitionedNamingGame(120, edges, 4, rng=RandomStream(9))
+		assert one.snapshot() == four.snapshot()
+		one.close()
+		self.play(four)
+
+	def test_needs_a_part_for_everyone(self):
+		with self.assertRaises(ValueError):
+			PartitionedNamingGame(10, lambda: [], 2, partition.block_partition(9, 2), False)
+
+	def test_only_what_it_supports(self):
+		for method in ('interact', 'sweep', 'settled_word', 'from_agents'):
+			assert not hasattr(PartitionedNamingGame, method)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,97 @@
+from .context import models
+rng = models.rng
+schedulers = models.schedulers
+snapshot = models.snapshot
+import os
+import random
+import tempfile
+import unittest
+
+class RandomStreamsAreIndependent(unittest.TestCase):
+	def test_seeded_streams_repeat(self):
+		a, b = rng.RandomStream(3), rng.RandomStream(3)
+		assert [ a.random() for i in range(5) ] == [ b.random() for i in range(5) ]
+
+	def test_spawn_depends_on_key_not_use(self):
+		a, b = rng.RandomStream(3), rng.RandomStream(3)
+		a.random()
+		assert a.spawn(1).random() == b.spawn(1).random()
+		assert a.spawn(1).random() != a.spawn(2).random()
+		assert a.spawn(1).origin != a.origin
+
+	def test_default_is_the_random_module(self):
+		assert rng.stream() is rng.stream(None)
+		random.seed(4)
+		x = random.random()
+		random.seed(4)
+		assert rng.stream().random() == x
+
+	def test_bulk_draws(self):
+		stream = rng.RandomStream(5)
+		indices = rng.indices(stream, 7, 1000)
+		assert len(indices) == 1000
+		assert set(indices) == set(range(7))
+		uniforms = rng.uniforms(stream, 100)
+		assert all(0.0 <= u < 1.0 for u in uniforms)
+
+class GamesPlayOnTheirOwnStreams(unittest.TestCase):
+	def play(self, make, rounds=5):
+		game = make(rng.RandomStream(11))
+		for i in range(rounds):
+			# draws from the random module mustn't affect the game
+			random.random()
+			game.run()
+		return [ sorted(words) for words in game.snapshot() ]
+
+	def check(self, make):
+		random.seed(1)
+		first = self.play(make)
+		random.seed(2)
+		assert self.play(make) == first
+
+	def test_naming_game(self):
+		self.check(lambda stream: models.NamingGame(20, rng=stream))
+
+	def test_vector_naming_game(self):
+		self.check(lambda stream: models.VectorNamingGame(20, rng=stream))
+
+	def test_network_naming_game(self):
+		self.check(lambda stream: models.NetworkNamingGame(20, 0.1, 0.3, rng=stream))
+
+	def test_schedulers(self):
+		self.check(lambda stream: models.NamingGame(20, schedulers.SequentialRandom(focus=True), rng=stream))
+		self.check(lambda stream: models.NetworkNamingGame(20, 0.1, 0.3, schedulers.ContinuousTime(), rng=stream))
+
+	def test_network_rendering_leaves_global_stream(self):
+		game = models.NetworkNamingGame(20, 0.1, 0.2, rng=rng.RandomStream(12))
+		random.seed(3)
+		str(game.network)
+		x = random.random()
+		random.seed(3)
+		assert random.random() == x
+
+	def test_draws_take_an_rng(self):
+		population = models.AgentPopulation([ [ 1, 2, 3 ], [ 4 ] ])
+		words = [ population.random_word(0, rng=rng.RandomStream(i)) for i in range(5) ]
+		assert words == [ population.random_word(0, rng=rng.RandomStream(i)) for i in range(5) ]
+		population[0].tell(population[1], rng=rng.RandomStream(0))
+		assert population.words(1) == [ 4, words[0] ]
+		csr = models.graph.Graph.random_graph(range(10), 20, rng=rng.RandomStream(1)).freeze()
+		assert csr.random_neighbor(0, rng=rng.RandomStream(2)) == csr.random_neighbor(0, rng=rng.RandomStream(2))
+
+	def test_snapshot_resumes_stream(self):
+		handle, path = tempfile.mkstemp(suffix='.ngsnap')
+		os.close(handle)
+		try:
+			game = models.NetworkNamingGame(20, 0.1, 0.3, rng=rng.RandomStream(12))
+			game.run()
+			snapshot.save(game, path)
+			restored = snapshot.load(path, rng=rng.RandomStream(0))
+			game.run()
+			restored.run()
+			assert restored.snapshot() == game.snapshot()
+		finally:
+			os.remove(path)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,93 @@
+from .context import models
+schedulers = models.schedulers
+NamingGame = models.NamingGame
+VectorNamingGame = models.VectorNamingGame
+NetworkNamingGame = models.NetworkNamingGame
+import random
+import statistics
+import unittest
+
+def converge(game, max_iterations=10000):
+	while not game.poll() and game.iteration < max_iterations:
+		game.run()
+	assert game.poll()
+	return game.iteration
+
+class SchedulersReachConsensus(unittest.TestCase):
+	def test_default_is_synchronous_sweep(self):
+		game = NamingGame(5)
+		assert isinstance(game.scheduler, schedulers.SynchronousSweep)
+
+	def test_sequential_random(self):
+		random.seed(15)
+		converge(NamingGame(15, schedulers.SequentialRandom()))
+		converge(NetworkNamingGame(15, 0.2, 0.3, schedulers.SequentialRandom()))
+
+	def test_continuous_time(self):
+		random.seed(16)
+		converge(VectorNamingGame(15, schedulers.ContinuousTime()))
+
+	def test_continuous_time_rates(self):
+		random.seed(17)
+		game = NamingGame(10, schedulers.ContinuousTime(rates=lambda i: 0.0))
+		before = game.snapshot()
+		game.run()
+		assert game.snapshot() == before
+		assert game.iteration == 1
+
+	def test_focused_sampling(self):
+		random.seed(18)
+		converge(NamingGame(15, schedulers.SequentialRandom(focus=True)))
+		converge(VectorNamingGame(15, schedulers.SequentialRandom(focus=True)))
+
+	def test_focused_sampling_needs_uniform_hearers(self):
+		game = NetworkNamingGame(5, 0.5, 0.5, schedulers.SequentialRandom(focus=True))
+		with self.assertRaises(ValueError):
+			game.run()
+
+	def test_schedulers_must_run(self):
+		class Idle(schedulers.Scheduler):
+			pass
+
+		with self.assertRaises(TypeError):
+			Idle()
+
+	def test_focused_sampling_matches_sequential_random(self):
+		# skipping no-op interactions shouldn't change how long games take
+		def mean_time(focus):
+			times = list()
+			for seed in range(30):
+				random.seed(seed)
+				game = NamingGame(12, schedulers.SequentialRandom(focus=focus))
+				times.append(converge(game))
+			return statistics.mean(times)
+		plain = mean_time(False)
+		focused = mean_time(True)
+		assert 0.75 < focused / plain < 1.25
+
+class SettledStateTracksGame(unittest.TestCase):
+	def test_state_matches_game(self):
+		random.seed(19)
+		scheduler = schedulers.SequentialRandom(focus=True)
+		game = NamingGame(20, scheduler)
+		while not game.poll():
+			game.run()
+			state = scheduler._state
+			assert state.tracks(game)
+			for i in range(20):
+				assert state.state[i] == game.settled_word(i)
+			assert state.squares == sum(c*c for c in state.count.values())
+			assert len(state.active) + sum(state.count.values()) == 20
+
+	def test_state_rebuilt_after_outside_play(self):
+		scheduler = schedulers.SequentialRandom(focus=True)
+		game = NamingGame(6, scheduler)
+		game.run()
+		first = scheduler._state
+		game.sweep()
+		game.iteration+=1
+		game.run()
+		assert scheduler._state is not first
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,93 @@
+from .context import models
+snapshot = models.snapshot
+schedulers = models.schedulers
+RandomStream = models.rng.RandomStream
+import os
+import random
+import tempfile
+import unittest
+
+class SnapshotsRoundTrip(unittest.TestCase):
+	def setUp(self):
+		handle, self.path = tempfile.mkstemp(suffix='.ngsnap')
+		os.close(handle)
+
+	def tearDown(self):
+		os.remove(self.path)
+
+	def check_resume(self, game, **restore):
+		game.run()
+		snapshot.save(game, self.path)
+		expected = list()
+		for i in range(3):
+			game.run()
+			expected.append(game.snapshot())
+
+		restored = snapshot.load(self.path, **restore)
+		assert type(restored) is type(game)
+		assert type(restored.scheduler) is type(game.scheduler)
+		assert restored.iteration == 1
+		for i in range(3):
+			restored.run()
+			assert restored.snapshot() == expected[i]
+		assert restored.num_words() == game.num_words()
+		return restored
+
+	def test_naming_game(self):
+		random.seed(9)
+		self.check_resume(models.NamingGame(12))
+
+	def test_vector_naming_game(self):
+		random.seed(10)
+		self.check_resume(models.VectorNamingGame(12))
+
+	def test_network_naming_game(self):
+		random.seed(11)
+		game = models.NetworkNamingGame(12, 0.1, 0.3)
+		restored = self.check_resume(game)
+		for i in range(12):
+			assert restored.network.degree(i) == game.network.degree(i)
+
+	def test_schedulers(self):
+		for scheduler in (
+			schedulers.SequentialRandom(),
+			schedulers.SequentialRandom(focus=True),
+			schedulers.ContinuousTime(),
+		):
+			self.check_resume(models.NamingGame(20, scheduler, RandomStream(1)))
+		self.check_resume(models.NetworkNamingGame(15, 0.1, 0.3, schedulers.ContinuousTime(), rng=RandomStream(2)))
+
+	def test_scheduler_settings_that_cant_be_saved(self):
+		rates = lambda i: 1.0 + i % 2
+		snapshot.save(models.NamingGame(10, schedulers.ContinuousTime(rates), RandomStream(3)), self.path)
+		with self.assertRaises(ValueError):
+			snapshot.load(self.path)
+		self.check_resume(models.NamingGame(10, schedulers.ContinuousTime(rates), RandomStream(3)), scheduler=schedulers.ContinuousTime(rates))
+
+	def test_leaves_the_random_module_alone(self):
+		snapshot.save(models.NamingGame(10, rng=RandomStream(4)), self.path)
+		state = random.getstate()
+		game = snapshot.load(self.path)
+		game.run()
+		assert random.getstate() == state
+
+	def test_inspect_without_restoring(self):
+		random.seed(12)
+		game = models.NetworkNamingGame(8, 0.2, 0.2)
+		snapshot.save(game, self.path)
+		with snapshot.Snapshot(self.path) as view:
+			assert view.kind == 'NetworkNamingGame'
+			assert view.num_agents == 8
+			assert view.inventory(3) == game.agents[3].word_ids
+			assert sorted(view.neighbors(0)) == sorted(
+				game.agents.index(agent) for agent in game.network._graph.adjacent_nodes(game.agents[0])
+			)
+
+	def test_rejects_other_files(self):
+		with open(self.path, 'wb') as f:
+			f.write(b'not a snapshot at all')
+		with self.assertRaises(ValueError):
+			snapshot.Snapshot(self.path)
+
+if __name__ == '__main__':
+	unittest.main()
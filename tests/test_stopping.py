@@ -0,0 +1,115 @@
+from .context import models
+NamingGame = models.NamingGame
+NetworkNamingGame = models.NetworkNamingGame
+Observation = models.Observation
+RandomStream = models.rng.RandomStream
+stopping = models.stopping
+ensemble = models.ensemble
+sweep = models.sweep
+import shutil
+import tempfile
+import unittest
+
+class CriteriaStopGames(unittest.TestCase):
+	def test_dominance(self):
+		game = NamingGame(100, rng=RandomStream(1))
+		observations = list(game.observe(interval=1000, until=stopping.Dominance(0.8)))
+		assert observations[-1].dominant_share >= 0.8
+		assert observations[-1].iteration == game.iteration
+		assert not game.poll()
+		# every iteration is checked, whatever the interval
+		assert len(observations) == 2
+
+	def test_distinct_words_and_budget(self):
+		game = NetworkNamingGame(80, 0.05, 0.1, rng=RandomStream(2))
+		observations = list(game.observe(until=[ stopping.DistinctWords(20), stopping.Budget(1000) ]))
+		assert observations[-1].num_words <= 20
+		assert all(o.num_words > 20 for o in observations[:-1])
+
+		game = NamingGame(50, rng=RandomStream(3))
+		assert [ o.iteration for o in game.observe(until=stopping.Budget(3)) ] == [ 0, 1, 2, 3 ]
+		assert [ o.iteration for o in game.observe(until=stopping.Budget(3)) ] == [ 3 ]
+
+	def test_plateau(self):
+		plateau = stopping.Plateau(3, tolerance=0.01)
+		fired = [
+			plateau(Observation(i, words, 0, share))
+			for i, (words, share) in enumerate([ (9, 0.1), (8, 0.1), (8, 0.105), (8, 0.11), (8, 0.1), (8, 0.1), (7, 0.1) ])
+		]
+		assert fired == [ False, False, False, False, True, True, False ]
+		plateau.reset()
+		assert not plateau(Observation(10, 8, 0, 0.1))
+
+	def test_any_of_reports_what_fired(self):
+		until = stopping.criterion([ stopping.Budget(2), stopping.Dominance(0.0) ])
+		game = NamingGame(20, rng=RandomStream(4))
+		assert len(list(game.observe(until=until))) == 1
+		assert until.fired is until.criteria[1]
+		assert repr(until) == 'AnyOf(Budget(2), Dominance(0.0))'
+
+	def test_criteria_repr_their_settings(self):
+		class Quorum(stopping.Criterion):
+			def __init__(self, words, share):
+				self.words = words
+				self.share = share
+
+			def __call__(self, observation):
+				return observation.num_words <= self.words and observation.dominant_share >= self.share
+
+		assert repr(Quorum(2, 0.5)) == 'Quorum(words=2, share=0.5)'
+		assert sweep.result_key([], 1, 10, 'v', Quorum(2, 0.5)) == sweep.result_key([], 1, 10, 'v', Quorum(2, 0.5))
+		with self.assertRaises(TypeError):
+			stopping.Criterion()
+
+	def test_execute_until(self):
+		seen = list()
+		NamingGame(40, rng=RandomStream(5)).execute(seen.append, until=stopping.DistinctWords(5))
+		assert seen[-1].num_words <= 5
+
+class EstimatorPredictsConsensus(unittest.TestCase):
+	def test_estimate_near_actual(self):
+		for seed in range(3):
+			game = NamingGame(300, rng=RandomStream(seed))
+			estimator = stopping.ConsensusEstimator(game.num_agents())
+			for observation in game.observe(until=stopping.Dominance(0.9)):
+				estimator(observation)
+			stopped = game.iteration
+			estimate = estimator.estimate()
+			while not game.poll():
+				game.run()
+			assert stopped < estimate
+			assert 0.5 < (estimate - stopped) / (game.iteration - stopped) < 2
+
+	def test_no_estimate_without_a_trend(self):
+		estimator = stopping.ConsensusEstimator(10)
+		assert estimator.estimate() is None
+		estimator(Observation(0, 5, 20, 0.3))
+		estimator(Observation(1, 5, 20, 0.2))
+		assert estimator.remaining() is None
+		estimator(Observation(2, 1, 10, 1.0))
+		assert estimator.remaining() == 0.0
+
+class EnsemblesStopEarly(unittest.TestCase):
+	def test_replica_prefix(self):
+		config = ensemble.EnsembleConfig(60)
+		full = ensemble.run_replica((config, 0, 7, 10000))
+		early = ensemble.run_replica((config, 0, 7, 10000, stopping.Dominance(0.9)))
+		assert early.stopped and not early.converged and not full.stopped
+		assert early.iterations < full.iterations
+		assert early.word_counts == full.word_counts[:len(early.word_counts)]
+		assert early.estimate > early.iterations
+
+	def test_sweep_keys_on_criterion(self):
+		directory = tempfile.mkdtemp()
+		try:
+			cache = sweep.ResultCache(directory)
+			list(sweep.run_sweep({ 'n': [ 30 ] }, 2, cache, processes=1))
+			results = list(sweep.run_sweep({ 'n': [ 30 ] }, 2, cache, processes=1, until=stopping.Dominance(0.5)))
+			assert cache.hits == 0
+			assert list(sweep.run_sweep({ 'n': [ 30 ] }, 2, cache, processes=1, until=stopping.Dominance(0.5))) == results
+			assert cache.hits == 2
+		finally:
+			shutil.rmtree(directory)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,60 @@
+from .context import models
+ensemble = models.ensemble
+sweep = models.sweep
+import os
+import shutil
+import tempfile
+import unittest
+
+class SweepUsesCache(unittest.TestCase):
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.cache = sweep.ResultCache(self.directory)
+		self.grid = { 'n': [ 5, 6 ], 'min_edge_coeff': [ 0.3 ], 'max_edge_coeff': [ 0.6 ] }
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	def test_expand_grid(self):
+		configs = sweep.expand_grid(self.grid)
+		assert configs == [ ensemble.EnsembleConfig(5, 0.3, 0.6), ensemble.EnsembleConfig(6, 0.3, 0.6) ]
+		assert sweep.expand_grid({ 'n': [ 4 ] }) == [ ensemble.EnsembleConfig(4) ]
+		with self.assertRaises(ValueError):
+			sweep.expand_grid({ 'n': [ 4 ], 'seed': [ 1 ] })
+
+	def test_matches_ensemble(self):
+		configs = sweep.expand_grid(self.grid)
+		expected = list(ensemble.run_ensemble(configs, 2, master_seed=3, processes=1))
+		assert list(sweep.run_sweep(self.grid, 2, self.cache, master_seed=3, processes=1)) == expected
+		assert self.cache.misses == 4
+
+		# the second run is read back entirely, without playing anything
+		assert list(sweep.run_sweep(self.grid, 2, self.cache, master_seed=3, processes=2)) == expected
+		assert self.cache.hits == 4
+
+	def test_only_new_configs_are_played(self):
+		list(sweep.run_sweep({ 'n': [ 5 ] }, 2, self.cache, processes=1))
+		results = list(sweep.run_sweep({ 'n': [ 5, 7 ] }, 2, self.cache, processes=2))
+		assert [ (r.config.n, r.replica) for r in results ] == [ (5, 0), (5, 1), (7, 0), (7, 1) ]
+		assert self.cache.hits == 2
+		assert self.cache.misses == 4
+
+	def test_code_version_is_part_of_the_key(self):
+		list(sweep.run_sweep({ 'n': [ 5 ] }, 1, self.cache, processes=1, version='a'))
+		list(sweep.run_sweep({ 'n': [ 5 ] }, 1, self.cache, processes=1, version='b'))
+		assert self.cache.hits == 0
+		assert len(sweep.code_version()) == 64
+
+	def test_eviction(self):
+		list(sweep.run_sweep({ 'n': [ 5 ] }, 6, self.cache, processes=1))
+		size = self.cache.size
+		small = sweep.ResultCache(self.directory, max_bytes=size // 2)
+		assert small.size == size
+		list(sweep.run_sweep({ 'n': [ 6 ] }, 1, small, processes=1))
+		assert small.size <= size // 2
+		assert small.size == sum(
+			os.path.getsize(os.path.join(self.directory, name)) for name in os.listdir(self.directory)
+		)
+
+if __name__ == '__main__':
+	unittest.main()